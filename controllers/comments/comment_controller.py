@@ -1,49 +1,53 @@
 from fastapi import Request, HTTPException, Depends
-from fastapi.responses import JSONResponse
-from utils.response_schema import response_schema
+from utils.json_response import ORJSONResponse
+from utils.response_schema import response_schema, encoded_response_schema
 from utils.success_message import successfully
 import utils.error_message
 from utils.validator.request_validator import (
-    validate_content, validate_comment_create_request, validate_comment_list_params, validate_comment_modify_params
+    validate_request_body, validate_comment_create_request, validate_comment_list_params, validate_comment_modify_params,
+    check_post_exists, check_comment_exists, check_comment_author
 )
+from utils.validator.request_body import CommentRequest
 from dependencies.auth_dependency import get_current_user
-
-# 댓글 임시 데이터
-comment_model = {
-    "commentId": "1",
-    "postId": "1",
-    "userId": "1",
-    "content": "댓글 내용입니다.",
-    "createdAt": "2026-01-01T00:00:00.000Z",
-    "updatedAt": "2026-01-01T00:00:00.000Z",
-}
+from repositories.posts import post_repository, post_cache
+from repositories.comments import comment_repository
+from utils.cursor import split_page
+from utils.conditional_request import make_etag, validator_headers, is_not_modified, not_modified
+from typing import Optional
+from utils.profiler import profiled
 
 # 댓글 작성
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def create_comment(
     post_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 모든 유효성 검증을 통합 함수로 처리 (400, 422)
-    post_id, content = validate_comment_create_request(post_id, body)
+    post_id, content = validate_comment_create_request(post_id, raw_body)
+
+    # 404 - 존재하지 않는 게시글인 경우
+    check_post_exists(post_repository.find_post_by_id(post_id))
 
     # 인증된 사용자 정보
     user_id = current_user["user_data"]["userId"]
 
     try:
-        # TODO: 실제 DB에 댓글 생성 : 추후 구현
-        return JSONResponse(
+        comment = comment_repository.insert_comment(post_id, user_id, content)
+        # 게시글의 댓글 수가 바뀌므로 게시글 캐시 삭제
+        post_cache.invalidate_post(post_id)
+        return ORJSONResponse(
             status_code=201,
             content=response_schema(
                 message=successfully("comment_created"),
                 data={
-                    "commentId": "1",
-                    "postId": post_id,
-                    "userId": user_id,
-                    "content": content,
+                    "commentId": comment["commentId"],
+                    "postId": comment["postId"],
+                    "userId": comment["userId"],
+                    "content": comment["content"],
                 },
             ),
         )
@@ -58,31 +62,53 @@ async def create_comment(
 
 # 댓글 전체 목록 조회
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def read_comments(
     post_id: int,
     offset: int,
     limit: int,
+    request: Request,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     # 모든 유효성 검증을 통합 함수로 처리 (400, 422)
-    post_id, offset, limit = validate_comment_list_params(post_id, offset, limit)
+    # cursor 가 있으면 offset 대신 커서 위치부터 조회
+    post_id, offset, limit, cursor = validate_comment_list_params(post_id, offset, limit, cursor)
+
+    # 404 - 존재하지 않는 게시글인 경우 (댓글 목록 버전과 댓글 수만 먼저 조회)
+    validators = check_post_exists(post_repository.find_post_validators(post_id))
+    headers = validator_headers(
+        make_etag("comments", post_id, validators["commentsVersion"], validators["commentsModifiedAt"]),
+        validators["commentsModifiedAt"],
+    )
 
-    # 404
-    # TODO: 존재하지 않는 게시글인 경우 : 추후 구현
+    # 304 - 클라이언트가 가진 댓글 목록이 최신인 경우 (댓글을 조회하거나 직렬화하지 않음)
+    if is_not_modified(request, headers["ETag"], validators["commentsModifiedAt"]):
+        raise not_modified(headers)
 
     try:
-        # TODO: 실제 DB에서 댓글 목록 조회 : 추후 구현
-        return JSONResponse(
+        # 다음 페이지 존재 여부를 알기 위해 limit + 1 개 조회
+        if cursor is None:
+            comments = comment_repository.find_comments(post_id, offset, limit + 1)
+        else:
+            comments = comment_repository.find_comments_after(post_id, cursor[0], cursor[1], limit + 1)
+        comments, next_cursor = split_page(comments, limit, "commentId")
+        # 트리거로 유지되는 댓글 수 (COUNT(*) 하지 않음)
+        total = validators["commentCount"]
+
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("comments_fetched"),
                 data={
-                    "comments": [comment_model],
-                    "total": 1,
+                    "comments": comments,
+                    "total": total,
                     "offset": offset,
                     "limit": limit,
+                    "nextCursor": next_cursor,
                 },
             ),
+            headers=headers,
         )
     except Exception:
         raise HTTPException(
@@ -95,36 +121,34 @@ async def read_comments(
 
 # 댓글 수정
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def update_comment(
     comment_id: int,
     post_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 모든 유효성 검증을 통합 함수로 처리 (400, 422)
     comment_id, post_id = validate_comment_modify_params(comment_id, post_id)
-    content = validate_content(body.get("content"))
+    content = validate_request_body(CommentRequest, raw_body).content
 
-    # 403
-    # TODO: 본인이 작성한 댓글이 아닌 경우 권한 없음 : 추후 구현
-    # current_user_id = current_user["user_data"]["userId"]
-    # if comment_author_id != current_user_id:
-    #     raise HTTPException(status_code=403, detail=...)
+    # 404 - 존재하지 않는 댓글인 경우
+    comment = check_comment_exists(comment_repository.find_comment_by_id(comment_id), post_id)
 
-    # 404
-    # TODO: 존재하지 않는 댓글인 경우 : 추후 구현
+    # 403 - 본인이 작성한 댓글이 아닌 경우
+    check_comment_author(comment, current_user, "update_comment")
 
     try:
-        # TODO: 실제 DB에서 댓글 수정 : 추후 구현
-        return JSONResponse(
+        comment = comment_repository.update_comment(comment_id, content)
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("comment_updated"),
                 data={
-                    "commentId": comment_id,
-                    "content": content,
+                    "commentId": comment["commentId"],
+                    "content": comment["content"],
                 },
             ),
         )
@@ -139,6 +163,7 @@ async def update_comment(
 
 # 댓글 삭제
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def delete_comment(
     comment_id: int,
     post_id: int,
@@ -147,23 +172,19 @@ async def delete_comment(
     # 모든 유효성 검증을 통합 함수로 처리 (400, 422)
     comment_id, post_id = validate_comment_modify_params(comment_id, post_id)
 
-    # 403
-    # TODO: 본인이 작성한 댓글이 아닌 경우 권한 없음 : 추후 구현
-    # current_user_id = current_user["user_data"]["userId"]
-    # if comment_author_id != current_user_id:
-    #     raise HTTPException(status_code=403, detail=...)
+    # 404 - 존재하지 않는 댓글인 경우
+    comment = check_comment_exists(comment_repository.find_comment_by_id(comment_id), post_id)
 
-    # 404
-    # TODO: 존재하지 않는 댓글인 경우 : 추후 구현
+    # 403 - 본인이 작성한 댓글이 아닌 경우
+    check_comment_author(comment, current_user, "delete_comment")
 
     try:
-        # TODO: 실제 DB에서 댓글 삭제 : 추후 구현
-        return JSONResponse(
+        comment_repository.delete_comment(comment_id)
+        # 게시글의 댓글 수가 바뀌므로 게시글 캐시 삭제
+        post_cache.invalidate_post(post_id)
+        return ORJSONResponse(
             status_code=200,
-            content=response_schema(
-                message=successfully("comment_deleted"),
-                data=None,
-            ),
+            content=encoded_response_schema(successfully("comment_deleted")),
         )
     except Exception:
         raise HTTPException(
@@ -172,4 +193,4 @@ async def delete_comment(
                 message=utils.error_message.internal_server_error,
                 data=None,
             ),
-        )
\ No newline at end of file
+        )
@@ -1,58 +1,48 @@
 from fastapi import Request, HTTPException, Depends
-from fastapi.responses import JSONResponse
-from utils.response_schema import response_schema
+from utils.json_response import ORJSONResponse
+from utils.response_schema import response_schema, encoded_response_schema
 from utils.success_message import successfully
 import utils.error_message
-from utils.validator.request_validator import validate_title, validate_content, validate_post_image_url, validate_post_id, validate_offset, validate_limit
+from utils.validator.request_validator import (
+    validate_request_body, validate_post_id, validate_offset, validate_limit,
+    validate_cursor, check_post_exists, check_post_author, check_not_liked, check_liked
+)
+from utils.validator.request_body import PostRequest
 from dependencies.auth_dependency import get_current_user
-
-# 게시글 임시 데이터
-post_model = {
-    "postId": "1",
-    "userId": "1",
-    "title": "테스트 게시글",
-    "content": "게시글 내용입니다.",
-    "postImageUrl": "https://example.com/image.jpg",
-    "likeCount": 10,
-    "commentCount": 5,
-    "viewCount": 100,
-    "createdAt": "2026-01-01T00:00:00.000Z",
-    "updatedAt": "2026-01-01T00:00:00.000Z",
-}
+from repositories.posts import post_repository, post_cache, post_counters, post_likes
+from utils.cursor import split_page
+from utils.conditional_request import make_etag, validator_headers, is_not_modified, not_modified
+from typing import Optional
+from utils.profiler import profiled
 
 # 게시글 작성
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def create_post(
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
-
-    # 400, 422 - title 검증
-    title = validate_title(body.get("title"))
-
-    # 400, 422 - content 검증
-    content = validate_content(body.get("content"))
-
-    # 400, 422 - postImageUrl 검증 (선택적)
-    post_image_url = body.get("postImageUrl")
-    if post_image_url is not None:
-        post_image_url = validate_post_image_url(post_image_url)
+    # 400, 422 - title, content, postImageUrl(선택적) 검증
+    body = validate_request_body(PostRequest, await request.body())
+    title = body.title
+    content = body.content
+    post_image_url = body.postImageUrl
 
     # 인증된 사용자 정보
     user_id = current_user["user_data"]["userId"]
 
     try:
-        # TODO: 실제 DB에 게시글 생성 : 추후 구현
-        return JSONResponse(
+        post = post_repository.insert_post(user_id, title, content, post_image_url)
+        post_cache.invalidate_offset_pages()
+        return ORJSONResponse(
             status_code=201,
             content=response_schema(
                 message=successfully("post_created"),
                 data={
-                    "postId": "1",
-                    "userId": user_id,
-                    "title": title,
-                    "content": content,
+                    "postId": post["postId"],
+                    "userId": post["userId"],
+                    "title": post["title"],
+                    "content": post["content"],
                 },
             ),
         )
@@ -67,9 +57,11 @@ async def create_post(
 
 # 게시글 전체 목록 조회
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def read_posts(
     offset: int,
     limit: int,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     # 400, 422 - offset 검증
@@ -78,17 +70,32 @@ async def read_posts(
     # 400, 422 - limit 검증
     limit = validate_limit(limit)
 
+    # 400, 422 - cursor 검증 (선택적, 있으면 offset 대신 커서 위치부터 조회)
+    if cursor is not None:
+        cursor = validate_cursor(cursor)
+
     try:
-        # TODO: 실제 DB에서 게시글 목록 조회 : 추후 구현
-        return JSONResponse(
+        # 다음 페이지 존재 여부를 알기 위해 limit + 1 개 조회
+        if cursor is None:
+            posts = post_cache.find_posts(offset, limit + 1)
+        else:
+            posts = post_cache.find_posts_after(cursor[0], cursor[1], limit + 1)
+        posts, next_cursor = split_page(posts, limit, "postId")
+        # 아직 DB 에 반영하지 않은 조회수/좋아요 수 증가분을 더하고, 페이지 전체의 likedByMe 를 한 번에 확인
+        posts = [post_counters.merge_counts(post) for post in posts]
+        posts = post_likes.mark_liked_by_me(posts, int(current_user["user_data"]["userId"]))
+        total = post_repository.count_posts()
+
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("posts_fetched"),
                 data={
-                    "posts": [post_model],
-                    "total": 1,
+                    "posts": posts,
+                    "total": total,
                     "offset": offset,
                     "limit": limit,
+                    "nextCursor": next_cursor,
                 },
             ),
         )
@@ -103,21 +110,43 @@ async def read_posts(
 
 # 게시글 상세 조회
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def read_post(
     post_id: int,
+    request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     # post_id 검증 (400, 422)
     post_id = validate_post_id(post_id)
 
+    # 404 - 존재하지 않는 게시글인 경우 (버전만 먼저 조회)
+    validators = check_post_exists(post_repository.find_post_validators(post_id))
+    # likedByMe 는 사용자마다 다르므로 ETag 에도 포함
+    liked_by_me = post_likes.is_liked(post_id, int(current_user["user_data"]["userId"]))
+    headers = validator_headers(
+        make_etag("post", post_id, validators["version"], validators["modifiedAt"], "liked" if liked_by_me else None),
+        validators["modifiedAt"],
+    )
+
+    # 304 - 클라이언트가 가진 게시글이 최신인 경우 (게시글 본문을 읽거나 직렬화하지 않음, 조회수는 증가)
+    # 아직 DB 에 반영하지 않은 좋아요 수 변경이 있으면 버전이 바뀌기 전이므로 본문을 다시 보냄
+    if not post_counters.has_pending_likes(post_id) and is_not_modified(request, headers["ETag"], validators["modifiedAt"]):
+        post_counters.add_view(post_id)
+        raise not_modified(headers)
+
+    post = check_post_exists(post_cache.find_post_by_id(post_id, validators["version"]))
+
     try:
-        # TODO: 실제 DB에서 게시글 조회 : 추후 구현
-        return JSONResponse(
+        # 조회수 증가 (DB 에는 post_counters 가 모아서 반영)
+        post_counters.add_view(post_id)
+
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("post_fetched"),
-                data=post_model,
+                data={**post_counters.merge_counts(post), "likedByMe": liked_by_me},
             ),
+            headers=headers,
         )
     except Exception:
         raise HTTPException(
@@ -130,46 +159,40 @@ async def read_post(
 
 # 게시글 수정
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def update_post(
     post_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 400, 422 - post_id 검증
     post_id = validate_post_id(post_id)
 
-    # 400, 422 - title 검증
-    title = validate_title(body.get("title"))
-
-    # 400, 422 - content 검증
-    content = validate_content(body.get("content"))
-
-    # 400, 422 - postImageUrl 검증 (선택적)
-    post_image_url = body.get("postImageUrl")
-    if post_image_url is not None:
-        post_image_url = validate_post_image_url(post_image_url)
+    # 400, 422 - title, content, postImageUrl(선택적) 검증
+    body = validate_request_body(PostRequest, raw_body)
+    title = body.title
+    content = body.content
+    post_image_url = body.postImageUrl
 
-    # 403
-    # TODO: 본인이 작성한 게시글이 아닌 경우 권한 없음 : 추후 구현
-    # current_user_id = current_user["user_data"]["userId"]
-    # if post_author_id != current_user_id:
-    #     raise HTTPException(status_code=403, detail=...)
+    # 404 - 존재하지 않는 게시글인 경우
+    post = check_post_exists(post_repository.find_post_by_id(post_id))
 
-    # 404
-    # TODO: 존재하지 않는 게시글인 경우 : 추후 구현
+    # 403 - 본인이 작성한 게시글이 아닌 경우
+    check_post_author(post, current_user, "update_post")
 
     try:
-        # TODO: 실제 DB에서 게시글 수정 : 추후 구현
-        return JSONResponse(
+        post = post_repository.update_post(post_id, title, content, post_image_url)
+        post_cache.invalidate_post(post_id)
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("post_updated"),
                 data={
-                    "postId": post_id,
-                    "title": title,
-                    "content": content,
+                    "postId": post["postId"],
+                    "title": post["title"],
+                    "content": post["content"],
                 },
             ),
         )
@@ -184,6 +207,7 @@ async def update_post(
 
 # 게시글 삭제
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def delete_post(
     post_id: int,
     current_user: dict = Depends(get_current_user)
@@ -191,23 +215,20 @@ async def delete_post(
     # post_id 검증 (400, 422)
     post_id = validate_post_id(post_id)
 
-    # 403
-    # TODO: 본인이 작성한 게시글이 아닌 경우 권한 없음 : 추후 구현
-    # current_user_id = current_user["user_data"]["userId"]
-    # if post_author_id != current_user_id:
-    #     raise HTTPException(status_code=403, detail=...)
+    # 404 - 존재하지 않는 게시글인 경우
+    post = check_post_exists(post_repository.find_post_by_id(post_id))
 
-    # 404
-    # TODO: 존재하지 않는 게시글인 경우 : 추후 구현
+    # 403 - 본인이 작성한 게시글이 아닌 경우
+    check_post_author(post, current_user, "delete_post")
 
     try:
-        # TODO: 실제 DB에서 게시글 삭제 : 추후 구현
-        return JSONResponse(
+        post_repository.delete_post(post_id)
+        post_cache.invalidate_post(post_id)
+        post_likes.forget_post(post_id)
+        post_cache.invalidate_offset_pages()
+        return ORJSONResponse(
             status_code=200,
-            content=response_schema(
-                message=successfully("post_deleted"),
-                data=None,
-            ),
+            content=encoded_response_schema(successfully("post_deleted")),
         )
     except Exception:
         raise HTTPException(
@@ -220,6 +241,7 @@ async def delete_post(
 
 # 게시글 좋아요 추가
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def like_post(
     post_id: int,
     current_user: dict = Depends(get_current_user)
@@ -227,19 +249,22 @@ async def like_post(
     # post_id 검증 (400, 422)
     post_id = validate_post_id(post_id)
 
-    # 403
-    # TODO: 이미 좋아요를 누른 경우 : 추후 구현
+    # 404 - 존재하지 않는 게시글인 경우
+    post = check_post_exists(post_repository.find_post_by_id(post_id))
 
-    # 404
-    # TODO: 존재하지 않는 게시글인 경우 : 추후 구현
+    # 403 - 이미 좋아요를 누른 경우
+    user_id = int(current_user["user_data"]["userId"])
+    check_not_liked(post_likes.is_liked(post_id, user_id))
 
     try:
-        # TODO: 실제 DB에서 좋아요 추가 : 추후 구현
-        return JSONResponse(
+        # 좋아요 추가 (DB 와 캐시에는 post_counters 가 모아서 반영)
+        post_likes.like(post_id, user_id)
+        like_count = post_counters.merge_counts(post)["likeCount"]
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("like_added"),
-                data={"postId": post_id, "likeCount": 11},
+                data={"postId": str(post_id), "likeCount": like_count},
             ),
         )
     except Exception:
@@ -253,6 +278,7 @@ async def like_post(
 
 # 게시글 좋아요 제거
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def unlike_post(
     post_id: int,
     current_user: dict = Depends(get_current_user)
@@ -260,19 +286,22 @@ async def unlike_post(
     # post_id 검증 (400, 422)
     post_id = validate_post_id(post_id)
 
-    # 403
-    # TODO: 좋아요를 누르지 않은 경우 : 추후 구현
+    # 404 - 존재하지 않는 게시글인 경우
+    post = check_post_exists(post_repository.find_post_by_id(post_id))
 
-    # 404
-    # TODO: 존재하지 않는 게시글인 경우 : 추후 구현
+    # 403 - 좋아요를 누르지 않은 경우
+    user_id = int(current_user["user_data"]["userId"])
+    check_liked(post_likes.is_liked(post_id, user_id))
 
     try:
-        # TODO: 실제 DB에서 좋아요 제거 : 추후 구현
-        return JSONResponse(
+        # 좋아요 취소 (DB 와 캐시에는 post_counters 가 모아서 반영)
+        post_likes.unlike(post_id, user_id)
+        like_count = post_counters.merge_counts(post)["likeCount"]
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("like_removed"),
-                data={"postId": post_id, "likeCount": 9},
+                data={"postId": str(post_id), "likeCount": like_count},
             ),
         )
     except Exception:
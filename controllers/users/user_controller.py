@@ -1,77 +1,57 @@
 from fastapi import Request, HTTPException, Cookie, Depends
-from fastapi.responses import JSONResponse
-from utils.response_schema import response_schema
+from utils.json_response import ORJSONResponse
+from utils.response_schema import response_schema, encoded_response_schema
 from utils.success_message import successfully
 import utils.error_message
 from utils.validator.request_validator import (
-    validate_email, validate_password, validate_user_id, validate_nickname, validate_profile_image_url,
-    validate_email_not_duplicate, validate_nickname_not_duplicate, check_login_credentials, check_user_permission, check_user_exists
+    validate_request_body, validate_user_id,
+    validate_email_not_duplicate, validate_nickname_not_duplicate, check_login_credentials, check_user_permission, check_user_exists,
+    check_user_created, check_nickname_updated
+)
+from utils.validator.request_body import (
+    SignupRequest, LoginRequest, PasswordRequest, NicknameRequest, ProfileImageUrlRequest, EmailRequest
 )
 from utils.session_store import session_store
-from utils.password import hash_password, verify_password
+from utils.logger import logger
+from utils.password import hash_password_async, verify_password_async, needs_rehash
 from dependencies.auth_dependency import get_current_user
+from repositories.users import user_repository
 from typing import Optional
-
-# 사용자 임시 데이터 (메모리 저장소)
-# 실제로는 DB에 저장되어야 함
-MOCK_USERS = {
-    "test@gmail.com": {
-        "userId": "1",
-        "email": "test@gmail.com",
-        "password": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5jtJ3qKJ3q7EK",  # "password123" 해싱
-        "userNickname": "startup",
-        "profileImageUrl": "http~~~",
-        "isWithdrawn": False,
-        "createdAt": "2026-01-01T00:00:00.000Z",
-        "updatedAt": "2026-01-01T00:00:00.000Z",
-    }
-}
+from utils.profiler import profiled
 
 # 회원가입
 # 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def create_user(request: Request):
-    body = await request.json()
-
-    # 400, 422 - 이메일 검증
-    email = validate_email(body.get("email"))
-
-    # 400, 422 - 비밀번호 검증
-    password = validate_password(body.get("password"))
-
-    # 400, 422 - 닉네임 검증
-    nickname = validate_nickname(body.get("nickname"))
-
-    # 400, 422 - 프로필 이미지 URL 검증 (선택적)
-    profile_image_url = body.get("profileImageUrl")
-    if profile_image_url is not None:
-        profile_image_url = validate_profile_image_url(profile_image_url)
+    # 400, 422 - 이메일, 비밀번호, 닉네임, 프로필 이미지 URL(선택적) 검증
+    body = validate_request_body(SignupRequest, await request.body())
+    email = body.email
+    password = body.password
+    nickname = body.nickname
+    profile_image_url = body.profileImageUrl
 
     # 409 - 이메일 중복 확인
-    validate_email_not_duplicate(email, MOCK_USERS)
+    validate_email_not_duplicate(user_repository.find_user_by_email(email))
 
     # 409 - 닉네임 중복 확인
-    validate_nickname_not_duplicate(nickname, MOCK_USERS)
+    validate_nickname_not_duplicate(user_repository.find_user_by_nickname(nickname))
+
+    # 비밀번호 해싱 (스레드 풀에서 실행, 503 - 대기열 가득 참)
+    hashed_password = await hash_password_async(password)
+
+    # 해싱하는 동안 다른 요청이 같은 이메일/닉네임으로 먼저 가입한 경우 유일 인덱스에서 막힘
+    user = user_repository.insert_user(email, hashed_password, nickname, profile_image_url)
+    if user is None:
+        # 409 - 이메일/닉네임 중복
+        validate_email_not_duplicate(user_repository.find_user_by_email(email))
+        validate_nickname_not_duplicate(user_repository.find_user_by_nickname(nickname))
+    user = check_user_created(user)
 
     try:
-        # 비밀번호 해싱
-        hashed_password = hash_password(password)
-
-        # TODO: 실제 DB에 사용자 생성
-        # 임시로 메모리에 저장
-        user_id = str(len(MOCK_USERS) + 1)
-        MOCK_USERS[email] = {
-            "userId": user_id,
-            "email": email,
-            "password": hashed_password,
-            "userNickname": nickname,
-            "profileImageUrl": profile_image_url,
-            "isWithdrawn": False,
-            "createdAt": "2026-01-21T00:00:00.000Z",
-            "updatedAt": "2026-01-21T00:00:00.000Z",
-        }
+        user_id = user["userId"]
 
         # 세션 생성
-        session_id = session_store.create_session(
+        session_id = await session_store.create_session(
             user_id=email,
             user_data={
                 "userId": user_id,
@@ -81,7 +61,7 @@ async def create_user(request: Request):
         )
 
         # 쿠키에 세션 ID 설정
-        response = JSONResponse(
+        response = ORJSONResponse(
             status_code=201,
             content=response_schema(
                 message=successfully("user_created"),
@@ -105,18 +85,8 @@ async def create_user(request: Request):
             path="/",
         )
 
-        # 쿠키 정보 로그 출력
-        print(f"\n{'='*80}", flush=True)
-        print(f"[쿠키 설정] 회원가입 성공 - FE로 전송할 쿠키 데이터:", flush=True)
-        print(f"  - key: session_id", flush=True)
-        print(f"  - value: {session_id}", flush=True)
-        print(f"  - httponly: False (JavaScript 접근 가능)", flush=True)
-        print(f"  - domain: None (현재 도메인만)", flush=True)
-        print(f"  - secure: False (HTTP 허용)", flush=True)
-        print(f"  - samesite: lax (CSRF 보호)", flush=True)
-        print(f"  - max_age: 86400초 (24시간)", flush=True)
-        print(f"  - path: / (모든 경로)", flush=True)
-        print(f"{'='*80}\n", flush=True)
+        # 세션 발급 로그 (세션 ID 는 남기지 않음)
+        logger.info("session_issued", action="signup", userId=user_id)
 
         return response
     except Exception:
@@ -130,21 +100,26 @@ async def create_user(request: Request):
 
 # 회원 로그인
 # 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def login_user(request: Request):
-    body = await request.json()
-
-    # 400, 422 - 이메일 검증
-    email = validate_email(body.get("email"))
-
-    # 400, 422 - 비밀번호 검증
-    password = validate_password(body.get("password"))
+    # 400, 422 - 이메일, 비밀번호 검증
+    body = validate_request_body(LoginRequest, await request.body())
+    email = body.email
+    password = body.password
 
     # 401 - 사용자 인증 확인 (validator로 이동)
-    user = check_login_credentials(email, password, MOCK_USERS, verify_password)
+    user = await check_login_credentials(user_repository.find_user_by_email(email), password, verify_password_async)
+
+    # 해싱 설정(알고리즘/비용)이 바뀐 경우 로그인 성공 시 새 설정으로 다시 해싱
+    if needs_rehash(user["password"]):
+        try:
+            user_repository.update_password(int(user["userId"]), await hash_password_async(password))
+        except HTTPException: # 503 - 해싱 대기열이 가득 찬 경우 다음 로그인 때 다시 시도
+            pass
 
     try:
         # 세션 생성
-        session_id = session_store.create_session(
+        session_id = await session_store.create_session(
             user_id=email,
             user_data={
                 "userId": user["userId"],
@@ -154,7 +129,7 @@ async def login_user(request: Request):
         )
 
         # 쿠키에 세션 ID 설정
-        response = JSONResponse(
+        response = ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("logged_in"),
@@ -178,18 +153,8 @@ async def login_user(request: Request):
             path="/",
         )
 
-        # 쿠키 정보 로그 출력
-        print(f"\n{'='*80}", flush=True)
-        print(f"[쿠키 설정] 로그인 성공 - FE로 전송할 쿠키 데이터:", flush=True)
-        print(f"  - key: session_id", flush=True)
-        print(f"  - value: {session_id}", flush=True)
-        print(f"  - httponly: False (JavaScript 접근 가능)", flush=True)
-        print(f"  - domain: None (현재 도메인만)", flush=True)
-        print(f"  - secure: False (HTTP 허용)", flush=True)
-        print(f"  - samesite: lax (CSRF 보호)", flush=True)
-        print(f"  - max_age: 86400초 (24시간)", flush=True)
-        print(f"  - path: / (모든 경로)", flush=True)
-        print(f"{'='*80}\n", flush=True)
+        # 세션 발급 로그 (세션 ID 는 남기지 않음)
+        logger.info("session_issued", action="login", userId=user["userId"])
 
         return response
     except Exception:
@@ -203,17 +168,15 @@ async def login_user(request: Request):
 
 # 회원 로그아웃
 # 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def logout_user(session_id: Optional[str] = Cookie(None)):
     # 세션 삭제
     if session_id:
-        session_store.delete_session(session_id)
+        await session_store.delete_session(session_id)
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=200,
-        content=response_schema(
-            message=successfully("logged_out"),
-            data=None,
-        ),
+        content=encoded_response_schema(successfully("logged_out")),
     )
 
     # 쿠키 삭제
@@ -223,6 +186,7 @@ async def logout_user(session_id: Optional[str] = Cookie(None)):
 
 # 회원 탈퇴
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def delete_user(
     user_id: int,
     current_user: dict = Depends(get_current_user),
@@ -235,22 +199,15 @@ async def delete_user(
     check_user_permission(user_id, current_user)
 
     try:
-        # TODO: 실제 DB에서 사용자 삭제 또는 탈퇴 처리
-        # 임시로 MOCK_USERS에서 삭제
-        email = current_user["user_id"]
-        if email in MOCK_USERS:
-            del MOCK_USERS[email]
+        user_repository.delete_user(user_id)
 
         # 세션 삭제
         if session_id:
-            session_store.delete_session(session_id)
+            await session_store.delete_session(session_id)
 
-        response = JSONResponse(
+        response = ORJSONResponse(
             status_code=200,
-            content=response_schema(
-                message=successfully("account_deleted"),
-                data=None,
-            ),
+            content=encoded_response_schema(successfully("account_deleted")),
         )
 
         # 쿠키 삭제
@@ -268,6 +225,7 @@ async def delete_user(
 
 # 회원 정보 조회
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def read_user(
     user_id: int,
     current_user: dict = Depends(get_current_user)
@@ -278,14 +236,11 @@ async def read_user(
     # 403 - 본인 확인 (validator로 이동)
     check_user_permission(user_id, current_user)
 
-    try:
-        # TODO: 실제 DB에서 사용자 정보 조회
-        email = current_user["user_id"]
-
-        # 404 - 사용자 존재 여부 확인 (validator로 이동)
-        user = check_user_exists(email, MOCK_USERS)
+    # 404 - 사용자 존재 여부 확인 (validator로 이동)
+    user = check_user_exists(user_repository.find_user_by_id(user_id))
 
-        return JSONResponse(
+    try:
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("user_fetched"),
@@ -311,39 +266,35 @@ async def read_user(
 
 # 회원 정보 수정(비밀번호)
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def update_user_password(
     user_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 400, 422 - user_id 검증
     user_id = validate_user_id(user_id)
 
     # 400, 422 - 새 비밀번호 검증
-    password = validate_password(body.get("password"))
+    password = validate_request_body(PasswordRequest, raw_body).password
 
     # 403 - 본인 확인 (validator로 이동)
     check_user_permission(user_id, current_user)
 
-    try:
-        # TODO: 실제 DB에서 비밀번호 업데이트
-        email = current_user["user_id"]
+    # 비밀번호 해싱 (스레드 풀에서 실행, 503 - 대기열 가득 참)
+    hashed_password = await hash_password_async(password)
 
-        # 404 - 사용자 존재 여부 확인 (validator로 이동)
-        user = check_user_exists(email, MOCK_USERS)
+    # 404 - 사용자 존재 여부 확인 (validator로 이동)
+    check_user_exists(user_repository.find_user_by_id(user_id))
 
-        # 비밀번호 해싱
-        hashed_password = hash_password(password)
-        MOCK_USERS[email]["password"] = hashed_password
+    try:
+        user_repository.update_password(user_id, hashed_password)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content=response_schema(
-                message=successfully("password_updated"),
-                data=None,
-            ),
+            content=encoded_response_schema(successfully("password_updated")),
         )
     except Exception:
         raise HTTPException(
@@ -356,38 +307,31 @@ async def update_user_password(
 
 # 회원 정보 수정(닉네임)
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def update_user_nickname(
     user_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 400, 422 - user_id 검증
     user_id = validate_user_id(user_id)
 
     # 400, 422 - 닉네임 검증
-    nickname = validate_nickname(body.get("nickname"))
+    nickname = validate_request_body(NicknameRequest, raw_body).nickname
 
     # 403 - 본인 확인 (validator로 이동)
     check_user_permission(user_id, current_user)
 
-    try:
-        # TODO: 실제 DB에서 닉네임 업데이트
-        email = current_user["user_id"]
-
-        # 404 - 사용자 존재 여부 확인 (validator로 이동)
-        user = check_user_exists(email, MOCK_USERS)
+    # 409 - 닉네임 중복 확인 (본인 닉네임은 제외)
+    validate_nickname_not_duplicate(user_repository.find_user_by_nickname(nickname), str(user_id))
 
-        MOCK_USERS[email]["userNickname"] = nickname
+    # 404 - 사용자 존재 여부 확인 (validator로 이동)
+    check_user_exists(user_repository.find_user_by_id(user_id))
 
-        return JSONResponse(
-            status_code=200,
-            content=response_schema(
-                message=successfully("nickname_updated"),
-                data=None,
-            ),
-        )
+    try:
+        updated = user_repository.update_nickname(user_id, nickname)
     except Exception:
         raise HTTPException(
             status_code=500,
@@ -397,41 +341,42 @@ async def update_user_nickname(
             ),
         )
 
+    # 409 - 중복 확인 이후 다른 요청이 같은 닉네임으로 먼저 바꾼 경우 (유일 인덱스에서 막힘)
+    check_nickname_updated(updated)
+
+    return ORJSONResponse(
+        status_code=200,
+        content=encoded_response_schema(successfully("nickname_updated")),
+    )
+
 # 회원 정보 수정(프로필 이미지 URL)
 # 401, 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def update_user_profile_image_url(
     user_id: int,
     request: Request,
     current_user: dict = Depends(get_current_user)
 ):
-    body = await request.json()
+    raw_body = await request.body()
 
     # 400, 422 - user_id 검증
     user_id = validate_user_id(user_id)
 
     # 400, 422 - 프로필 이미지 URL 검증 (선택적)
-    profile_image_url = body.get("profileImageUrl")
-    if profile_image_url is not None:
-        profile_image_url = validate_profile_image_url(profile_image_url)
+    profile_image_url = validate_request_body(ProfileImageUrlRequest, raw_body).profileImageUrl
 
     # 403 - 본인 확인 (validator로 이동)
     check_user_permission(user_id, current_user)
 
-    try:
-        # TODO: 실제 DB에서 프로필 이미지 URL 업데이트
-        email = current_user["user_id"]
-
-        # 404 - 사용자 존재 여부 확인 (validator로 이동)
-        user = check_user_exists(email, MOCK_USERS)
+    # 404 - 사용자 존재 여부 확인 (validator로 이동)
+    check_user_exists(user_repository.find_user_by_id(user_id))
 
-        MOCK_USERS[email]["profileImageUrl"] = profile_image_url
+    try:
+        user_repository.update_profile_image_url(user_id, profile_image_url)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content=response_schema(
-                message=successfully("profile_image_url_updated"),
-                data=None,
-            ),
+            content=encoded_response_schema(successfully("profile_image_url_updated")),
         )
     except Exception:
         raise HTTPException(
@@ -444,16 +389,15 @@ async def update_user_profile_image_url(
 
 # 회원 이메일 중복 확인
 # 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def check_email_duplicate(request: Request):
-    body = await request.json()
-
     # 400, 422 - 이메일 검증
-    email = validate_email(body.get("email"))
+    email = validate_request_body(EmailRequest, await request.body()).email
 
     try:
         # 이메일 중복 확인
-        is_available = email not in MOCK_USERS
-        return JSONResponse(
+        is_available = not user_repository.exists_email(email)
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("email_checked"),
@@ -473,18 +417,14 @@ async def check_email_duplicate(request: Request):
 
 # 회원 닉네임 중복 확인
 # 405, 429 검증은 라우터의 Depends에서 처리
+@profiled
 async def check_nickname_duplicate(request: Request):
-    body = await request.json()
-
     # 400, 422 - 닉네임 검증
-    nickname = validate_nickname(body.get("nickname"))
+    nickname = validate_request_body(NicknameRequest, await request.body()).nickname
 
     try:
-        is_available = not any(
-            user["userNickname"] == nickname
-            for user in MOCK_USERS.values()
-        )
-        return JSONResponse(
+        is_available = not user_repository.exists_nickname(nickname)
+        return ORJSONResponse(
             status_code=200,
             content=response_schema(
                 message=successfully("nickname_checked"),
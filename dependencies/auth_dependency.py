@@ -1,12 +1,14 @@
-from fastapi import Cookie, HTTPException
+from fastapi import Cookie, HTTPException, Request
 from typing import Optional
 from utils.session_store import session_store
 from utils.response_schema import response_schema
 import utils.error_message
+from utils.profiler import profiled
 
 
 # 쿠키에서 세션 ID를 읽어 사용자 정보 반환
-async def get_current_user(session_id: Optional[str] = Cookie(None)):
+@profiled
+async def get_current_user(request: Request, session_id: Optional[str] = Cookie(None)):
     """쿠키 기반 인증 - 세션 ID로 사용자 정보 조회"""
 
     # 세션 ID가 없는 경우
@@ -19,8 +21,10 @@ async def get_current_user(session_id: Optional[str] = Cookie(None)):
             ),
         )
 
-    # 세션 조회
-    session = session_store.get_session(session_id)
+    # 세션 조회 (rate_limiter 에서 이미 조회한 경우 재사용)
+    session = getattr(request.state, "session", None)
+    if session is None:
+        session = await session_store.get_session(session_id)
 
     # 유효하지 않은 세션
     if not session:
@@ -1,37 +1,88 @@
 from fastapi import Request, HTTPException
 from utils.response_schema import response_schema
+from utils.rate_limit_store import create_rate_limiter, RateLimitResult
+from utils.session_store import session_store
+from utils.route_table import RouteTable
+import math
 import utils.error_message
 import utils.constants
-from datetime import datetime, timedelta
-from collections import defaultdict
+import utils.metrics
+from utils.profiler import profiled
 
-# defaultdict : 없는 키에 접근할 때 자동으로 기본값을 생성해주는 딕셔너리
-request_counts = defaultdict(list)
+# 정책이 없는 경로에 적용하는 기본 요청 제한기
+# 시간 윈도우(REQUESTS_TIME_WINDOW_SECONDS) 동안 최대 REQUESTS_MAX_COUNT 번 요청 가능
+default_limiter = create_rate_limiter(
+    name="default",
+    limit=utils.constants.REQUESTS_MAX_COUNT,
+    window_seconds=utils.constants.REQUESTS_TIME_WINDOW_SECONDS,
+    burst=utils.constants.REQUESTS_BURST_COUNT,
+)
 
 
+# 경로별 요청 제한기 (RATE_LIMIT_POLICIES 로 미리 생성)
+route_limiters = RouteTable({
+    (method, path): create_rate_limiter(
+        name=f"{method}:{path}",
+        limit=limit,
+        window_seconds=window_seconds,
+        burst=burst,
+    )
+    for (method, path), (limit, window_seconds, burst) in utils.constants.RATE_LIMIT_POLICIES.items()
+})
+
+
+def _find_limiter(method: str, path: str):
+    """요청 메서드/경로에 맞는 요청 제한기 (정책이 없으면 기본 제한기)"""
+    return route_limiters.find(method, path, default_limiter)
+
+
+def _rate_limit_headers(result: RateLimitResult) -> dict:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(math.ceil(result.reset_after)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after), 1))
+    return headers
+
+
+async def _get_principal(request: Request) -> str:
+    """요청 주체 - 로그인한 사용자는 userId, 아니면 IP"""
+    session_id = request.cookies.get("session_id")
+    if session_id:
+        session = await session_store.get_session(session_id)
+        if session:
+            # 인증 의존성(get_current_user)에서 다시 조회하지 않도록 저장
+            request.state.session = session
+            return f"user:{session['user_data']['userId']}"
+
+    return f"ip:{request.client.host}"
+
+
+@profiled
 async def rate_limiter(request: Request):
     # OPTIONS 메서드는 CORS preflight 요청이므로 rate limiting 건너뛰기
     if request.method == "OPTIONS":
         return
 
-    client_ip = request.client.host
-    now = datetime.now()
+    # 요청 경로에 맞는 정책 조회
+    limiter = _find_limiter(request.method, request.scope["path"])
 
-    # 기록 정리 (시간 윈도우 밖의 요청 제거)
-    request_counts[client_ip] = [
-        req_time for req_time in request_counts[client_ip]
-        if now - req_time < timedelta(seconds=utils.constants.REQUESTS_TIME_WINDOW_SECONDS)
-    ]
+    result = await limiter.try_acquire(await _get_principal(request))
+    headers = _rate_limit_headers(result)
 
     # 요청 횟수 확인
-    if len(request_counts[client_ip]) >= utils.constants.REQUESTS_MAX_COUNT:  # 429 - 요청 횟수 초과
+    if not result.allowed:  # 429 - 요청 횟수 초과
+        utils.metrics.rate_limit_rejections_total.inc(request.method, utils.metrics.route_label(request.scope))
         raise HTTPException(
             status_code=429,
             detail=response_schema(
                 message=utils.error_message.rate_limit_exceeded,
                 data=None,
             ),
+            headers=headers,
         )
 
-    # 현재 요청 기록 추가
-    request_counts[client_ip].append(now)
\ No newline at end of file
+    # 성공 응답에도 헤더를 붙이도록 저장 (RateLimitHeaderMiddleware 에서 응답에 추가)
+    request.state.rate_limit_headers = headers
@@ -1,9 +1,73 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 from routes import api_router
+from utils.session_store import session_store
+from repositories.users import user_repository
+from repositories.database import close_connection
+from repositories.posts import post_counters, comment_counts
+import utils.rate_limit_store
+from utils.logger import logger
+from middlewares.logging_middleware import LoggingMiddleware
+from middlewares.request_id_middleware import RequestIdMiddleware
+from middlewares.timing_middleware import TimingMiddleware
+from middlewares.rate_limit_header_middleware import RateLimitHeaderMiddleware
+from middlewares.metrics_middleware import MetricsMiddleware
+from middlewares.profiler_middleware import ProfilerMiddleware
+from middlewares.body_size_limit_middleware import BodySizeLimitMiddleware
+import utils.metrics
+import utils.profiler
+from utils.json_response import ORJSONResponse, http_exception_handler
+from starlette.exceptions import HTTPException
 
-app = FastAPI()
+
+# 앱 시작/종료 시 실행할 작업
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 이메일/닉네임 사용 가능 여부 확인용 필터 생성
+    user_repository.build_filters()
+    # 다른 워커의 가입/닉네임 변경 확인 백그라운드 작업 시작
+    user_filter_refresh_task = asyncio.create_task(user_repository.run_filter_refresh_loop())
+    # 만료 세션 정리 백그라운드 작업 시작
+    session_cleanup_task = asyncio.create_task(session_store.run_cleanup_loop())
+    # 요청 제한 카운터 동기화 백그라운드 작업 시작 (redis 사용 시)
+    rate_limit_sync_task = asyncio.create_task(utils.rate_limit_store.run_sync_loop())
+    # 게시글 조회수/좋아요 수 증가분 반영 백그라운드 작업 시작
+    post_counter_flush_task = asyncio.create_task(post_counters.run_flush_loop())
+    # 게시글 댓글 수 점검 백그라운드 작업 시작 (시작 시 한 번 바로 실행)
+    comment_count_reconcile_task = asyncio.create_task(comment_counts.run_reconcile_loop())
+
+    yield
+
+    background_tasks = [
+        session_cleanup_task,
+        user_filter_refresh_task,
+        rate_limit_sync_task,
+        post_counter_flush_task,
+        comment_count_reconcile_task,
+    ]
+    for task in background_tasks:
+        task.cancel()
+    # 취소된 작업이 실제로 끝날 때까지 대기 (DB 연결을 닫기 전에 DB 를 쓰는 작업이 없도록)
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # 아직 반영하지 않은 증가분 반영 (로그 종료 전에 실행 - 실패 시 경고 로그)
+    post_counters.flush()
+    # SQLite 연결 종료 (WAL 체크포인트 후 정상 종료)
+    close_connection()
+    await session_store.close()
+    await utils.rate_limit_store.close()
+    logger.close()
+
+
+# 모든 응답을 orjson 으로 직렬화 (반환값을 그대로 돌려주는 엔드포인트 + HTTPException)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_exception_handler(HTTPException, http_exception_handler)
+
+# 요청 본문 크기 제한 (CORS 안쪽에서 실행 -> 413 응답에도 CORS 헤더가 붙음)
+app.add_middleware(BodySizeLimitMiddleware)
 
 # CORS 설정 (먼저 추가)
 app.add_middleware(
@@ -12,20 +76,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # FE에서 요청 제한/조건부 GET 헤더를 읽을 수 있도록 노출
+    expose_headers=["X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset", "Retry-After", "X-Request-ID", "Server-Timing", "ETag", "Last-Modified"],
 )
 
-# 요청 로깅 미들웨어 (나중에 추가)
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    print(f"\n{'='*80}", flush=True)
-    print(f"[요청] {request.method} {request.url.path}", flush=True)
-    print(f"클라이언트: {request.client.host}", flush=True)
-    print(f"{'='*80}\n", flush=True)
-
-    response = await call_next(request)
-
-    print(f"[응답] {request.method} {request.url.path} → {response.status_code}\n", flush=True)
-    return response
+# 순수 ASGI 미들웨어 (CORS 다음에 추가 -> 나중에 추가한 것이 바깥쪽에서 먼저 실행)
+# 실행 순서 : MetricsMiddleware -> LoggingMiddleware -> RequestIdMiddleware -> TimingMiddleware -> RateLimitHeaderMiddleware -> CORS -> BodySizeLimitMiddleware -> 라우터
+# 프로파일러는 설정된 경우에만 추가 (요청 ID 가 정해진 뒤 실행되도록 안쪽에 배치)
+if utils.profiler.is_enabled():
+    app.add_middleware(ProfilerMiddleware)
+app.add_middleware(RateLimitHeaderMiddleware)
+app.add_middleware(TimingMiddleware)
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 
 # 헬스체크 엔드포인트
@@ -33,6 +97,16 @@ async def log_requests(request: Request, call_next):
 async def health_check():
     return {"status": "ok", "message": "BE server is running"}
 
+# 지표 엔드포인트 (Prometheus 텍스트 형식)
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    # 세션 수는 수집할 때만 조회
+    utils.metrics.session_store_sessions.set(await session_store.count_sessions())
+    return PlainTextResponse(
+        utils.metrics.registry.render(),
+        media_type="text/plain; version=0.0.4",
+    )
+
 app.include_router(api_router)
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""GET /api/health 처리량 벤치마크 (앱을 프로세스 안에서 ASGI 로 직접 호출, 네트워크/서버 없음)
+
+실행 :
+  python -m middlewares.benchmark > /tmp/health.log                                  (로그를 파일로)
+  python -m middlewares.benchmark | python -m middlewares.benchmark --read-slowly    (로그를 느린 파이프로)
+결과(req/s)는 표준 에러로, 요청 로그는 표준 출력으로 나감
+
+--print-logging : 구조화 로거 대신 요청마다 print(flush=True) 5줄을 바로 쓰는 예전 방식으로 측정
+--call-next : 순수 ASGI 미들웨어로 바꾸기 전처럼 @app.middleware("http") (BaseHTTPMiddleware + call_next) 한 겹을 더 씌워 측정
+--runs : 같은 측정을 여러 번 반복 (실행마다 편차가 커서 보통 3번)
+"""
+import argparse
+import asyncio
+import sys
+import time
+import utils.constants
+
+# 요청 제한에 걸리지 않도록 main 을 가져오기 전에 제한을 풀어 둠
+utils.constants.REQUESTS_MAX_COUNT = 10 ** 9
+utils.constants.REQUESTS_BURST_COUNT = 10 ** 9
+utils.constants.RATE_LIMIT_POLICIES = {}
+
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+import main  # noqa: E402
+from utils.logger import logger  # noqa: E402
+
+WARMUP_REQUESTS = 500
+
+
+def _scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 8000),
+    }
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: dict) -> None:
+    pass
+
+
+def with_print_logging(app):
+    """StructuredLogger 도입 전처럼 요청마다 print 5줄을 바로 쓰는 ASGI 앱"""
+    # 구조화 로거의 요청 로그는 기록하지 않음
+    logger._min_level = float("inf")
+
+    async def app_with_print_logging(scope, receive, send):
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        print(f"\n{'=' * 80}", flush=True)
+        print(f"[요청] {scope['method']} {scope['path']}", flush=True)
+        print(f"클라이언트: {scope['client'][0]}", flush=True)
+        print(f"{'=' * 80}\n", flush=True)
+        await app(scope, receive, send_with_status)
+        print(f"[응답] {scope['method']} {scope['path']} → {status}\n", flush=True)
+
+    return app_with_print_logging
+
+
+def with_call_next(app):
+    """예전 로깅 미들웨어처럼 call_next 로 요청을 넘기고 응답 헤더를 고치는 BaseHTTPMiddleware 를 씌운 앱"""
+
+    async def copy_rate_limit_headers(request, call_next):
+        response = await call_next(request)
+        for key, value in getattr(request.state, "rate_limit_headers", {}).items():
+            response.headers[key] = value
+        return response
+
+    return BaseHTTPMiddleware(app, dispatch=copy_rate_limit_headers)
+
+
+async def run(app, request_count: int) -> float:
+    """초당 처리한 요청 수"""
+    for _ in range(WARMUP_REQUESTS):
+        await app(_scope("/api/health"), _receive, _send)
+
+    started = time.perf_counter()
+    for _ in range(request_count):
+        await app(_scope("/api/health"), _receive, _send)
+    return request_count / (time.perf_counter() - started)
+
+
+def read_slowly() -> None:
+    """표준 입력을 천천히 읽음 (로그를 받는 쪽이 느린 경우 흉내 - 파이프 버퍼가 차면 쓰는 쪽이 막힘)"""
+    while sys.stdin.buffer.read(4096):
+        time.sleep(0.005)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--print-logging", action="store_true")
+    parser.add_argument("--call-next", action="store_true")
+    parser.add_argument("--read-slowly", action="store_true")
+    args = parser.parse_args()
+
+    if args.read_slowly:
+        read_slowly()
+        sys.exit()
+
+    app = main.app
+    if args.call_next:
+        app = with_call_next(app)
+    if args.print_logging:
+        app = with_print_logging(app)
+    for _ in range(args.runs):
+        requests_per_second = asyncio.run(run(app, args.requests))
+        print(f"GET /api/health x {args.requests:,}: {requests_per_second:,.0f} req/s", file=sys.stderr)
+    logger.close()
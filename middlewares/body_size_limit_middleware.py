@@ -0,0 +1,60 @@
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.json_response import ORJSONResponse
+from utils.response_schema import response_schema
+from utils.route_table import RouteTable
+import utils.constants
+import utils.error_message
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=response_schema(
+            message=utils.error_message.request_body_too_large,
+            data=None,
+        ),
+    )
+
+
+class BodySizeLimitMiddleware:
+    """경로별 요청 본문 최대 크기 제한 (413)
+
+    - Content-Length 가 최대 크기를 넘으면 본문을 읽지 않고 바로 413 응답
+    - Content-Length 가 없거나(chunked) 실제 본문이 더 긴 경우, 본문을 받는 도중 최대 크기를 넘는 순간 413
+      (컨트롤러가 request.body() 를 기다리는 중에 HTTPException 이 발생하므로 전역 예외 처리기에서 응답)
+    요청마다 메모리에 쌓이는 본문이 최대 크기를 넘지 않음
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.limits = RouteTable(utils.constants.REQUEST_BODY_MAX_BYTES_POLICIES)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = self.limits.find(scope["method"], scope["path"], utils.constants.REQUEST_BODY_MAX_BYTES)
+
+        for key, value in scope["headers"]:
+            if key == b"content-length":
+                if value.isdigit() and int(value) > max_bytes:
+                    error = _too_large()
+                    response = ORJSONResponse(status_code=error.status_code, content={"detail": error.detail})
+                    await response(scope, receive, send)
+                    return
+                break
+
+        received = 0
+
+        async def receive_with_limit() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    raise _too_large()
+            return message
+
+        await self.app(scope, receive_with_limit, send)
@@ -0,0 +1,39 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.logger import logger
+
+
+class LoggingMiddleware:
+    """요청마다 응답이 끝난 뒤 요청 로그 1줄 기록 (요청 ID, 상태 코드, 처리 시간)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        # 응답을 시작하기 전에 예외가 나면 서버가 500 으로 응답함
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            client = scope.get("client")
+            logger.info(
+                "request",
+                method=scope["method"],
+                path=scope["path"],
+                client=client[0] if client else None,
+                status=status,
+                durationMs=round((time.perf_counter() - started) * 1000, 3),
+                requestId=scope.get("state", {}).get("request_id"),
+            )
@@ -0,0 +1,36 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.metrics import http_requests_total, http_request_duration_seconds, http_requests_in_flight, route_label
+
+
+class MetricsMiddleware:
+    """요청마다 경로 템플릿별 처리 시간/상태 코드/처리 중인 요청 수 기록"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        # 응답을 시작하기 전에 예외가 나면 서버가 500 으로 응답함
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # 라우팅이 끝난 뒤에야 scope 에 라우트가 들어 있으므로 요청 처리 후 레이블 계산
+            method = scope["method"]
+            route = route_label(scope)
+            http_request_duration_seconds.observe(time.perf_counter() - started, method, route)
+            http_requests_total.inc(method, route, str(status))
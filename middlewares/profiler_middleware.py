@@ -0,0 +1,41 @@
+import sys
+from starlette.types import ASGIApp, Receive, Scope, Send
+from utils import constants
+from utils.profiler import should_profile, start_profile, finish_profile
+
+
+class ProfilerMiddleware:
+    """프로파일링 대상 요청(헤더 토큰 또는 샘플링)만 스택 샘플/구간 시간을 수집
+
+    프로파일러가 설정되지 않았으면 main.py 에서 이 미들웨어를 추가하지 않음
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._header = constants.PROFILER_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_value = None
+        for key, value in scope["headers"]:
+            if key == self._header:
+                header_value = value
+                break
+
+        if not should_profile(header_value):
+            await self.app(scope, receive, send)
+            return
+
+        # 이 코루틴의 프레임을 기준으로 샘플링한 스택 중 이 요청의 것만 골라냄
+        started = start_profile(
+            f"{scope['method']} {scope['path']}",
+            sys._getframe(),
+            scope.get("state", {}).get("request_id"),
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            finish_profile(started)
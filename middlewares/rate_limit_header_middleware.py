@@ -0,0 +1,30 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RateLimitHeaderMiddleware:
+    """요청 제한 의존성이 request.state.rate_limit_headers 에 남긴 헤더(X-RateLimit-*)를 응답에 추가
+
+    컨트롤러가 응답 객체(ORJSONResponse)를 직접 반환하므로 의존성에서 응답 헤더를 바로 설정할 수 없음
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                rate_limit_headers = state.get("rate_limit_headers")
+                if rate_limit_headers:
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        *((key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in rate_limit_headers.items()),
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
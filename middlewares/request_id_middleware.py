@@ -0,0 +1,38 @@
+import uuid
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 요청 ID 헤더 이름 (FE/프록시가 보낸 값이 있으면 그대로 사용)
+REQUEST_ID_HEADER = b"x-request-id"
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIdMiddleware:
+    """요청마다 요청 ID 를 정해서 request.state.request_id 와 X-Request-ID 응답 헤더로 전달"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == REQUEST_ID_HEADER:
+                # 너무 길거나 출력할 수 없는 값은 무시하고 새로 발급 (로그/헤더 오염 방지)
+                if len(value) <= _MAX_REQUEST_ID_LENGTH and value.isascii() and value.decode("ascii").isprintable():
+                    request_id = value.decode("ascii")
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+
+        scope.setdefault("state", {})["request_id"] = request_id
+        encoded_request_id = request_id.encode("ascii")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (REQUEST_ID_HEADER, encoded_request_id)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
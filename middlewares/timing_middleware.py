@@ -0,0 +1,24 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class TimingMiddleware:
+    """응답 시작까지 걸린 시간을 Server-Timing 헤더로 전달 (브라우저 개발자 도구에서 확인 가능)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - started) * 1000
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", b"app;dur=%.3f" % duration_ms)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
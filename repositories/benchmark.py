@@ -0,0 +1,65 @@
+"""게시글 목록 조회 벤치마크
+
+실행 : python -m repositories.benchmark [게시글 수]
+임시 DB 에 게시글을 만든 뒤 offset 별 목록 조회(limit=10)의 p99 를
+post_repository.find_posts(인덱스로 post_id 만 고른 뒤 조인) 와 단순 ORDER BY/OFFSET 쿼리로 비교하고,
+전체 게시글 수 조회(post_stats) 와 COUNT(*) 를 비교
+"""
+import os
+import sys
+import tempfile
+import time
+from repositories import database
+from repositories.posts import post_repository
+from utils import constants
+
+LIMIT = 10
+NOW = "2026-01-01T00:00:00.000Z"
+PLAIN_PAGE_QUERY = "SELECT * FROM posts ORDER BY created_at DESC, post_id DESC LIMIT ? OFFSET ?"
+
+
+def seed_posts(post_count: int) -> None:
+    connection = database.get_connection()
+    with connection:
+        connection.executemany(
+            "INSERT INTO posts (user_id, title, content, post_image_url, created_at, updated_at) "
+            "VALUES ('1', ?, ?, NULL, ?, ?)",
+            (
+                (f"제목 {number}", "게시글 내용 " * 20, f"2026-01-01T00:00:00.{number:07d}Z", NOW)
+                for number in range(post_count)
+            ),
+        )
+
+
+def p99(func, repeat: int) -> float:
+    """repeat 번 호출한 시간(ms)의 99 백분위수"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return times[max(int(repeat * 0.99) - 1, 0)] * 1000
+
+
+if __name__ == "__main__":
+    post_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        constants.DATABASE_PATH = os.path.join(directory, "benchmark.db")
+        seed_posts(post_count)
+        connection = database.get_connection()
+
+        print(f"게시글 {post_count:,}개, limit={LIMIT}, p99 (ms)")
+        for offset in (0, 10_000, 100_000, post_count - LIMIT):
+            if not 0 <= offset <= post_count - LIMIT:
+                continue
+            repeat = 200 if offset <= 10_000 else 30
+            page_time = p99(lambda: post_repository.find_posts(offset, LIMIT), repeat)
+            plain_time = p99(lambda: connection.execute(PLAIN_PAGE_QUERY, (LIMIT, offset)).fetchall(), repeat)
+            print(f"  offset {offset:>9,}: {page_time:7.2f}  (단순 ORDER BY/OFFSET {plain_time:7.2f})")
+
+        count_time = p99(post_repository.count_posts, 1000)
+        plain_count_time = p99(lambda: connection.execute("SELECT COUNT(*) FROM posts").fetchone(), 30)
+        print(f"  전체 게시글 수: {count_time:7.2f}  (COUNT(*) {plain_count_time:7.2f})")
+
+        database.close_connection()
@@ -0,0 +1,104 @@
+import sqlite3
+from typing import Optional
+from repositories.database import get_connection
+from utils.timestamp import now_timestamp
+
+# 댓글 목록 조회 (작성순, offset/limit)
+# (post_id, created_at, comment_id) 인덱스에서 해당 페이지의 comment_id 만 고른 뒤 본문을 읽음
+_SELECT_COMMENTS_PAGE = """
+SELECT c.*
+FROM comments AS c
+JOIN (
+    SELECT comment_id
+    FROM comments
+    WHERE post_id = ?
+    ORDER BY created_at, comment_id
+    LIMIT ? OFFSET ?
+) AS page ON c.comment_id = page.comment_id
+ORDER BY c.created_at, c.comment_id
+"""
+
+# 커서 이후 댓글 목록 조회 (작성순)
+_SELECT_COMMENTS_AFTER_CURSOR = """
+SELECT *
+FROM comments
+WHERE post_id = ? AND (created_at, comment_id) > (?, ?)
+ORDER BY created_at, comment_id
+LIMIT ?
+"""
+
+
+def _to_comment_model(row: sqlite3.Row) -> dict:
+    """DB 행 -> API 응답 형식의 댓글 데이터"""
+    return {
+        "commentId": str(row["comment_id"]),
+        "postId": str(row["post_id"]),
+        "userId": row["user_id"],
+        "content": row["content"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    }
+
+
+def insert_comment(post_id: int, user_id: str, content: str) -> dict:
+    """댓글 생성 후 생성된 댓글 반환"""
+    connection = get_connection()
+    now = now_timestamp()
+
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO comments (post_id, user_id, content, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (post_id, user_id, content, now, now),
+        )
+
+    return find_comment_by_id(cursor.lastrowid)
+
+
+def find_comments(post_id: int, offset: int, limit: int) -> list[dict]:
+    """게시글의 댓글 목록 조회 (작성순, offset/limit)"""
+    rows = get_connection().execute(_SELECT_COMMENTS_PAGE, (post_id, limit, offset)).fetchall()
+    return [_to_comment_model(row) for row in rows]
+
+
+def find_comments_after(post_id: int, created_at: str, comment_id: int, limit: int) -> list[dict]:
+    """게시글의 댓글 목록 조회 (작성순, 커서 이후 limit 개)"""
+    rows = get_connection().execute(
+        _SELECT_COMMENTS_AFTER_CURSOR,
+        (post_id, created_at, comment_id, limit),
+    ).fetchall()
+    return [_to_comment_model(row) for row in rows]
+
+
+def find_comment_by_id(comment_id: int) -> Optional[dict]:
+    """댓글 ID로 댓글 조회"""
+    row = get_connection().execute(
+        "SELECT * FROM comments WHERE comment_id = ?",
+        (comment_id,),
+    ).fetchone()
+
+    if not row:
+        return None
+    return _to_comment_model(row)
+
+
+def update_comment(comment_id: int, content: str) -> Optional[dict]:
+    """댓글 수정 후 수정된 댓글 반환"""
+    connection = get_connection()
+
+    with connection:
+        connection.execute(
+            "UPDATE comments SET content = ?, updated_at = ? WHERE comment_id = ?",
+            (content, now_timestamp(), comment_id),
+        )
+
+    return find_comment_by_id(comment_id)
+
+
+def delete_comment(comment_id: int) -> bool:
+    """댓글 삭제"""
+    connection = get_connection()
+
+    with connection:
+        cursor = connection.execute("DELETE FROM comments WHERE comment_id = ?", (comment_id,))
+
+    return cursor.rowcount > 0
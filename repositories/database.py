@@ -0,0 +1,201 @@
+import sqlite3
+import threading
+from typing import Optional
+from utils import constants
+
+# 테이블 및 인덱스 정의
+# - posts 는 post_id(rowid) 기준으로 저장되고, (created_at, post_id) 인덱스로 목록을 정렬 없이 읽음
+# - 인덱스에 post_id 가 포함되어 있으므로 목록 페이지 계산은 인덱스만으로 끝남 (커버링 인덱스)
+# - post_stats 는 전체 게시글 수를 트리거로 유지 (COUNT(*) 전체 스캔 방지)
+# - comments 는 (post_id, created_at, comment_id) 인덱스로 게시글별 댓글 목록을 순서대로 읽음
+# - posts.comment_count 는 댓글 추가/삭제와 같은 트랜잭션에서 트리거로 유지 (목록의 게시글마다 COUNT(*) 하지 않음)
+#   어긋난 값은 comment_counts.run_reconcile_loop 가 주기적으로 바로잡음
+# - posts.version / comments_version 은 게시글 / 댓글 목록이 바뀔 때마다 트리거로 1씩 증가 (조건부 GET 의 ETag 에 사용)
+#   조회수 변경은 버전을 올리지 않음 (ETag 는 약한 비교용, 조회수만 다른 응답은 같은 것으로 봄)
+# - post_likes 는 (post_id, user_id) 기본 키 하나로 저장 (WITHOUT ROWID) - 게시글별 좋아요를 누른 사용자를 user_id 순서대로 읽음
+#   게시글이 삭제되면 함께 삭제 (ON DELETE CASCADE)
+# - users 는 user_id(rowid), email, nickname_key(대소문자 구분 없는 닉네임) 각각 유일 인덱스로 바로 찾음
+#   (AUTOINCREMENT : 탈퇴한 사용자의 user_id 를 다시 쓰지 않음)
+# - user_stats.key_version 은 이메일/닉네임 키가 추가/변경될 때마다 트리거로 1씩 증가 (워커별 이메일/닉네임 필터를 다시 만들지 판단)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    email               TEXT    NOT NULL,
+    password            TEXT    NOT NULL,
+    nickname            TEXT    NOT NULL,
+    nickname_key        TEXT    NOT NULL,
+    profile_image_url   TEXT,
+    is_withdrawn        INTEGER NOT NULL DEFAULT 0,
+    created_at          TEXT    NOT NULL,
+    updated_at          TEXT    NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_nickname_key ON users (nickname_key);
+
+-- 개발용 테스트 계정 (비밀번호 : "password123")
+INSERT OR IGNORE INTO users (user_id, email, password, nickname, nickname_key, profile_image_url, created_at, updated_at)
+VALUES (
+    1, 'test@gmail.com', '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5jtJ3qKJ3q7EK',
+    'startup', 'startup', 'http~~~', '2026-01-01T00:00:00.000Z', '2026-01-01T00:00:00.000Z'
+);
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    id              INTEGER PRIMARY KEY CHECK (id = 1),
+    key_version     INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO user_stats (id, key_version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_users_insert_key_version AFTER INSERT ON users
+BEGIN
+    UPDATE user_stats SET key_version = key_version + 1 WHERE id = 1;
+END;
+
+-- 예전 트리거는 값이 같아도(예: 대소문자만 바꾼 닉네임) 버전을 올렸으므로 새 이름으로 교체
+DROP TRIGGER IF EXISTS trg_users_update_key_version;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_update_changed_key_version AFTER UPDATE OF email, nickname_key ON users
+WHEN OLD.nickname_key IS NOT NEW.nickname_key OR OLD.email IS NOT NEW.email
+BEGIN
+    UPDATE user_stats SET key_version = key_version + 1 WHERE id = 1;
+END;
+
+CREATE TABLE IF NOT EXISTS posts (
+    post_id                 INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id                 TEXT    NOT NULL,
+    title                   TEXT    NOT NULL,
+    content                 TEXT    NOT NULL,
+    post_image_url          TEXT,
+    like_count              INTEGER NOT NULL DEFAULT 0,
+    comment_count           INTEGER NOT NULL DEFAULT 0,
+    view_count              INTEGER NOT NULL DEFAULT 0,
+    created_at              TEXT    NOT NULL,
+    updated_at              TEXT    NOT NULL,
+    version                 INTEGER NOT NULL DEFAULT 0,
+    modified_at             TEXT,
+    comments_version        INTEGER NOT NULL DEFAULT 0,
+    comments_modified_at    TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_posts_created_at_post_id ON posts (created_at, post_id);
+
+CREATE TABLE IF NOT EXISTS post_stats (
+    id      INTEGER PRIMARY KEY CHECK (id = 1),
+    total   INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO post_stats (id, total) VALUES (1, (SELECT COUNT(*) FROM posts));
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_insert AFTER INSERT ON posts
+BEGIN
+    UPDATE post_stats SET total = total + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_delete AFTER DELETE ON posts
+BEGIN
+    UPDATE post_stats SET total = total - 1 WHERE id = 1;
+END;
+
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id         INTEGER NOT NULL REFERENCES posts (post_id) ON DELETE CASCADE,
+    user_id         TEXT    NOT NULL,
+    content         TEXT    NOT NULL,
+    created_at      TEXT    NOT NULL,
+    updated_at      TEXT    NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_comments_post_id_created_at_comment_id ON comments (post_id, created_at, comment_id);
+
+CREATE TABLE IF NOT EXISTS post_likes (
+    post_id     INTEGER NOT NULL REFERENCES posts (post_id) ON DELETE CASCADE,
+    user_id     INTEGER NOT NULL,
+    PRIMARY KEY (post_id, user_id)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_insert_count AFTER INSERT ON comments
+BEGIN
+    UPDATE posts SET comment_count = comment_count + 1 WHERE post_id = NEW.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_delete_count AFTER DELETE ON comments
+BEGIN
+    UPDATE posts SET comment_count = MAX(comment_count - 1, 0) WHERE post_id = OLD.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_posts_version AFTER UPDATE OF title, content, post_image_url, like_count, comment_count ON posts
+BEGIN
+    UPDATE posts SET version = version + 1, modified_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE post_id = NEW.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_insert_version AFTER INSERT ON comments
+BEGIN
+    UPDATE posts SET comments_version = comments_version + 1, comments_modified_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE post_id = NEW.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_update_version AFTER UPDATE OF content ON comments
+BEGIN
+    UPDATE posts SET comments_version = comments_version + 1, comments_modified_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE post_id = NEW.post_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_comments_delete_version AFTER DELETE ON comments
+BEGIN
+    UPDATE posts SET comments_version = comments_version + 1, comments_modified_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') WHERE post_id = OLD.post_id;
+END;
+"""
+
+# 기존 DB 파일에 나중에 추가된 컬럼 (테이블, 컬럼, 정의)
+# CREATE TABLE IF NOT EXISTS 는 이미 있는 테이블을 바꾸지 않으므로 없는 컬럼만 ALTER TABLE 로 추가
+_ADDED_COLUMNS = [
+    ("posts", "version", "INTEGER NOT NULL DEFAULT 0"),
+    ("posts", "modified_at", "TEXT"),
+    ("posts", "comments_version", "INTEGER NOT NULL DEFAULT 0"),
+    ("posts", "comments_modified_at", "TEXT"),
+]
+
+_connection: Optional[sqlite3.Connection] = None
+_connection_lock = threading.Lock()
+
+
+def _add_missing_columns(connection: sqlite3.Connection) -> None:
+    for table, column, definition in _ADDED_COLUMNS:
+        columns = {row["name"] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def get_connection() -> sqlite3.Connection:
+    """SQLite 연결 반환 (최초 호출 시 연결 생성 및 스키마 초기화)"""
+    global _connection
+
+    if _connection is not None:
+        return _connection
+
+    with _connection_lock:
+        if _connection is None:
+            # check_same_thread=False : 스레드풀에서 실행되는 핸들러도 같은 연결을 사용
+            connection = sqlite3.connect(constants.DATABASE_PATH, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+
+            # WAL : 읽기가 쓰기에 막히지 않도록 설정
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+
+            connection.executescript(_SCHEMA)
+            _add_missing_columns(connection)
+            connection.commit()
+            _connection = connection
+
+    return _connection
+
+
+def close_connection() -> None:
+    """SQLite 연결 종료"""
+    global _connection
+
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
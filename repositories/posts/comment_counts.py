@@ -0,0 +1,40 @@
+import asyncio
+import sqlite3
+from repositories.posts import post_repository, post_cache
+from utils import constants
+from utils.logger import logger
+import utils.metrics
+
+# 게시글 댓글 수(posts.comment_count) 점검
+# 평소에는 댓글 추가/삭제 트리거가 같은 트랜잭션에서 유지하고,
+# 트리거가 없던 예전 DB 나 직접 수정한 데이터처럼 어긋난 값만 주기적으로 한꺼번에 바로잡음
+
+
+async def reconcile() -> int:
+    """모든 게시글의 댓글 수 점검 후 바로잡은 게시글 수 반환
+
+    게시글 COMMENT_COUNT_RECONCILE_BATCH_SIZE 개마다 이벤트 루프에 양보 (게시글이 많아도 요청 처리가 길게 멈추지 않음)
+    """
+    repaired_count = 0
+    after_post_id = 0
+    while after_post_id is not None:
+        repaired_post_ids, after_post_id = post_repository.reconcile_comment_counts(
+            after_post_id, constants.COMMENT_COUNT_RECONCILE_BATCH_SIZE
+        )
+        if repaired_post_ids:
+            repaired_count += len(repaired_post_ids)
+            utils.metrics.comment_count_repairs_total.inc(amount=len(repaired_post_ids))
+            logger.warning("comment_count_repaired", posts=len(repaired_post_ids), firstPostId=repaired_post_ids[0])
+            post_cache.invalidate_posts(repaired_post_ids)
+        await asyncio.sleep(0)
+    return repaired_count
+
+
+async def run_reconcile_loop(interval_seconds: float = constants.COMMENT_COUNT_RECONCILE_INTERVAL_SECONDS) -> None:
+    """앱 시작 시 한 번, 이후 주기적으로 댓글 수를 점검하는 백그라운드 작업"""
+    while True:
+        try:
+            await reconcile()
+        except sqlite3.Error as error:
+            logger.warning("comment_count_reconcile_failed", error=str(error))
+        await asyncio.sleep(interval_seconds)
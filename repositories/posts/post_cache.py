@@ -0,0 +1,100 @@
+from typing import Optional
+from repositories.posts import post_repository
+from utils import constants
+from utils.ttl_cache import TTLCache
+
+# 게시글 상세/목록 조회 캐시 (read-through)
+# 쓰기 요청(작성/수정/삭제/좋아요/댓글)에서 영향을 받는 항목만 삭제
+# 캐시에는 DB 에 반영된 조회수/좋아요 수만 있음 (반영 전 증가분은 post_counters 에서 응답할 때 더함)
+
+# {post_id: (게시글 버전, 게시글)}
+_posts = TTLCache("post", constants.POST_CACHE_MAX_ENTRIES, constants.POST_CACHE_TTL_SECONDS)
+# {("offset", offset, limit) 또는 ("cursor", created_at, post_id, limit): (게시글 목록, 목록의 post_id 집합)}
+_pages = TTLCache("post_list", constants.POST_LIST_CACHE_MAX_ENTRIES, constants.POST_LIST_CACHE_TTL_SECONDS)
+
+
+def find_post_by_id(post_id: int, version: int) -> Optional[dict]:
+    """게시글 ID로 게시글 조회 (캐시에 없거나 캐시된 버전이 다르면 DB 조회 후 저장)
+
+    version 은 find_post_validators 로 읽은 현재 버전 (다른 워커에서 바뀐 게시글도 바로 다시 읽음)
+    반환한 dict 는 캐시 항목 자체이므로 바꾸지 않고 복사해서 사용
+    """
+    cached = _posts.get(post_id, lambda entry: entry[0] == version)
+    if cached is not None:
+        return cached[1]
+
+    post = post_repository.find_post_by_id(post_id)
+    if post is not None:
+        _posts.set(post_id, (version, post))
+    return post
+
+
+def _find_page(key: tuple, load) -> list[dict]:
+    cached = _pages.get(key)
+    if cached is not None:
+        return cached[0]
+
+    posts = load()
+    _pages.set(key, (posts, frozenset(int(post["postId"]) for post in posts)))
+    return posts
+
+
+def find_posts(offset: int, limit: int) -> list[dict]:
+    """게시글 목록 조회 (최신순, offset/limit, 캐시에 없으면 DB 조회 후 저장)"""
+    return _find_page(("offset", offset, limit), lambda: post_repository.find_posts(offset, limit))
+
+
+def find_posts_after(created_at: str, post_id: int, limit: int) -> list[dict]:
+    """게시글 목록 조회 (최신순, 커서 이후 limit 개, 캐시에 없으면 DB 조회 후 저장)"""
+    return _find_page(
+        ("cursor", created_at, post_id, limit),
+        lambda: post_repository.find_posts_after(created_at, post_id, limit),
+    )
+
+
+def invalidate_post(post_id: int) -> None:
+    """게시글 내용이 바뀐 경우 (수정, 좋아요, 댓글 수) - 상세 항목과 이 게시글이 들어 있는 목록만 삭제"""
+    _posts.delete(post_id)
+    _pages.delete_where(lambda key, page: post_id in page[1])
+
+
+def invalidate_posts(post_ids: list[int]) -> None:
+    """여러 게시글이 한꺼번에 바뀐 경우 (댓글 수 점검) - 목록은 한 번만 훑음"""
+    for post_id in post_ids:
+        _posts.delete(post_id)
+    post_id_set = frozenset(post_ids)
+    _pages.delete_where(lambda key, page: not post_id_set.isdisjoint(page[1]))
+
+
+def invalidate_offset_pages() -> None:
+    """게시글이 추가/삭제된 경우 - offset 목록은 모두 한 칸씩 밀리므로 삭제
+
+    커서 목록은 새 게시글보다 오래된 게시글만 담고 있으므로 영향 없음
+    (삭제된 게시글이 들어 있는 커서 목록은 invalidate_post 로 삭제)
+    """
+    _pages.delete_where(lambda key, page: key[0] == "offset")
+
+
+def apply_counter_deltas(deltas: dict) -> None:
+    """DB 에 반영한 조회수/좋아요 수 증가분({post_id: [조회수, 좋아요 수]})을 캐시된 게시글에도 더함
+
+    반영 후에는 대기 중인 증가분이 0 이 되므로, 캐시를 그대로 두면 응답의 조회수가 잠시 줄어들어 보임
+    """
+    for post_id, (views, likes) in deltas.items():
+        cached = _posts.peek(post_id)
+        if cached is not None:
+            _add_counts(cached[1], views, likes)
+
+    post_ids = deltas.keys()
+    for posts, page_post_ids in _pages.values():
+        if page_post_ids.isdisjoint(post_ids):
+            continue
+        for post in posts:
+            delta = deltas.get(int(post["postId"]))
+            if delta is not None:
+                _add_counts(post, delta[0], delta[1])
+
+
+def _add_counts(post: dict, views: int, likes: int) -> None:
+    post["viewCount"] += views
+    post["likeCount"] = max(post["likeCount"] + likes, 0)
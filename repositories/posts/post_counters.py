@@ -0,0 +1,140 @@
+import asyncio
+import sqlite3
+from typing import Optional
+from repositories.posts import post_repository, post_cache
+from utils import constants
+from utils.logger import logger
+
+# 게시글 조회수 증가분 / 좋아요 변경 (write-behind)
+# 조회/좋아요 요청은 메모리의 증가분만 바꾸고, run_flush_loop 가 주기적으로 모아서 DB 에 반영
+# 응답에는 DB 값 + 아직 반영하지 않은 증가분을 더해서 보여줌 (merge_counts)
+# 워커마다 따로 모으므로 다른 워커의 증가분은 그 워커가 반영한 뒤에 보임
+
+# 샤드별 {post_id: [조회수 증가분, 좋아요 수 증가분, {user_id: 좋아요 여부}]}
+# 좋아요 여부는 사용자별 마지막 요청만 남김 (누르고 취소하면 False 하나만 반영)
+# 반영할 때 샤드 하나씩 꺼내서 쓰고 샤드 사이에 이벤트 루프에 양보 (밀린 증가분이 많아도 요청 처리가 길게 멈추지 않음)
+_shards: list[dict] = [{} for _ in range(constants.POST_COUNTER_SHARD_COUNT)]
+# 샤드별 / 전체 아직 반영하지 않은 증가 횟수 (전체가 POST_COUNTER_MAX_PENDING 을 넘으면 바로 반영)
+_shard_pending_counts: list[int] = [0] * constants.POST_COUNTER_SHARD_COUNT
+_pending_count = 0
+_flush_requested: Optional[asyncio.Event] = None
+
+
+def _pending(post_id: int) -> list:
+    global _pending_count
+
+    index = post_id % len(_shards)
+    pending = _shards[index].get(post_id)
+    if pending is None:
+        pending = _shards[index][post_id] = [0, 0, {}]
+
+    _shard_pending_counts[index] += 1
+    _pending_count += 1
+    if _pending_count >= constants.POST_COUNTER_MAX_PENDING and _flush_requested is not None:
+        _flush_requested.set()
+    return pending
+
+
+def add_view(post_id: int) -> None:
+    """조회수 1 증가 (DB 에는 나중에 반영)"""
+    _pending(post_id)[0] += 1
+
+
+def set_liked(post_id: int, user_id: int, liked: bool) -> None:
+    """좋아요 추가/취소 (DB 에는 나중에 반영, 이미 같은 상태인지는 post_likes 에서 확인한 뒤 호출)"""
+    pending = _pending(post_id)
+    pending[1] += 1 if liked else -1
+    pending[2][user_id] = liked
+
+
+def pending_likers(post_id: int) -> dict:
+    """아직 반영하지 않은 좋아요 변경 {user_id: 좋아요 여부} (DB 에서 읽은 좋아요 목록에 덧씌움)"""
+    pending = _shards[post_id % len(_shards)].get(post_id)
+    return pending[2] if pending is not None else {}
+
+
+def has_pending_likes(post_id: int) -> bool:
+    """아직 반영하지 않은 좋아요 수 변경이 있는지 (있으면 DB 의 게시글 버전이 아직 바뀌지 않은 상태)"""
+    delta = _shards[post_id % len(_shards)].get(post_id)
+    return delta is not None and delta[1] != 0
+
+
+def merge_counts(post: dict) -> dict:
+    """게시글(DB/캐시 값)에 아직 반영하지 않은 증가분을 더한 복사본 (증가분이 없으면 그대로 반환, 원본은 바꾸지 않음)"""
+    delta = _shards[int(post["postId"]) % len(_shards)].get(int(post["postId"]))
+    if delta is None:
+        return post
+
+    merged = dict(post)
+    merged["viewCount"] += delta[0]
+    merged["likeCount"] = max(merged["likeCount"] + delta[1], 0)
+    return merged
+
+
+def _flush_shard(index: int) -> None:
+    """샤드 하나의 증가분을 DB 에 반영 (실패하면 증가분을 되돌려 다음 주기에 다시 시도)"""
+    global _pending_count
+
+    deltas = _shards[index]
+    if not deltas:
+        return
+    _shards[index] = {}
+    flushed_count, _shard_pending_counts[index] = _shard_pending_counts[index], 0
+
+    view_deltas = [(views, post_id) for post_id, (views, _, likers) in deltas.items() if not likers]
+    like_changes = [
+        (
+            post_id,
+            views,
+            [user_id for user_id, liked in likers.items() if liked],
+            [user_id for user_id, liked in likers.items() if not liked],
+        )
+        for post_id, (views, _, likers) in deltas.items()
+        if likers
+    ]
+    try:
+        like_deltas = post_repository.apply_counter_deltas(view_deltas, like_changes)
+    except sqlite3.Error as error:
+        logger.warning("post_counter_flush_failed", posts=len(deltas), error=str(error))
+        # 그 사이에 새로 쌓인 변경이 더 최신이므로 좋아요 여부는 새 값을 우선
+        shard = _shards[index]
+        for post_id, (views, likes, likers) in deltas.items():
+            pending = shard.get(post_id)
+            if pending is None:
+                shard[post_id] = [views, likes, likers]
+                continue
+            pending[0] += views
+            pending[1] += likes
+            for user_id, liked in likers.items():
+                pending[2].setdefault(user_id, liked)
+        _shard_pending_counts[index] += flushed_count
+        return
+
+    _pending_count -= flushed_count
+    # 캐시된 게시글에도 실제로 반영된 값을 더함 (좋아요 수가 바뀐 게시글은 버전도 바뀌므로 상세 조회 시 다시 읽음)
+    post_cache.apply_counter_deltas(
+        {post_id: (views, like_deltas.get(post_id, 0)) for post_id, (views, _, _) in deltas.items()}
+    )
+
+
+def flush() -> None:
+    """모든 샤드를 바로 반영 (앱 종료 시 실행)"""
+    for index in range(len(_shards)):
+        _flush_shard(index)
+
+
+async def run_flush_loop(interval_seconds: float = constants.POST_COUNTER_FLUSH_INTERVAL_SECONDS) -> None:
+    """주기적으로(또는 증가분이 많이 쌓이면 바로) 증가분을 DB 에 반영하는 백그라운드 작업 (앱 시작 시 실행)"""
+    global _flush_requested
+
+    _flush_requested = asyncio.Event()
+    while True:
+        try:
+            await asyncio.wait_for(_flush_requested.wait(), interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+        _flush_requested.clear()
+
+        for index in range(len(_shards)):
+            _flush_shard(index)
+            await asyncio.sleep(0)
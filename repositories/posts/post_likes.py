@@ -0,0 +1,67 @@
+from repositories.posts import post_repository, post_counters
+from utils import constants
+from utils.sorted_int_set import SortedIntSet
+from utils.ttl_cache import TTLCache
+
+# 게시글별 좋아요를 누른 사용자 집합 (read-through)
+# "이 사용자가 좋아요를 눌렀는지"를 요청마다 post_likes 행 조회 없이 메모리에서 O(log n) 으로 확인
+# 집합은 DB 값 + 아직 반영하지 않은 변경(post_counters)이므로, 캐시에서 빠졌다가 다시 읽어도 변경이 사라지지 않음
+# 다른 워커의 좋아요는 유효 시간이 지나야 보임 (같은 좋아요가 두 워커에서 들어와도 DB 에는 한 번만 반영됨)
+
+# {post_id: SortedIntSet(user_id)}
+_likers = TTLCache("post_likers", constants.POST_LIKERS_CACHE_MAX_ENTRIES, constants.POST_LIKERS_CACHE_TTL_SECONDS)
+
+
+def _to_liker_set(post_id: int, liker_ids: list[int]) -> SortedIntSet:
+    likers = SortedIntSet(liker_ids)
+    for user_id, liked in post_counters.pending_likers(post_id).items():
+        if liked:
+            likers.add(user_id)
+        else:
+            likers.remove(user_id)
+    _likers.set(post_id, likers)
+    return likers
+
+
+def _find_likers(post_ids: list[int]) -> dict[int, SortedIntSet]:
+    """게시글별 좋아요 집합 (캐시에 없는 게시글만 모아서 쿼리 한 번으로 조회)"""
+    found = {}
+    missing = []
+    for post_id in post_ids:
+        likers = _likers.get(post_id)
+        if likers is None:
+            missing.append(post_id)
+        else:
+            found[post_id] = likers
+
+    for post_id, liker_ids in post_repository.find_liker_ids(missing).items():
+        found[post_id] = _to_liker_set(post_id, liker_ids)
+    return found
+
+
+def is_liked(post_id: int, user_id: int) -> bool:
+    """사용자가 게시글에 좋아요를 눌렀는지"""
+    return user_id in _find_likers([post_id])[post_id]
+
+
+def like(post_id: int, user_id: int) -> None:
+    """좋아요 추가 (is_liked 로 누르지 않은 상태인지 확인한 뒤 호출, DB 와 좋아요 수는 post_counters 가 반영)"""
+    if _find_likers([post_id])[post_id].add(user_id):
+        post_counters.set_liked(post_id, user_id, True)
+
+
+def unlike(post_id: int, user_id: int) -> None:
+    """좋아요 취소 (is_liked 로 누른 상태인지 확인한 뒤 호출, DB 와 좋아요 수는 post_counters 가 반영)"""
+    if _find_likers([post_id])[post_id].remove(user_id):
+        post_counters.set_liked(post_id, user_id, False)
+
+
+def mark_liked_by_me(posts: list[dict], user_id: int) -> list[dict]:
+    """게시글 목록 각각에 likedByMe 를 붙인 복사본 (캐시된 게시글은 바꾸지 않음)"""
+    likers = _find_likers([int(post["postId"]) for post in posts])
+    return [{**post, "likedByMe": user_id in likers[int(post["postId"])]} for post in posts]
+
+
+def forget_post(post_id: int) -> None:
+    """삭제된 게시글의 좋아요 집합 삭제 (DB 의 행은 ON DELETE CASCADE 로 함께 삭제됨)"""
+    _likers.delete(post_id)
@@ -0,0 +1,225 @@
+import sqlite3
+from typing import Optional
+from repositories.database import get_connection
+from utils import constants
+from utils.timestamp import now_timestamp
+
+# 목록 조회 (최신순)
+# 서브쿼리는 (created_at, post_id) 인덱스만 읽어서 해당 페이지의 post_id 만 고르고,
+# 바깥 쿼리는 고른 post_id 로만 본문을 읽음 (건너뛰는 행의 본문은 읽지 않음)
+_SELECT_POSTS_PAGE = """
+SELECT p.*
+FROM posts AS p
+JOIN (
+    SELECT post_id
+    FROM posts
+    ORDER BY created_at DESC, post_id DESC
+    LIMIT ? OFFSET ?
+) AS page ON p.post_id = page.post_id
+ORDER BY p.created_at DESC, p.post_id DESC
+"""
+
+# 커서 이후 목록 조회 (최신순)
+# 마지막으로 읽은 (created_at, post_id) 위치로 인덱스를 바로 탐색하므로 페이지 깊이와 관계없이 비용이 일정함
+_SELECT_POSTS_AFTER_CURSOR = """
+SELECT *
+FROM posts
+WHERE (created_at, post_id) < (?, ?)
+ORDER BY created_at DESC, post_id DESC
+LIMIT ?
+"""
+
+
+def _to_post_model(row: sqlite3.Row) -> dict:
+    """DB 행 -> API 응답 형식의 게시글 데이터"""
+    return {
+        "postId": str(row["post_id"]),
+        "userId": row["user_id"],
+        "title": row["title"],
+        "content": row["content"],
+        "postImageUrl": row["post_image_url"],
+        "likeCount": row["like_count"],
+        "commentCount": row["comment_count"],
+        "viewCount": row["view_count"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    }
+
+
+def insert_post(user_id: str, title: str, content: str, post_image_url: Optional[str]) -> dict:
+    """게시글 생성 후 생성된 게시글 반환"""
+    connection = get_connection()
+    now = now_timestamp()
+
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO posts (user_id, title, content, post_image_url, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (user_id, title, content, post_image_url, now, now),
+        )
+
+    return find_post_by_id(cursor.lastrowid)
+
+
+def find_posts(offset: int, limit: int) -> list[dict]:
+    """게시글 목록 조회 (최신순, offset/limit)"""
+    rows = get_connection().execute(_SELECT_POSTS_PAGE, (limit, offset)).fetchall()
+    return [_to_post_model(row) for row in rows]
+
+
+def find_posts_after(created_at: str, post_id: int, limit: int) -> list[dict]:
+    """게시글 목록 조회 (최신순, 커서 이후 limit 개)"""
+    rows = get_connection().execute(_SELECT_POSTS_AFTER_CURSOR, (created_at, post_id, limit)).fetchall()
+    return [_to_post_model(row) for row in rows]
+
+
+def count_posts() -> int:
+    """전체 게시글 수 (트리거로 유지되는 값)"""
+    row = get_connection().execute("SELECT total FROM post_stats WHERE id = 1").fetchone()
+    return row["total"] if row else 0
+
+
+def find_post_by_id(post_id: int) -> Optional[dict]:
+    """게시글 ID로 게시글 조회"""
+    row = get_connection().execute(
+        "SELECT * FROM posts WHERE post_id = ?",
+        (post_id,),
+    ).fetchone()
+
+    if not row:
+        return None
+    return _to_post_model(row)
+
+
+def find_post_validators(post_id: int) -> Optional[dict]:
+    """조건부 GET 용 게시글/댓글 목록 버전 및 마지막 변경 시각 + 댓글 수 (기본 키만 읽음, 게시글이 없으면 None)"""
+    row = get_connection().execute(
+        "SELECT version, COALESCE(modified_at, updated_at) AS modified_at, "
+        "comments_version, COALESCE(comments_modified_at, created_at) AS comments_modified_at, comment_count "
+        "FROM posts WHERE post_id = ?",
+        (post_id,),
+    ).fetchone()
+
+    if not row:
+        return None
+    return {
+        "version": row["version"],
+        "modifiedAt": row["modified_at"],
+        "commentsVersion": row["comments_version"],
+        "commentsModifiedAt": row["comments_modified_at"],
+        "commentCount": row["comment_count"],
+    }
+
+
+def update_post(post_id: int, title: str, content: str, post_image_url: Optional[str]) -> Optional[dict]:
+    """게시글 수정 후 수정된 게시글 반환"""
+    connection = get_connection()
+
+    with connection:
+        connection.execute(
+            "UPDATE posts SET title = ?, content = ?, post_image_url = ?, updated_at = ? WHERE post_id = ?",
+            (title, content, post_image_url, now_timestamp(), post_id),
+        )
+
+    return find_post_by_id(post_id)
+
+
+def delete_post(post_id: int) -> bool:
+    """게시글 삭제"""
+    connection = get_connection()
+
+    with connection:
+        cursor = connection.execute("DELETE FROM posts WHERE post_id = ?", (post_id,))
+
+    return cursor.rowcount > 0
+
+
+def reconcile_comment_counts(after_post_id: int, batch_size: int) -> tuple[list[int], Optional[int]]:
+    """post_id 가 after_post_id 보다 큰 게시글 batch_size 개의 comment_count 를 실제 댓글 수로 바로잡음
+
+    (바로잡은 post_id 목록, 이번 범위의 마지막 post_id - 남은 게시글이 없으면 None) 반환
+    값이 다른 행만 UPDATE 하므로 맞는 게시글의 버전(ETag)은 바뀌지 않음
+    """
+    connection = get_connection()
+    row = connection.execute(
+        "SELECT post_id FROM posts WHERE post_id > ? ORDER BY post_id LIMIT 1 OFFSET ?",
+        (after_post_id, batch_size - 1),
+    ).fetchone()
+    last_post_id = row["post_id"] if row else None
+
+    with connection:
+        rows = connection.execute(
+            "UPDATE posts SET comment_count = (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id) "
+            "WHERE post_id > ? AND post_id <= ? "
+            "AND comment_count != (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id) "
+            "RETURNING post_id",
+            (after_post_id, last_post_id if last_post_id is not None else constants.SQLITE_INTEGER_MAX),
+        ).fetchall()
+
+    return [row["post_id"] for row in rows], last_post_id
+
+
+def find_liker_ids(post_ids: list[int]) -> dict[int, list[int]]:
+    """게시글별 좋아요를 누른 사용자 ID 목록 (user_id 오름차순, 여러 게시글을 쿼리 한 번으로 조회)"""
+    likers = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return likers
+
+    placeholders = ", ".join("?" * len(post_ids))
+    rows = get_connection().execute(
+        f"SELECT post_id, user_id FROM post_likes WHERE post_id IN ({placeholders}) ORDER BY post_id, user_id",
+        post_ids,
+    )
+    for post_id, user_id in rows:
+        likers[post_id].append(user_id)
+    return likers
+
+
+def apply_counter_deltas(
+    view_deltas: list[tuple[int, int]],
+    like_changes: list[tuple[int, int, list[int], list[int]]],
+) -> dict[int, int]:
+    """모아둔 조회수 증가분/좋아요 변경을 한 트랜잭션으로 반영하고 게시글별 실제 좋아요 수 변화 반환 (post_counters 에서 주기적으로 실행)
+
+    - view_deltas : [(조회수 증가분, post_id)] - like_count 를 건드리지 않으므로 게시글 버전(ETag)이 바뀌지 않음
+    - like_changes : [(post_id, 조회수 증가분, 좋아요를 누른 user_id 목록, 좋아요를 취소한 user_id 목록)]
+    좋아요 수는 post_likes 에 실제로 추가/삭제된 행 수만큼만 바꿈 (다른 워커가 먼저 반영한 같은 좋아요는 두 번 세지 않음)
+    삭제된 게시글의 변경은 일치하는 행이 없으므로 무시됨
+    """
+    connection = get_connection()
+    like_deltas = {}
+
+    with connection:
+        if view_deltas:
+            connection.executemany(
+                "UPDATE posts SET view_count = view_count + ? WHERE post_id = ?",
+                view_deltas,
+            )
+
+        for post_id, views, liked_user_ids, unliked_user_ids in like_changes:
+            like_delta = 0
+            if liked_user_ids:
+                like_delta += connection.executemany(
+                    "INSERT OR IGNORE INTO post_likes (post_id, user_id) "
+                    "SELECT post_id, ? FROM posts WHERE post_id = ?",
+                    [(user_id, post_id) for user_id in liked_user_ids],
+                ).rowcount
+            if unliked_user_ids:
+                like_delta -= connection.executemany(
+                    "DELETE FROM post_likes WHERE post_id = ? AND user_id = ?",
+                    [(post_id, user_id) for user_id in unliked_user_ids],
+                ).rowcount
+
+            if like_delta:
+                connection.execute(
+                    "UPDATE posts SET view_count = view_count + ?, like_count = MAX(like_count + ?, 0) WHERE post_id = ?",
+                    (views, like_delta, post_id),
+                )
+            elif views:
+                connection.execute(
+                    "UPDATE posts SET view_count = view_count + ? WHERE post_id = ?",
+                    (views, post_id),
+                )
+            like_deltas[post_id] = like_delta
+
+    return like_deltas
@@ -0,0 +1,57 @@
+"""이메일/닉네임 필터 벤치마크
+
+실행 : python -m repositories.users.benchmark [사용자 수]
+임시 DB 에 사용자를 만든 뒤 앱 시작 시 필터 생성(build_filters) 시간과
+가입하지 않은 이메일의 exists_email 호출당 시간(필터 사용 / 유일 인덱스만)을 출력
+필터 자체의 추가/조회 시간과 오탐률은 python -m utils.cuckoo_filter
+"""
+import os
+import sys
+import tempfile
+import time
+from repositories import database
+from repositories.users import user_repository
+from utils import constants
+
+NOW = "2026-01-01T00:00:00.000Z"
+
+
+def seed_users(user_count: int) -> None:
+    connection = database.get_connection()
+    with connection:
+        connection.executemany(
+            "INSERT INTO users (email, password, nickname, nickname_key, created_at, updated_at) "
+            "VALUES (?, 'hash', ?, ?, ?, ?)",
+            (
+                (f"user{number}@example.com", f"user{number}", f"user{number}", NOW, NOW)
+                for number in range(2, user_count + 1)
+            ),
+        )
+
+
+def measure(func, values: list) -> float:
+    """호출당 시간(초) - values 를 한 번씩 넣어 호출한 평균"""
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    return (time.perf_counter() - started) / len(values)
+
+
+if __name__ == "__main__":
+    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        constants.DATABASE_PATH = os.path.join(directory, "benchmark.db")
+        seed_users(user_count)
+
+        started = time.perf_counter()
+        user_repository.build_filters()
+        print(f"사용자 {user_count:,}명 build_filters: {time.perf_counter() - started:.2f} s")
+
+        new_emails = [f"new{number}@example.net" for number in range(100_000)]
+        assert not any(user_repository.exists_email(email) for email in new_emails[:1000])
+        filter_time = measure(user_repository.exists_email, new_emails)
+        user_repository._email_filter = None
+        index_time = measure(user_repository.exists_email, new_emails)
+        print(f"exists_email (새 이메일): 필터 {filter_time * 1e6:.2f} us, 인덱스만 {index_time * 1e6:.2f} us")
+
+        database.close_connection()
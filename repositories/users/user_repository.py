@@ -0,0 +1,307 @@
+import asyncio
+import sqlite3
+from typing import Optional
+from repositories.database import get_connection
+from utils import constants
+from utils.cuckoo_filter import CuckooFilter
+from utils.logger import logger
+from utils.timestamp import now_timestamp
+
+# 이메일/닉네임 키 필터 (앱 시작 시 build_filters 로 생성)
+# 필터에 없으면 DB 를 조회하지 않고 바로 "사용 가능"으로 판단하고, 있을 수도 있을 때만 인덱스를 조회함
+# - 이 워커의 가입/닉네임 변경은 바로 필터에 추가
+# - 다른 워커의 변경은 user_stats.key_version 으로 감지해서 run_filter_refresh_loop 가 필터를 다시 생성
+#   (최대 USER_FILTER_REFRESH_INTERVAL_SECONDS 동안 "사용 가능"으로 보일 수 있음, 가입/변경 자체는 유일 인덱스가 막음)
+# - 필터가 가득 차면 더 큰 필터를 스레드에서 생성하고, 그동안은 필터 없이 DB 인덱스로 확인
+# - 탈퇴/변경 전 키는 필터에서 지우지 않음 (다른 워커가 추가한 키를 지우면 같은 지문의 다른 키가 사라질 수 있음)
+#   남은 키는 "있을 수도 있음"으로 DB 확인만 한 번 더 하고, 필터를 다시 생성할 때 정리됨
+_email_filter: Optional[CuckooFilter] = None
+_nickname_filter: Optional[CuckooFilter] = None
+# 현재 필터에 반영된 key_version
+_filter_version: Optional[int] = None
+# 필터를 다시 생성하는 동안 이 워커에서 추가된 키 (새 필터에도 추가)
+_keys_added_while_rebuilding: Optional[list[tuple[Optional[str], Optional[str]]]] = None
+# 가득 찬 필터를 다시 생성하는 작업 (작업이 중간에 사라지지 않도록 참조 유지)
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def _nickname_key(nickname: str) -> str:
+    """닉네임 중복 비교용 키 (대소문자 구분 없음)"""
+    return nickname.casefold()
+
+
+def _read_key_version(connection: sqlite3.Connection) -> int:
+    return connection.execute("SELECT key_version FROM user_stats WHERE id = 1").fetchone()[0]
+
+
+def _load_filters(connection: sqlite3.Connection) -> tuple[int, CuckooFilter, CuckooFilter]:
+    """DB 의 모든 사용자로 이메일/닉네임 필터 생성 -> (key_version, 이메일 필터, 닉네임 필터)
+
+    버전을 먼저 읽음 (읽는 동안 추가된 키는 필터에 있을 수도 없을 수도 있지만, 버전이 달라지므로 다음 확인에서 다시 생성)
+    """
+    key_version = _read_key_version(connection)
+    count = connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    capacity = max(count * 2, constants.USER_FILTER_MIN_CAPACITY)
+
+    while True:
+        email_filter = CuckooFilter(capacity)
+        nickname_filter = CuckooFilter(capacity)
+        added = all(
+            email_filter.add(row[0]) and nickname_filter.add(row[1])
+            for row in connection.execute("SELECT email, nickname_key FROM users")
+        )
+        if added:
+            return key_version, email_filter, nickname_filter
+        # 자리를 못 찾은 키가 있으면 (드묾) 용량을 늘려서 다시 생성
+        capacity *= 2
+
+
+def _set_filters(key_version: int, email_filter: CuckooFilter, nickname_filter: CuckooFilter) -> None:
+    global _email_filter, _nickname_filter, _filter_version
+
+    _email_filter, _nickname_filter, _filter_version = email_filter, nickname_filter, key_version
+
+
+def build_filters() -> None:
+    """DB 의 모든 사용자로 이메일/닉네임 필터 생성 (앱 시작 시 실행)"""
+    _set_filters(*_load_filters(get_connection()))
+
+
+def _load_filters_from_new_connection() -> tuple[int, CuckooFilter, CuckooFilter]:
+    # 다른 스레드에서 실행하므로 요청 처리에 쓰는 연결과 별도의 읽기 전용 연결 사용
+    connection = sqlite3.connect(f"file:{constants.DATABASE_PATH}?mode=ro", uri=True)
+    try:
+        return _load_filters(connection)
+    finally:
+        connection.close()
+
+
+async def refresh_filters() -> None:
+    """다른 워커에서 이메일/닉네임 키가 바뀌었거나 필터가 가득 찼으면 필터를 다시 생성
+
+    생성은 스레드에서 실행해 요청 처리를 막지 않음 (이미 생성 중이면 그대로 둠)
+    """
+    global _keys_added_while_rebuilding
+
+    if _filter_version is None or _keys_added_while_rebuilding is not None:
+        return
+    if _email_filter is not None and _read_key_version(get_connection()) == _filter_version:
+        return
+
+    _keys_added_while_rebuilding = []
+    try:
+        filters = await asyncio.to_thread(_load_filters_from_new_connection)
+    finally:
+        added_keys, _keys_added_while_rebuilding = _keys_added_while_rebuilding, None
+
+    _set_filters(*filters)
+    for email, nickname_key in added_keys:
+        _add_to_filters(email, nickname_key, None)
+
+
+async def _try_refresh_filters() -> None:
+    try:
+        await refresh_filters()
+    except sqlite3.Error as error:
+        # 필터가 없는 동안에는 DB 인덱스로 확인하고, 다음 주기에 다시 시도
+        logger.warning("user_filter_refresh_failed", error=str(error))
+
+
+async def run_filter_refresh_loop(interval_seconds: float = constants.USER_FILTER_REFRESH_INTERVAL_SECONDS) -> None:
+    """주기적으로 다른 워커의 가입/닉네임 변경을 확인해서 필터를 다시 생성하는 백그라운드 작업 (앱 시작 시 실행)"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await _try_refresh_filters()
+
+
+def _rebuild_full_filters() -> None:
+    """필터가 가득 찬 경우 - 다시 생성할 때까지 필터 없이 DB 인덱스로 확인하고, 더 큰 필터를 스레드에서 생성"""
+    global _email_filter, _nickname_filter, _rebuild_task
+
+    _email_filter = _nickname_filter = None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 이벤트 루프 밖 (스크립트 등) 에서는 바로 생성
+        build_filters()
+        return
+    _rebuild_task = loop.create_task(_try_refresh_filters())
+
+
+def _add_to_filters(email: Optional[str], nickname_key: Optional[str], key_version: Optional[int]) -> None:
+    """이 워커에서 추가/변경한 키를 필터에 추가
+
+    key_version : 변경한 트랜잭션에서 읽은 key_version - 필터 버전 바로 다음이면 그 사이 다른 워커의 변경이 없으므로 필터 버전도 올림
+    """
+    global _filter_version
+
+    if _filter_version is None:
+        return
+
+    if key_version is not None and key_version == _filter_version + 1:
+        _filter_version = key_version
+    if _keys_added_while_rebuilding is not None:
+        _keys_added_while_rebuilding.append((email, nickname_key))
+    if _email_filter is None:
+        # 가득 차서 다시 생성하는 중 (새 필터에는 DB 에서 읽거나 위 목록으로 추가됨)
+        return
+
+    added = (email is None or _email_filter.add(email)) and (nickname_key is None or _nickname_filter.add(nickname_key))
+    if not added:
+        _rebuild_full_filters()
+
+
+def _to_user_model(row: sqlite3.Row) -> dict:
+    """DB 행 -> API 응답 형식의 사용자 데이터"""
+    return {
+        "userId": str(row["user_id"]),
+        "email": row["email"],
+        "password": row["password"],
+        "userNickname": row["nickname"],
+        "profileImageUrl": row["profile_image_url"],
+        "isWithdrawn": bool(row["is_withdrawn"]),
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+    }
+
+
+def insert_user(email: str, password: str, nickname: str, profile_image_url: Optional[str]) -> Optional[dict]:
+    """사용자 생성 후 생성된 사용자 반환 (이메일/닉네임이 이미 있으면 None)"""
+    connection = get_connection()
+    now = now_timestamp()
+
+    try:
+        with connection:
+            cursor = connection.execute(
+                "INSERT INTO users (email, password, nickname, nickname_key, profile_image_url, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (email, password, nickname, _nickname_key(nickname), profile_image_url, now, now),
+            )
+            key_version = _read_key_version(connection)
+    except sqlite3.IntegrityError:
+        # 중복 확인 이후 다른 요청이 먼저 가입한 경우 (유일 인덱스 위반)
+        return None
+
+    _add_to_filters(email, _nickname_key(nickname), key_version)
+    return find_user_by_id(cursor.lastrowid)
+
+
+def find_user_by_id(user_id: int) -> Optional[dict]:
+    """사용자 ID로 사용자 조회"""
+    row = get_connection().execute(
+        "SELECT * FROM users WHERE user_id = ?",
+        (user_id,),
+    ).fetchone()
+
+    if not row:
+        return None
+    return _to_user_model(row)
+
+
+def find_user_by_email(email: str) -> Optional[dict]:
+    """이메일로 사용자 조회"""
+    row = get_connection().execute(
+        "SELECT * FROM users WHERE email = ?",
+        (email,),
+    ).fetchone()
+
+    if not row:
+        return None
+    return _to_user_model(row)
+
+
+def find_user_by_nickname(nickname: str) -> Optional[dict]:
+    """닉네임으로 사용자 조회 (대소문자 구분 없음)"""
+    row = get_connection().execute(
+        "SELECT * FROM users WHERE nickname_key = ?",
+        (_nickname_key(nickname),),
+    ).fetchone()
+
+    if not row:
+        return None
+    return _to_user_model(row)
+
+
+def exists_email(email: str) -> bool:
+    """이메일 사용 여부 (필터에 없으면 DB 조회 없이 False, 있을 수도 있으면 인덱스 확인)"""
+    if _email_filter is not None and email not in _email_filter:
+        return False
+
+    row = get_connection().execute(
+        "SELECT 1 FROM users WHERE email = ?",
+        (email,),
+    ).fetchone()
+    return row is not None
+
+
+def exists_nickname(nickname: str) -> bool:
+    """닉네임 사용 여부 (대소문자 구분 없음, 필터에 없으면 DB 조회 없이 False)"""
+    nickname_key = _nickname_key(nickname)
+    if _nickname_filter is not None and nickname_key not in _nickname_filter:
+        return False
+
+    row = get_connection().execute(
+        "SELECT 1 FROM users WHERE nickname_key = ?",
+        (nickname_key,),
+    ).fetchone()
+    return row is not None
+
+
+def update_password(user_id: int, password: str) -> bool:
+    """비밀번호(해시) 변경"""
+    connection = get_connection()
+
+    with connection:
+        cursor = connection.execute(
+            "UPDATE users SET password = ?, updated_at = ? WHERE user_id = ?",
+            (password, now_timestamp(), user_id),
+        )
+
+    return cursor.rowcount > 0
+
+
+def update_nickname(user_id: int, nickname: str) -> bool:
+    """닉네임 변경 (새 닉네임은 필터에도 추가, 이미 쓰는 닉네임이면 False)"""
+    connection = get_connection()
+    nickname_key = _nickname_key(nickname)
+
+    row = connection.execute("SELECT nickname_key FROM users WHERE user_id = ?", (user_id,)).fetchone()
+    if not row:
+        return False
+
+    try:
+        with connection:
+            connection.execute(
+                "UPDATE users SET nickname = ?, nickname_key = ?, updated_at = ? WHERE user_id = ?",
+                (nickname, nickname_key, now_timestamp(), user_id),
+            )
+            key_version = _read_key_version(connection)
+    except sqlite3.IntegrityError:
+        return False
+
+    if row["nickname_key"] != nickname_key:
+        _add_to_filters(None, nickname_key, key_version)
+    return True
+
+
+def update_profile_image_url(user_id: int, profile_image_url: Optional[str]) -> bool:
+    """프로필 이미지 URL 변경"""
+    connection = get_connection()
+
+    with connection:
+        cursor = connection.execute(
+            "UPDATE users SET profile_image_url = ?, updated_at = ? WHERE user_id = ?",
+            (profile_image_url, now_timestamp(), user_id),
+        )
+
+    return cursor.rowcount > 0
+
+
+def delete_user(user_id: int) -> bool:
+    """사용자 삭제 (이메일/닉네임 인덱스에서도 삭제되어 다시 가입 가능, 필터에 남은 키는 DB 확인으로 걸러짐)"""
+    connection = get_connection()
+
+    with connection:
+        cursor = connection.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
+
+    return cursor.rowcount > 0
@@ -1,6 +1,8 @@
 from controllers.comments import comment_controller
 from fastapi import APIRouter, Request, Depends
+from typing import Optional
 from dependencies.rate_limit_dependency import rate_limiter
+from dependencies.auth_dependency import get_current_user
 from dependencies.method_dependency import require_post, require_get, require_patch, require_delete
 
 router = APIRouter(prefix="/posts/{post_id}/comments", tags=["comments"])
@@ -13,8 +15,8 @@ router = APIRouter(prefix="/posts/{post_id}/comments", tags=["comments"])
         Depends(rate_limiter),
     ]
 )
-async def create_comment(post_id: int, request: Request):
-    return await comment_controller.create_comment(post_id, request)
+async def create_comment(post_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await comment_controller.create_comment(post_id, request, current_user)
 
 # 댓글 전체 목록 조회
 @router.get(
@@ -24,8 +26,15 @@ async def create_comment(post_id: int, request: Request):
         Depends(rate_limiter),
     ]
 )
-async def read_comments(post_id: int, offset: int = 0, limit: int = 10):
-    return await comment_controller.read_comments(post_id, offset, limit)
+async def read_comments(
+    post_id: int,
+    request: Request,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    return await comment_controller.read_comments(post_id, offset, limit, request, cursor, current_user)
 
 # 댓글 수정
 @router.patch(
@@ -35,8 +44,8 @@ async def read_comments(post_id: int, offset: int = 0, limit: int = 10):
         Depends(rate_limiter),
     ]
 )
-async def update_comment(post_id: int, comment_id: int, request: Request):
-    return await comment_controller.update_comment(comment_id, post_id, request)
+async def update_comment(post_id: int, comment_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await comment_controller.update_comment(comment_id, post_id, request, current_user)
 
 # 댓글 삭제
 @router.delete(
@@ -46,5 +55,5 @@ async def update_comment(post_id: int, comment_id: int, request: Request):
         Depends(rate_limiter),
     ]
 )
-async def delete_comment(post_id: int, comment_id: int):
-    return await comment_controller.delete_comment(comment_id, post_id)
+async def delete_comment(post_id: int, comment_id: int, current_user: dict = Depends(get_current_user)):
+    return await comment_controller.delete_comment(comment_id, post_id, current_user)
@@ -1,6 +1,8 @@
 from controllers.posts import post_controller
 from fastapi import APIRouter, Request, Depends
+from typing import Optional
 from dependencies.rate_limit_dependency import rate_limiter
+from dependencies.auth_dependency import get_current_user
 from dependencies.method_dependency import require_post, require_get, require_patch, require_delete, require_put
 
 router = APIRouter(prefix="/posts", tags=["posts"])
@@ -13,8 +15,8 @@ router = APIRouter(prefix="/posts", tags=["posts"])
         Depends(rate_limiter),
     ]
 )
-async def create_post(request: Request):
-    return await post_controller.create_post(request)
+async def create_post(request: Request, current_user: dict = Depends(get_current_user)):
+    return await post_controller.create_post(request, current_user)
 
 # 게시글 전체 목록 조회
 @router.get(
@@ -24,8 +26,13 @@ async def create_post(request: Request):
         Depends(rate_limiter),
     ]
 )
-async def read_posts(offset: int = 0, limit: int = 10):
-    return await post_controller.read_posts(offset, limit)
+async def read_posts(
+    offset: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    return await post_controller.read_posts(offset, limit, cursor, current_user)
 
 # 게시글 상세 조회
 @router.get(
@@ -35,8 +42,8 @@ async def read_posts(offset: int = 0, limit: int = 10):
         Depends(rate_limiter),
     ]
 )
-async def read_post(post_id: int):
-    return await post_controller.read_post(post_id)
+async def read_post(post_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await post_controller.read_post(post_id, request, current_user)
 
 # 게시글 수정
 @router.put(
@@ -46,8 +53,8 @@ async def read_post(post_id: int):
         Depends(rate_limiter),
     ]
 )
-async def update_post(post_id: int, request: Request):
-    return await post_controller.update_post(post_id, request)
+async def update_post(post_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await post_controller.update_post(post_id, request, current_user)
 
 # 게시글 삭제
 @router.delete(
@@ -57,8 +64,8 @@ async def update_post(post_id: int, request: Request):
         Depends(rate_limiter),
     ]
 )
-async def delete_post(post_id: int):
-    return await post_controller.delete_post(post_id)
+async def delete_post(post_id: int, current_user: dict = Depends(get_current_user)):
+    return await post_controller.delete_post(post_id, current_user)
 
 # 게시글 좋아요 추가
 @router.patch(
@@ -68,8 +75,8 @@ async def delete_post(post_id: int):
         Depends(rate_limiter),
     ]
 )
-async def like_post(post_id: int):
-    return await post_controller.like_post(post_id)
+async def like_post(post_id: int, current_user: dict = Depends(get_current_user)):
+    return await post_controller.like_post(post_id, current_user)
 
 # 게시글 좋아요 제거
 @router.patch(
@@ -79,5 +86,5 @@ async def like_post(post_id: int):
         Depends(rate_limiter),
     ]
 )
-async def unlike_post(post_id: int):
-    return await post_controller.unlike_post(post_id)
+async def unlike_post(post_id: int, current_user: dict = Depends(get_current_user)):
+    return await post_controller.unlike_post(post_id, current_user)
@@ -1,6 +1,8 @@
 from controllers.users import user_controller
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, Cookie
+from typing import Optional
 from dependencies.rate_limit_dependency import rate_limiter
+from dependencies.auth_dependency import get_current_user
 from dependencies.method_dependency import require_post, require_get, require_patch, require_delete
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -39,8 +41,8 @@ async def login(request: Request):
         Depends(rate_limiter),
     ]
 )
-async def logout():
-    return await user_controller.logout_user()
+async def logout(session_id: Optional[str] = Cookie(None)):
+    return await user_controller.logout_user(session_id)
 
 # 회원 탈퇴
 @router.delete(
@@ -50,8 +52,12 @@ async def logout():
         Depends(rate_limiter),
     ]
 )
-async def withdraw(user_id: int):
-    return await user_controller.delete_user(user_id)
+async def withdraw(
+    user_id: int,
+    current_user: dict = Depends(get_current_user),
+    session_id: Optional[str] = Cookie(None)
+):
+    return await user_controller.delete_user(user_id, current_user, session_id)
 
 # 회원 정보 조회
 @router.get(
@@ -61,8 +67,8 @@ async def withdraw(user_id: int):
         Depends(rate_limiter),
     ]
 )
-async def read_user_info(user_id: int):
-    return await user_controller.read_user(user_id)
+async def read_user_info(user_id: int, current_user: dict = Depends(get_current_user)):
+    return await user_controller.read_user(user_id, current_user)
 
 # 회원 정보 수정(비밀번호)
 @router.patch(
@@ -72,8 +78,8 @@ async def read_user_info(user_id: int):
         Depends(rate_limiter),
     ]
 )
-async def update_password(user_id: int, request: Request):
-    return await user_controller.update_user_password(user_id, request)
+async def update_password(user_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await user_controller.update_user_password(user_id, request, current_user)
 
 # 회원 정보 수정(닉네임)
 @router.patch(
@@ -83,8 +89,8 @@ async def update_password(user_id: int, request: Request):
         Depends(rate_limiter),
     ]
 )
-async def update_nickname(user_id: int, request: Request):
-    return await user_controller.update_user_nickname(user_id, request)
+async def update_nickname(user_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await user_controller.update_user_nickname(user_id, request, current_user)
 
 # 회원 정보 수정(프로필 이미지 URL)
 @router.patch(
@@ -94,8 +100,8 @@ async def update_nickname(user_id: int, request: Request):
         Depends(rate_limiter),
     ]
 )
-async def update_profile_image_url(user_id: int, request: Request):
-    return await user_controller.update_user_profile_image_url(user_id, request)
+async def update_profile_image_url(user_id: int, request: Request, current_user: dict = Depends(get_current_user)):
+    return await user_controller.update_user_profile_image_url(user_id, request, current_user)
 
 # 회원 이메일 중복 확인
 @router.post(
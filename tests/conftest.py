@@ -0,0 +1,59 @@
+import pytest
+import utils.constants
+
+# 요청 제한기는 main 을 가져올 때 만들어지므로 그 전에 제한을 풀어 둠 (테스트 요청이 429 에 걸리지 않도록)
+utils.constants.REQUESTS_MAX_COUNT = 10 ** 9
+utils.constants.REQUESTS_BURST_COUNT = 10 ** 9
+utils.constants.RATE_LIMIT_POLICIES = {}
+
+from fastapi.testclient import TestClient  # noqa: E402
+import main  # noqa: E402
+from repositories import database  # noqa: E402
+from repositories.posts import post_cache, post_counters, post_likes  # noqa: E402
+from repositories.users import user_repository  # noqa: E402
+
+
+def _reset_state() -> None:
+    post_cache._posts._entries.clear()
+    post_cache._pages._entries.clear()
+    post_likes._likers._entries.clear()
+    for index in range(len(post_counters._shards)):
+        post_counters._shards[index] = {}
+        post_counters._shard_pending_counts[index] = 0
+    post_counters._pending_count = 0
+
+
+@pytest.fixture
+def database_path(tmp_path, monkeypatch):
+    """테스트마다 새 SQLite 파일 + 비어 있는 캐시/증가분"""
+    path = str(tmp_path / "test.db")
+    database.close_connection()
+    monkeypatch.setattr(utils.constants, "DATABASE_PATH", path)
+    _reset_state()
+    user_repository.build_filters()
+    yield path
+    database.close_connection()
+    _reset_state()
+
+
+@pytest.fixture
+def client(database_path):
+    """앱 테스트 클라이언트 (lifespan 을 실행하지 않으므로 증가분은 post_counters.flush() 로 직접 반영)"""
+    return TestClient(main.app)
+
+
+def signup(client: TestClient, number: int = 1) -> str:
+    """회원가입 후 로그인 (쿠키는 client 에 저장됨), userId 반환"""
+    response = client.post("/api/v1/users/signup", json={
+        "email": f"user{number}@example.com",
+        "password": "Passw0rd!",
+        "nickname": f"user{number}",
+    })
+    assert response.status_code == 201
+    return response.json()["data"]["userId"]
+
+
+def create_post(client: TestClient, title: str = "제목") -> int:
+    response = client.post("/api/v1/posts", json={"title": title, "content": "내용"})
+    assert response.status_code == 201
+    return int(response.json()["data"]["postId"])
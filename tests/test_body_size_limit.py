@@ -0,0 +1,63 @@
+import asyncio
+import main
+from conftest import signup
+from utils import constants
+
+POST_LIMIT = constants.REQUEST_BODY_MAX_BYTES_POLICIES[("POST", "/api/v1/posts")]
+
+
+def test_content_length_over_limit(client):
+    signup(client)
+    response = client.post(
+        "/api/v1/posts",
+        content=b'{"title":"t","content":"' + b"x" * POST_LIMIT + b'"}',
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"]["message"] == "request_body_too_large"
+
+
+def test_chunked_body_over_limit_while_streaming(client):
+    # TestClient 는 본문을 미리 모아서 Content-Length 를 붙이므로 ASGI 앱을 직접 호출
+    signup(client)
+    session_id = client.cookies["session_id"]
+    chunks = [b'{"title":"t","content":"'] + [b"x" * 8192] * 64 + [b'"}']
+    consumed = 0
+    sent = []
+
+    async def receive():
+        nonlocal consumed
+        index = consumed
+        consumed += 1
+        return {"type": "http.request", "body": chunks[index], "more_body": index < len(chunks) - 1}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/posts",
+        "raw_path": b"/api/v1/posts",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"transfer-encoding", b"chunked"),
+            (b"cookie", f"session_id={session_id}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(main.app(scope, receive, send))
+
+    assert sent[0]["status"] == 413
+    # 최대 크기를 넘는 순간 멈추고 나머지 본문은 읽지 않음 (앞부분 + 8KB 조각 8개에서 넘음)
+    assert consumed == 1 + POST_LIMIT // 8192
+    assert consumed < len(chunks)
+    assert b"request_body_too_large" in b"".join(message.get("body", b"") for message in sent[1:])
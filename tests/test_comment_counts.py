@@ -0,0 +1,47 @@
+import asyncio
+from conftest import signup, create_post
+from repositories.database import get_connection
+from repositories.posts import comment_counts, post_cache
+from utils import constants
+import utils.metrics
+
+
+def _comment_count(post_id: int) -> int:
+    return get_connection().execute("SELECT comment_count FROM posts WHERE post_id = ?", (post_id,)).fetchone()[0]
+
+
+def test_triggers_keep_comment_count(client):
+    signup(client)
+    post_id = create_post(client)
+    comments_url = f"/api/v1/posts/{post_id}/comments"
+
+    first = client.post(comments_url, json={"content": "댓글1"}).json()["data"]["commentId"]
+    client.post(comments_url, json={"content": "댓글2"})
+    assert _comment_count(post_id) == 2
+
+    assert client.delete(f"{comments_url}/{first}").status_code == 200
+    assert _comment_count(post_id) == 1
+    assert client.get(f"/api/v1/posts/{post_id}").json()["data"]["commentCount"] == 1
+
+
+def test_reconcile_repairs_counts_across_batches(client, monkeypatch):
+    signup(client)
+    post_ids = [create_post(client) for _ in range(5)]
+    client.post(f"/api/v1/posts/{post_ids[0]}/comments", json={"content": "댓글"})
+    client.post(f"/api/v1/posts/{post_ids[4]}/comments", json={"content": "댓글"})
+    # 트리거가 없던 예전 DB 나 직접 수정한 데이터처럼 어긋난 값
+    connection = get_connection()
+    with connection:
+        connection.execute("UPDATE posts SET comment_count = 7 WHERE post_id IN (?, ?)", (post_ids[0], post_ids[3]))
+        connection.execute("UPDATE posts SET comment_count = 0 WHERE post_id = ?", (post_ids[4],))
+    post_cache.find_post_by_id(post_ids[3], 0)
+
+    monkeypatch.setattr(constants, "COMMENT_COUNT_RECONCILE_BATCH_SIZE", 2)
+    repairs_before = utils.metrics.comment_count_repairs_total._values.get((), 0)
+    assert asyncio.run(comment_counts.reconcile()) == 3
+
+    assert [_comment_count(post_id) for post_id in post_ids] == [1, 0, 0, 0, 1]
+    assert utils.metrics.comment_count_repairs_total._values[()] == repairs_before + 3
+    assert post_ids[3] not in post_cache._posts._entries
+    # 모두 맞으면 바꾸지 않음
+    assert asyncio.run(comment_counts.reconcile()) == 0
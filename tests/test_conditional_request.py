@@ -0,0 +1,72 @@
+from fastapi.testclient import TestClient
+import main
+from conftest import signup, create_post
+from repositories.posts import post_counters
+
+
+def _read_post(client: TestClient, post_id: int, **headers):
+    return client.get(f"/api/v1/posts/{post_id}", headers=headers)
+
+
+def test_matching_if_none_match_returns_304_without_body(client):
+    signup(client)
+    post_id = create_post(client)
+    etag = _read_post(client, post_id).headers["ETag"]
+
+    response = _read_post(client, post_id, **{"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since(client):
+    signup(client)
+    post_id = create_post(client)
+    first = _read_post(client, post_id)
+    etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+
+    # If-Modified-Since 는 최신이어도 ETag 가 다르면 200
+    response = _read_post(client, post_id, **{"If-None-Match": 'W/"post-0-v0-0"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    # If-Modified-Since 가 오래되었어도 ETag 가 같으면 304
+    response = _read_post(client, post_id, **{"If-None-Match": etag, "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+    assert response.status_code == 304
+    # If-None-Match 가 없으면 If-Modified-Since 로 판단
+    assert _read_post(client, post_id, **{"If-Modified-Since": last_modified}).status_code == 304
+
+
+def test_etag_changes_after_like_and_comment(client):
+    signup(client)
+    post_id = create_post(client)
+    etag = _read_post(client, post_id).headers["ETag"]
+
+    # 좋아요를 누른 사용자는 likedByMe 가 바뀌므로 바로 다른 ETag
+    assert client.patch(f"/api/v1/posts/{post_id}/like").status_code == 200
+    liked_etag = _read_post(client, post_id).headers["ETag"]
+    assert liked_etag != etag
+    # DB 에 반영되면 버전이 바뀜
+    post_counters.flush()
+    flushed_etag = _read_post(client, post_id).headers["ETag"]
+    assert flushed_etag != liked_etag
+
+    assert client.post(f"/api/v1/posts/{post_id}/comments", json={"content": "댓글"}).status_code == 201
+    response = _read_post(client, post_id, **{"If-None-Match": flushed_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != flushed_etag
+    assert response.json()["data"]["commentCount"] == 1
+
+
+def test_no_304_while_likes_are_pending(client):
+    signup(client)
+    post_id = create_post(client)
+    other = TestClient(main.app)
+    signup(other, 2)
+    etag = _read_post(other, post_id).headers["ETag"]
+
+    # 다른 사용자의 좋아요가 아직 DB 에 반영되지 않아 버전(ETag)은 그대로지만 좋아요 수는 바뀜
+    assert client.patch(f"/api/v1/posts/{post_id}/like").status_code == 200
+    assert post_counters.has_pending_likes(post_id)
+    response = _read_post(other, post_id, **{"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+    assert response.json()["data"]["likeCount"] == 1
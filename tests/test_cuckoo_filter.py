@@ -0,0 +1,30 @@
+from utils.cuckoo_filter import CuckooFilter
+
+
+def test_add_and_lookup():
+    cuckoo = CuckooFilter(1000)
+    keys = [f"user{number}@example.com" for number in range(1000)]
+    assert all(cuckoo.add(key) for key in keys)
+
+    assert len(cuckoo) == 1000
+    assert all(key in cuckoo for key in keys)
+    # 없는 키는 거의 항상 "없음" (오탐률 약 0.012%)
+    false_positives = sum(f"absent{number}@example.com" in cuckoo for number in range(10_000))
+    assert false_positives <= 10
+
+
+def test_failed_add_rolls_back():
+    cuckoo = CuckooFilter(64)
+    keys = []
+    while True:
+        key = f"key{len(keys)}"
+        slots_before = cuckoo._slots.tolist()
+        if not cuckoo.add(key):
+            break
+        keys.append(key)
+
+    # 자리를 못 찾은 키는 밀어낸 지문을 모두 원래 자리로 되돌림 (기존 키가 사라지지 않음)
+    assert cuckoo._slots.tolist() == slots_before
+    assert len(cuckoo) == len(keys)
+    assert all(key in cuckoo for key in keys)
+    assert len(keys) >= len(cuckoo._slots) * 0.9
@@ -0,0 +1,26 @@
+import pytest
+from fastapi import HTTPException
+from utils.cursor import encode_cursor
+from utils.validator import cursor_validator
+from utils.validator.request_validator import validate_cursor
+
+CREATED_AT = "2026-01-01T00:00:00.000Z"
+
+
+def test_valid_cursor():
+    assert cursor_validator.validate_cursor(encode_cursor(CREATED_AT, "3"))
+    assert cursor_validator.validate_cursor(encode_cursor(CREATED_AT, str(2 ** 63 - 1)))
+
+
+@pytest.mark.parametrize("item_id", ["-1", str(2 ** 63), str(2 ** 64)])
+def test_out_of_range_id(item_id):
+    assert not cursor_validator.validate_cursor(encode_cursor(CREATED_AT, item_id))
+
+
+def test_oversized_id_returns_422():
+    # SQLite 정수 범위를 넘는 id 는 바인딩 전에 422 (OverflowError -> 500 방지)
+    with pytest.raises(HTTPException) as error:
+        validate_cursor(encode_cursor(CREATED_AT, str(2 ** 64)))
+
+    assert error.value.status_code == 422
+    assert error.value.detail["message"] == "invalid_cursor_format"
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+from utils import password
+
+
+def test_pending_count_kept_until_cancelled_job_finishes():
+    release = threading.Event()
+
+    async def scenario():
+        task = asyncio.create_task(password._run_in_executor(release.wait))
+        await asyncio.sleep(0.05)
+        assert password._pending_count == 1
+
+        # 요청이 취소되어도 스레드의 작업은 계속 실행 중이므로 대기 작업 수는 그대로
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert task.cancelled()
+        assert password._pending_count == 1
+
+        release.set()
+        for _ in range(100):
+            if password._pending_count == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert password._pending_count == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        # 실패해도 작업 스레드가 끝나도록 (남아 있으면 종료 시 멈춤)
+        release.set()
+
+
+def test_pending_count_released_after_result():
+    async def scenario():
+        assert await password._run_in_executor(sum, (1, 2)) == 3
+        assert password._pending_count == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,76 @@
+from conftest import signup, create_post
+from repositories.posts import post_cache, post_repository
+from utils.ttl_cache import TTLCache
+import utils.metrics
+
+
+def _evictions(cache_name: str, reason: str) -> float:
+    return utils.metrics.cache_evictions_total._values.get((cache_name, reason), 0)
+
+
+def test_detail_reloaded_when_version_changes(client):
+    signup(client)
+    post_id = create_post(client, "처음")
+    version = post_repository.find_post_validators(post_id)["version"]
+    assert post_cache.find_post_by_id(post_id, version)["title"] == "처음"
+
+    assert client.put(f"/api/v1/posts/{post_id}", json={"title": "수정", "content": "내용"}).status_code == 200
+    # 수정 요청이 캐시를 지우지 않은 경우(다른 워커에서 수정)를 흉내 내려고 예전 항목을 다시 넣음
+    post_cache._posts.set(post_id, (version, {"postId": str(post_id), "title": "처음"}))
+    assert post_cache.find_post_by_id(post_id, version)["title"] == "처음"
+
+    new_version = post_repository.find_post_validators(post_id)["version"]
+    assert new_version != version
+    assert post_cache.find_post_by_id(post_id, new_version)["title"] == "수정"
+
+
+def test_offset_pages_invalidated_on_create_and_delete(client):
+    signup(client)
+    first = create_post(client)
+    assert [int(post["postId"]) for post in post_cache.find_posts(0, 10)] == [first]
+
+    second = create_post(client)
+    assert ("offset", 0, 10) not in post_cache._pages._entries
+    assert [int(post["postId"]) for post in post_cache.find_posts(0, 10)] == [second, first]
+
+    # 삭제된 게시글이 들어 있지 않은 offset 목록도 한 칸씩 밀리므로 삭제
+    post_cache.find_posts(0, 1)
+    assert client.delete(f"/api/v1/posts/{first}").status_code == 200
+    assert ("offset", 0, 10) not in post_cache._pages._entries
+    assert ("offset", 0, 1) not in post_cache._pages._entries
+    assert [int(post["postId"]) for post in post_cache.find_posts(0, 10)] == [second]
+
+
+def test_cursor_pages_dropped_by_invalidate_post(client):
+    signup(client)
+    older = create_post(client)
+    newer = create_post(client)
+    newest = create_post(client)
+    cursor_post = post_repository.find_post_by_id(newest)
+
+    page = post_cache.find_posts_after(cursor_post["createdAt"], newest, 10)
+    assert [int(post["postId"]) for post in page] == [newer, older]
+    key = ("cursor", cursor_post["createdAt"], newest, 10)
+
+    # 목록에 없는 게시글이 바뀐 경우는 그대로
+    post_cache.invalidate_post(newest)
+    assert key in post_cache._pages._entries
+
+    post_cache.invalidate_post(older)
+    assert key not in post_cache._pages._entries
+
+
+def test_lru_eviction_counted_in_metric():
+    cache = TTLCache("test_lru", max_entries=2, ttl_seconds=60)
+    before = _evictions("test_lru", "capacity")
+
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"  # 1 을 최근에 사용 -> 가장 오래 사용하지 않은 항목은 2
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+    assert _evictions("test_lru", "capacity") == before + 1
+    assert utils.metrics.cache_entries._values[("test_lru",)] == 2
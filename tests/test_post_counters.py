@@ -0,0 +1,69 @@
+import sqlite3
+from fastapi.testclient import TestClient
+import main
+from conftest import signup, create_post
+from repositories.posts import post_counters, post_repository
+
+
+def test_merge_counts_adds_pending_views_and_likes(client):
+    user_id = int(signup(client))
+    post_id = create_post(client)
+    post = post_repository.find_post_by_id(post_id)
+
+    post_counters.add_view(post_id)
+    post_counters.add_view(post_id)
+    post_counters.set_liked(post_id, user_id, True)
+
+    merged = post_counters.merge_counts(post)
+    assert (merged["viewCount"], merged["likeCount"]) == (2, 1)
+    # 원본(캐시 항목)은 바꾸지 않음
+    assert (post["viewCount"], post["likeCount"]) == (0, 0)
+    # 증가분이 없는 게시글은 복사하지 않고 그대로
+    untouched = post_repository.find_post_by_id(create_post(client))
+    assert post_counters.merge_counts(untouched) is untouched
+
+
+def test_deltas_merged_back_after_flush_error(client, monkeypatch):
+    user_id = int(signup(client))
+    post_id = create_post(client)
+    index = post_id % len(post_counters._shards)
+    post_counters.add_view(post_id)
+    post_counters.set_liked(post_id, user_id, True)
+
+    def fail(*args):
+        # 반영하는 사이에 들어온 최신 요청 (좋아요 취소가 이전 좋아요보다 우선)
+        post_counters.add_view(post_id)
+        post_counters.set_liked(post_id, user_id, False)
+        raise sqlite3.OperationalError("database is locked")
+
+    apply_counter_deltas = post_repository.apply_counter_deltas
+    monkeypatch.setattr(post_repository, "apply_counter_deltas", fail)
+    post_counters._flush_shard(index)
+
+    assert post_counters._shards[index][post_id][:2] == [2, 0]
+    assert post_counters.pending_likers(post_id) == {user_id: False}
+    assert post_counters._shard_pending_counts[index] == 4
+    assert post_counters._pending_count == 4
+
+    monkeypatch.setattr(post_repository, "apply_counter_deltas", apply_counter_deltas)
+    post_counters._flush_shard(index)
+    post = post_repository.find_post_by_id(post_id)
+    assert (post["viewCount"], post["likeCount"]) == (2, 0)
+    assert post_counters._pending_count == 0
+
+
+def test_final_flush_on_shutdown_saves_pending_counts(database_path):
+    with TestClient(main.app) as client:
+        signup(client)
+        post_id = create_post(client)
+        assert client.patch(f"/api/v1/posts/{post_id}/like").status_code == 200
+        assert client.get(f"/api/v1/posts/{post_id}").status_code == 200
+        assert post_counters._pending_count > 0
+
+    # 종료 후 연결이 닫혔으므로 새 연결로 확인
+    connection = sqlite3.connect(database_path)
+    row = connection.execute("SELECT view_count, like_count FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+    likes = connection.execute("SELECT COUNT(*) FROM post_likes WHERE post_id = ?", (post_id,)).fetchone()
+    connection.close()
+    assert row == (1, 1)
+    assert likes == (1,)
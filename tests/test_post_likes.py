@@ -0,0 +1,60 @@
+import sqlite3
+from conftest import signup, create_post
+from repositories.posts import post_counters, post_likes, post_repository
+
+
+def _like_count(database_path: str, post_id: int) -> tuple[int, int]:
+    connection = sqlite3.connect(database_path)
+    like_count = connection.execute("SELECT like_count FROM posts WHERE post_id = ?", (post_id,)).fetchone()[0]
+    rows = connection.execute("SELECT COUNT(*) FROM post_likes WHERE post_id = ?", (post_id,)).fetchone()[0]
+    connection.close()
+    return like_count, rows
+
+
+def test_like_unlike_like_within_one_flush(client, database_path):
+    signup(client)
+    post_id = create_post(client)
+
+    for action in ("like", "unlike", "like"):
+        assert client.patch(f"/api/v1/posts/{post_id}/{action}").status_code == 200
+    post_counters.flush()
+
+    assert _like_count(database_path, post_id) == (1, 1)
+    assert client.get(f"/api/v1/posts/{post_id}").json()["data"]["likeCount"] == 1
+
+
+def test_like_twice_returns_403(client):
+    signup(client)
+    post_id = create_post(client)
+
+    assert client.patch(f"/api/v1/posts/{post_id}/like").status_code == 200
+    response = client.patch(f"/api/v1/posts/{post_id}/like")
+    assert response.status_code == 403
+    assert response.json()["detail"]["message"] == "already_liked"
+
+    # DB 에 반영된 뒤에도 같음
+    post_counters.flush()
+    assert client.patch(f"/api/v1/posts/{post_id}/like").status_code == 403
+
+
+def test_mark_liked_by_me_for_pending_and_flushed_likes(client):
+    user_id = int(signup(client))
+    flushed, pending, unliked, untouched = (create_post(client) for _ in range(4))
+    post_likes.like(flushed, user_id)
+    post_likes.like(unliked, user_id)
+    post_counters.flush()
+    post_likes.like(pending, user_id)
+    post_likes.unlike(unliked, user_id)
+
+    def liked_by_me() -> dict:
+        posts = [post_repository.find_post_by_id(post_id) for post_id in (flushed, pending, unliked, untouched)]
+        return {int(post["postId"]): post["likedByMe"] for post in post_likes.mark_liked_by_me(posts, user_id)}
+
+    expected = {flushed: True, pending: True, unliked: False, untouched: False}
+    assert liked_by_me() == expected
+    # 캐시에서 빠진 뒤 DB 에서 다시 읽어도 아직 반영하지 않은 변경이 덧씌워짐
+    post_likes._likers._entries.clear()
+    assert liked_by_me() == expected
+    # 다른 사용자에게는 False
+    other = post_likes.mark_liked_by_me([post_repository.find_post_by_id(flushed)], user_id + 1)
+    assert other[0]["likedByMe"] is False
@@ -0,0 +1,17 @@
+import os
+import pytest
+from utils import profiler
+
+
+@pytest.mark.parametrize("request_id", ["../../etc/passwd", "/tmp/x", "..\\..\\x", "a/b", ""])
+def test_file_name_id_stays_in_output_dir(request_id):
+    name = profiler._file_name_id(request_id)
+    assert name
+    assert os.path.basename(name) == name
+    assert ".." not in name
+    assert all(char.isalnum() or char in "_-" for char in name)
+
+
+def test_file_name_id_keeps_safe_request_id():
+    assert profiler._file_name_id("6483337a225a4f4b-req_1") == "6483337a225a4f4b-req_1"
+    assert len(profiler._file_name_id("a" * 200)) == 64
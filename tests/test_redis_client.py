@@ -0,0 +1,59 @@
+import asyncio
+import pytest
+from utils.redis_client import RedisConnectionPool
+
+
+async def _start_server(close_after_reply: bool):
+    """PING 에 +PONG 으로 답하는 최소 RESP 서버 (close_after_reply : 답한 뒤 연결을 닫음 - 서버 idle timeout 흉내)"""
+    writers = []
+
+    async def handle(reader, writer):
+        writers.append(writer)
+        while await reader.readline():
+            await reader.readline()
+            await reader.readline()
+            writer.write(b"+PONG\r\n")
+            await writer.drain()
+            if close_after_reply:
+                break
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], writers
+
+
+def test_retry_once_when_idle_connection_was_closed():
+    async def scenario():
+        server, port, writers = await _start_server(close_after_reply=True)
+        pool = RedisConnectionPool("127.0.0.1", port, max_connections=1)
+        try:
+            assert await pool.execute("PING") == "PONG"
+            await asyncio.sleep(0.05)
+            # 풀에 남은 연결은 서버가 이미 닫음 -> 새 연결로 다시 시도
+            assert await pool.execute("PING") == "PONG"
+            assert len(writers) == 2
+        finally:
+            await pool.close()
+            server.close()
+
+    asyncio.run(scenario())
+
+
+def test_no_retry_on_new_connection():
+    async def scenario():
+        async def close_at_once(reader, writer):
+            writer.close()
+
+        server = await asyncio.start_server(close_at_once, "127.0.0.1", 0)
+        pool = RedisConnectionPool("127.0.0.1", server.sockets[0].getsockname()[1], max_connections=1)
+        try:
+            with pytest.raises(ConnectionError):
+                await pool.execute("PING")
+            # 실패한 연결의 자리는 반환됨
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(pool.execute("PING"), 1)
+        finally:
+            await pool.close()
+            server.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,44 @@
+import pytest
+from fastapi import HTTPException
+from utils.validator.request_body import SignupRequest, PostRequest, CommentRequest
+from utils.validator.request_validator import validate_request_body
+
+SIGNUP = '"email":"user@example.com","password":"Passw0rd!","nickname":"nick"'
+POST = '"title":"제목","content":"내용"'
+
+
+@pytest.mark.parametrize("model, raw_body, status_code, message", [
+    # 누락 또는 null -> 400 missing_required_field
+    (SignupRequest, '{"password":"Passw0rd!","nickname":"nick"}', 400, "missing_required_field"),
+    (SignupRequest, '{"email":null,"password":"Passw0rd!","nickname":"nick"}', 400, "missing_required_field"),
+    (PostRequest, '{"title":"제목"}', 400, "missing_required_field"),
+    (CommentRequest, '{}', 400, "missing_required_field"),
+    # 형식 오류 -> 422 invalid_<field>_format
+    (SignupRequest, '{"email":"user","password":"Passw0rd!","nickname":"nick"}', 422, "invalid_email_format"),
+    (SignupRequest, '{"email":"user@example.com","password":"short","nickname":"nick"}', 422, "invalid_password_format"),
+    (SignupRequest, '{"email":"user@example.com","password":"Passw0rd!","nickname":"ni ck"}', 422, "invalid_nickname_format"),
+    (SignupRequest, '{' + SIGNUP + ',"profileImageUrl":""}', 422, "invalid_profile_image_url_format"),
+    (PostRequest, '{"title":"' + "x" * 30 + '","content":"내용"}', 422, "invalid_title_format"),
+    (PostRequest, '{"title":"제목","content":""}', 422, "invalid_content_format"),
+    (PostRequest, '{' + POST + ',"postImageUrl":""}', 422, "invalid_post_image_url_format"),
+    # 자료형 오류, 잘못된 JSON, 객체가 아닌 본문 -> 400 invalid_parameter
+    (SignupRequest, '{"email":1,"password":"Passw0rd!","nickname":"nick"}', 400, "invalid_parameter"),
+    (PostRequest, '{"title":["제목"],"content":"내용"}', 400, "invalid_parameter"),
+    (PostRequest, '{"title":"제목",', 400, "invalid_parameter"),
+    (PostRequest, '', 400, "invalid_parameter"),
+    (PostRequest, '["제목","내용"]', 400, "invalid_parameter"),
+    # 오류가 여러 개면 예전 검증 순서상 첫 번째 필드의 오류
+    (SignupRequest, '{"email":"user","password":1}', 422, "invalid_email_format"),
+    (SignupRequest, '{"email":1,"password":"short"}', 400, "invalid_parameter"),
+])
+def test_error_mapping(model, raw_body, status_code, message):
+    with pytest.raises(HTTPException) as error:
+        validate_request_body(model, raw_body.encode("utf-8"))
+
+    assert error.value.status_code == status_code
+    assert error.value.detail["message"] == message
+
+
+def test_valid_body_ignores_unknown_fields():
+    body = validate_request_body(SignupRequest, ('{' + SIGNUP + ',"role":"admin"}').encode("utf-8"))
+    assert (body.email, body.nickname, body.profileImageUrl) == ("user@example.com", "nick", None)
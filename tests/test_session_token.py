@@ -0,0 +1,78 @@
+import types
+import pytest
+from utils import session_token
+from utils.session_token import RevocationList, SessionTokenSigner, _b64decode, _b64encode
+
+USER_DATA = {"userId": "7", "email": "user@example.com", "nickname": "닉네임"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """session_token 모듈이 보는 시계 (time.time / time.monotonic) 를 직접 움직임"""
+    now = types.SimpleNamespace(value=1_800_000_000.0)
+    monkeypatch.setattr(session_token, "time", types.SimpleNamespace(time=lambda: now.value, monotonic=lambda: now.value))
+    return now
+
+
+def test_issue_and_verify(clock):
+    signer = SessionTokenSigner(b"secret", session_timeout_seconds=60)
+    token = signer.issue("user@example.com", USER_DATA)
+
+    assert signer.verify(token) == {"user_id": "user@example.com", "user_data": USER_DATA}
+    # 토큰 ID 가 다르므로 같은 사용자라도 토큰은 매번 다름
+    assert signer.issue("user@example.com", USER_DATA) != token
+    # 다른 키로 서명한 토큰은 거부
+    assert SessionTokenSigner(b"other", session_timeout_seconds=60).verify(token) is None
+
+
+def test_expired_token_rejected(clock):
+    signer = SessionTokenSigner(b"secret", session_timeout_seconds=60)
+    token = signer.issue("user@example.com", USER_DATA)
+
+    clock.value += 60
+    assert signer.verify(token) is not None
+    clock.value += 1
+    assert signer.verify(token) is None
+
+
+def test_tampered_token_rejected(clock):
+    signer = SessionTokenSigner(b"secret", session_timeout_seconds=60)
+    encoded_payload, encoded_signature = signer.issue("user@example.com", USER_DATA).split(".")
+
+    payload = _b64decode(encoded_payload).replace(b'"u":"7"', b'"u":"1"')
+    assert signer.verify(f"{_b64encode(payload)}.{encoded_signature}") is None
+    signature = bytearray(_b64decode(encoded_signature))
+    signature[0] ^= 1
+    assert signer.verify(f"{encoded_payload}.{_b64encode(bytes(signature))}") is None
+
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b.c", "!!!.???", "e30.e30"])
+def test_malformed_token_rejected(token):
+    signer = SessionTokenSigner(b"secret", session_timeout_seconds=60)
+    assert signer.verify(token) is None
+    assert signer.revoke(token) is False
+
+
+def test_revoked_token_rejected(clock):
+    signer = SessionTokenSigner(b"secret", session_timeout_seconds=60)
+    token = signer.issue("user@example.com", USER_DATA)
+    other = signer.issue("user@example.com", USER_DATA)
+
+    assert signer.revoke(token)
+    assert signer.verify(token) is None
+    assert signer.verify(other) is not None
+
+
+def test_revocation_list_rotation(clock):
+    revocations = RevocationList(size_bits=1 << 12, hash_count=4, rotate_seconds=60)
+    revocations.revoke("old")
+
+    # 한 번 교체된 뒤에도 이전 필터에 남아 있음 (아직 만료되지 않은 토큰)
+    clock.value += 60
+    assert revocations.is_revoked("old")
+    revocations.revoke("new")
+
+    # 두 번 교체되면 버려짐 (그 토큰은 이미 만료 시각이 지남)
+    clock.value += 60
+    assert not revocations.is_revoked("old")
+    assert revocations.is_revoked("new")
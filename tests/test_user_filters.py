@@ -0,0 +1,73 @@
+import asyncio
+from repositories import database
+from repositories.users import user_repository
+from utils import constants
+
+
+def _key_version() -> int:
+    return user_repository._read_key_version(database.get_connection())
+
+
+def test_key_version_bumped_only_when_key_changes(database_path):
+    user = user_repository.insert_user("user@example.com", "hash", "Nick", None)
+    user_id = int(user["userId"])
+    version = _key_version()
+
+    # 대소문자만 바꾸면 nickname_key 가 같으므로 그대로
+    assert user_repository.update_nickname(user_id, "NICK")
+    assert _key_version() == version
+    assert user_repository.update_nickname(user_id, "other")
+    assert _key_version() == version + 1
+
+
+def test_old_update_trigger_replaced(database_path):
+    # 예전 트리거가 있는 DB 를 다시 열면 새 트리거로 교체
+    connection = database.get_connection()
+    connection.executescript(
+        "CREATE TRIGGER trg_users_update_key_version AFTER UPDATE OF email, nickname_key ON users "
+        "BEGIN UPDATE user_stats SET key_version = key_version + 1 WHERE id = 1; END;"
+    )
+    database.close_connection()
+
+    triggers = {
+        row[0] for row in database.get_connection().execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    }
+    assert "trg_users_update_key_version" not in triggers
+    assert "trg_users_update_changed_key_version" in triggers
+
+
+def test_full_filter_rebuilt_in_background(database_path, monkeypatch):
+    # 버킷 2개(8칸)짜리 필터 -> 이메일 몇 개만 추가해도 가득 참
+    monkeypatch.setattr(constants, "USER_FILTER_MIN_CAPACITY", 4)
+    user_repository.build_filters()
+    small_filter = user_repository._email_filter
+
+    def build_on_event_loop():
+        raise AssertionError("가득 찬 필터를 이벤트 루프에서 다시 생성함")
+
+    async def scenario():
+        emails = []
+        for number in range(40):
+            email = f"user{number}@example.com"
+            assert user_repository.insert_user(email, "hash", f"user{number}", None) is not None
+            emails.append(email)
+            if user_repository._email_filter is None:
+                break
+
+        # 다시 생성하는 동안에는 DB 인덱스로 확인
+        assert user_repository._rebuild_task is not None
+        assert all(user_repository.exists_email(email) for email in emails)
+        assert not user_repository.exists_email("new@example.com")
+        # 생성 중에 추가된 키도 새 필터에 들어감
+        assert user_repository.insert_user("late@example.com", "hash", "late", None) is not None
+
+        await user_repository._rebuild_task
+        return emails + ["late@example.com"]
+
+    monkeypatch.setattr(user_repository, "build_filters", build_on_event_loop)
+    emails = asyncio.run(scenario())
+
+    assert user_repository._email_filter is not small_filter
+    assert all(email in user_repository._email_filter for email in emails)
+    assert "late" in user_repository._nickname_filter
+    assert not user_repository.exists_email("new@example.com")
@@ -0,0 +1,27 @@
+import hashlib
+
+
+class BloomFilter:
+    """블룸 필터 - "없음"은 확실하고, "있음"은 낮은 확률로 틀릴 수 있는 집합
+
+    키마다 해시 2개를 구해서 hash_count 개의 비트 위치를 만듦 (double hashing)
+    """
+
+    def __init__(self, size_bits: int, hash_count: int):
+        self._size_bits = size_bits
+        self._hash_count = hash_count
+        self._bits = bytearray((size_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hash_count):
+            yield (h1 + i * h2) % self._size_bits
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import HTTPException, Request
+
+# 조건부 GET (If-None-Match / If-Modified-Since -> 304)
+# ETag 는 약한 ETag (W/"...") - 조회수처럼 요청마다 바뀌는 값은 버전에 포함하지 않으므로 "의미상 같은 응답"만 보장
+# 로그인한 사용자만 보는 응답이므로 공유 캐시에는 저장하지 않고(private), 매번 서버에 확인(no-cache)
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """API 시간 형식(2026-01-01T00:00:00.000Z) -> UTC datetime"""
+    return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+
+
+def make_etag(kind: str, item_id: int, version: int, modified_at: str, variant: Optional[str] = None) -> str:
+    """예: W/"post-3-v5-20260101000000000" (DB 를 새로 만들어 id/버전이 겹쳐도 변경 시각으로 구분)
+
+    variant : 사용자마다 달라지는 응답 구분 (예: "liked" - 같은 브라우저에서 다른 사용자로 로그인해도 재사용하지 않음)
+    """
+    digits = "".join(char for char in modified_at if char.isdigit())
+    suffix = f"-{variant}" if variant else ""
+    return f'W/"{kind}-{item_id}-v{version}-{digits}{suffix}"'
+
+
+def validator_headers(etag: str, modified_at: str) -> dict:
+    """200/304 응답에 붙이는 검증자 헤더"""
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(_parse_timestamp(modified_at), usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+
+
+def _opaque_tag(etag: str) -> str:
+    # 약한 비교 : W/ 접두사를 빼고 따옴표 안의 값만 비교
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _if_modified_since(value: str) -> Optional[datetime]:
+    try:
+        since = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return since if since.tzinfo is not None else since.replace(tzinfo=timezone.utc)
+
+
+def is_not_modified(request: Request, etag: str, modified_at: str) -> bool:
+    """클라이언트가 가진 응답이 최신이면 True
+
+    If-None-Match 가 있으면 그것만 확인 (If-Modified-Since 는 무시, RFC 9110)
+    If-Modified-Since 는 초 단위로 비교 (같은 초 안의 변경은 ETag 로만 구분됨)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        opaque_tag = _opaque_tag(etag)
+        return any(_opaque_tag(tag.strip()) == opaque_tag for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        since = _if_modified_since(if_modified_since)
+        if since is None:
+            return False
+        return _parse_timestamp(modified_at).replace(microsecond=0) <= since
+
+    return False
+
+
+def not_modified(headers: dict) -> HTTPException:
+    """304 응답 (본문 없음, 검증자 헤더만 전송)"""
+    return HTTPException(status_code=304, headers=headers)
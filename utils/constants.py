@@ -1,4 +1,5 @@
 # python에서 변경되지않는 상수는 대문자 + snake_case로 작성하는게 관례
+import os
 
 # 이메일
 EMAIL_MIN_LENGTH = 5
@@ -15,6 +16,19 @@ PASSWORD_PATTERN = [
     r'[!@#$%^&*(),.?":{}|<>]',  # 특수문자
 ]
 
+# 비밀번호 해싱 알고리즘 : "bcrypt" 또는 "argon2"(argon2-cffi 필요)
+# 설정을 바꾸면 기존 해시는 그대로 검증되고, 로그인 성공 시 새 설정으로 다시 해싱됨
+PASSWORD_HASH_ALGORITHM = os.getenv("PASSWORD_HASH_ALGORITHM", "bcrypt")
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", str(19 * 1024)))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "1"))
+
+# 비밀번호 해싱 스레드 풀
+PASSWORD_HASH_WORKERS = min(4, os.cpu_count() or 1)
+# 대기 중인 해싱 작업이 이 수를 넘으면 503 응답 (로그인이 몰려도 다른 요청은 계속 처리)
+PASSWORD_HASH_MAX_PENDING = 32
+
 # 닉네임
 NICKNAME_MIN_LENGTH = 1
 NICKNAME_MAX_LENGTH = 10
@@ -23,14 +37,17 @@ NICKNAME_MAX_LENGTH = 10
 TITLE_MIN_LENGTH = 1
 TITLE_MAX_LENGTH = 26
 
-# 게시글 내용
+# 게시글/댓글 내용
 CONTENT_MIN_LENGTH = 1
+CONTENT_MAX_LENGTH = 10_000
 
 # 게시글 이미지 URL
 POST_IMAGE_URL_MIN_LENGTH = 1
+POST_IMAGE_URL_MAX_LENGTH = 2048
 
 # 프로필 이미지 URL
 PROFILE_IMAGE_URL_MIN_LENGTH = 1
+PROFILE_IMAGE_URL_MAX_LENGTH = 2048
 
 # HTTP 메서드
 HTTP_METHOD_GET = "GET"
@@ -39,6 +56,130 @@ HTTP_METHOD_PATCH = "PATCH"
 HTTP_METHOD_PUT = "PUT"
 HTTP_METHOD_DELETE = "DELETE"
 
-# 요청 횟수 제한
+# 요청 본문 최대 크기(바이트) - 넘으면 본문을 끝까지 읽지 않고 413 응답
+# 정책이 없는 경로의 기본값 (회원 관련 요청 본문은 수백 바이트)
+REQUEST_BODY_MAX_BYTES = 16 * 1024
+# 경로별 최대 크기 (HTTP 메서드, 경로 템플릿): 최대 바이트
+# 게시글/댓글 : 내용 CONTENT_MAX_LENGTH 자(UTF-8 한글 3바이트) + 제목 + 이미지 URL + JSON 여유분
+REQUEST_BODY_MAX_BYTES_POLICIES = {
+    ("POST", "/api/v1/posts"):                                  64 * 1024,
+    ("PUT", "/api/v1/posts/{post_id}"):                         64 * 1024,
+    ("POST", "/api/v1/posts/{post_id}/comments"):               64 * 1024,
+    ("PATCH", "/api/v1/posts/{post_id}/comments/{comment_id}"): 64 * 1024,
+}
+
+# 요청 횟수 제한 (정책이 없는 경로의 기본값)
 REQUESTS_MAX_COUNT = 5
-REQUESTS_TIME_WINDOW_SECONDS = 60
\ No newline at end of file
+REQUESTS_TIME_WINDOW_SECONDS = 60
+REQUESTS_BURST_COUNT = 5
+
+# 경로별 요청 횟수 제한 정책
+# (HTTP 메서드, 경로 템플릿): (시간 윈도우 동안 최대 요청 수, 시간 윈도우(초), 한 번에 연속 가능한 요청 수)
+# 로그인한 사용자는 userId 기준, 로그인하지 않은 사용자는 IP 기준으로 셈
+RATE_LIMIT_POLICIES = {
+    # 비밀번호 해싱/검증(bcrypt)이 있는 요청은 엄격하게
+    ("POST", "/api/v1/users/signup"):                           (5, 60, 3),
+    ("POST", "/api/v1/users/login"):                            (5, 60, 5),
+    ("PATCH", "/api/v1/users/me/password/{user_id}"):           (5, 60, 3),
+    # 회원가입 폼에서 입력할 때마다 호출되는 중복 확인
+    ("POST", "/api/v1/users/available/email"):                  (60, 60, 20),
+    ("POST", "/api/v1/users/available/user-nickname"):          (60, 60, 20),
+    # 조회 요청은 넉넉하게
+    ("GET", "/api/v1/users/me/{user_id}"):                      (120, 60, 30),
+    ("GET", "/api/v1/posts"):                                   (300, 60, 60),
+    ("GET", "/api/v1/posts/{post_id}"):                         (300, 60, 60),
+    ("GET", "/api/v1/posts/{post_id}/comments"):                (300, 60, 60),
+    # 작성/수정/삭제
+    ("POST", "/api/v1/posts"):                                  (10, 60, 5),
+    ("PUT", "/api/v1/posts/{post_id}"):                         (30, 60, 10),
+    ("DELETE", "/api/v1/posts/{post_id}"):                      (30, 60, 10),
+    ("PATCH", "/api/v1/posts/{post_id}/like"):                  (60, 60, 20),
+    ("PATCH", "/api/v1/posts/{post_id}/unlike"):                (60, 60, 20),
+    ("POST", "/api/v1/posts/{post_id}/comments"):               (30, 60, 10),
+    ("PATCH", "/api/v1/posts/{post_id}/comments/{comment_id}"): (30, 60, 10),
+    ("DELETE", "/api/v1/posts/{post_id}/comments/{comment_id}"): (30, 60, 10),
+}
+# 요청 횟수를 기억하는 최대 키(IP) 수 - 넘으면 가장 오래 요청하지 않은 키부터 삭제
+REQUESTS_MAX_TRACKED_KEYS = 100_000
+# 요청 제한 저장소 : "memory"(워커마다 따로) 또는 "redis"(모든 워커/서버가 공유)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+# redis 사용 시 로컬에 모은 요청 수를 반영하는 주기 (0 이면 요청마다 바로 반영)
+RATE_LIMIT_SYNC_INTERVAL_SECONDS = float(os.getenv("RATE_LIMIT_SYNC_INTERVAL_SECONDS", "0.2"))
+
+# 세션
+SESSION_TIMEOUT_SECONDS = 60 * 60 * 24       # 24시간
+SESSION_SHARD_COUNT = 16
+SESSION_CLEANUP_INTERVAL_SECONDS = 60
+# 세션 저장소 백엔드 : "memory"(프로세스 1개) 또는 "redis"(여러 워커/서버가 공유)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+# 세션 ID 방식 : "store"(저장소에 세션 저장) 또는 "signed"(HMAC 서명 토큰, 저장소 조회 없음)
+SESSION_TOKEN_MODE = os.getenv("SESSION_TOKEN_MODE", "store")
+# 서명 키 (설정하지 않으면 프로세스마다 새로 생성되므로 재시작/다른 워커에서는 기존 토큰이 무효)
+SESSION_SECRET_KEY = os.getenv("SESSION_SECRET_KEY")
+# 폐기된 서명 토큰 블룸 필터 (약 10만 개 폐기 시 오탐률 1% 수준)
+SESSION_REVOCATION_BLOOM_SIZE_BITS = 1 << 20
+SESSION_REVOCATION_BLOOM_HASH_COUNT = 7
+
+# Redis (환경 변수로 설정)
+REDIS_HOST = os.getenv("REDIS_HOST", "127.0.0.1")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+REDIS_SESSION_DB = int(os.getenv("REDIS_SESSION_DB", "0"))
+REDIS_RATE_LIMIT_DB = int(os.getenv("REDIS_RATE_LIMIT_DB", "1"))
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "10"))
+
+# 데이터베이스 (SQLite 파일 경로)
+DATABASE_PATH = "community.db"
+# SQLite INTEGER 최댓값 (64비트 부호 있는 정수, 이보다 큰 값은 바인딩할 때 OverflowError)
+SQLITE_INTEGER_MAX = 2 ** 63 - 1
+
+# 게시글 조회 캐시 (워커마다 따로 가지므로 다른 워커의 변경은 유효 시간이 지나야 반영됨)
+POST_CACHE_MAX_ENTRIES = 10_000
+POST_CACHE_TTL_SECONDS = 60
+# 목록 캐시 (페이지 단위, 다른 워커에서 늘어난 조회수는 이 시간만큼 늦게 반영됨)
+POST_LIST_CACHE_MAX_ENTRIES = 1_000
+POST_LIST_CACHE_TTL_SECONDS = 10
+# 게시글별 좋아요를 누른 사용자 집합 캐시 (다른 워커의 좋아요는 유효 시간이 지나야 반영됨)
+POST_LIKERS_CACHE_MAX_ENTRIES = 10_000
+POST_LIKERS_CACHE_TTL_SECONDS = 60
+
+# 게시글 조회수/좋아요 수 증가분 모아서 쓰기 (write-behind)
+# 요청마다 UPDATE 하지 않고 메모리에 모았다가 주기적으로 한 번에 반영
+# 프로세스가 비정상 종료되면 반영하지 못한 증가분은 사라짐 (최대 : 반영 주기 동안의 증가분 또는 POST_COUNTER_MAX_PENDING 개)
+POST_COUNTER_SHARD_COUNT = 16
+POST_COUNTER_FLUSH_INTERVAL_SECONDS = float(os.getenv("POST_COUNTER_FLUSH_INTERVAL_SECONDS", "1.0"))
+# 쌓인 증가분이 이 수를 넘으면 주기를 기다리지 않고 바로 반영
+POST_COUNTER_MAX_PENDING = 10_000
+
+# 게시글 댓글 수(comment_count) 점검 주기 / 한 번에 점검할 게시글 수 (앱 시작 시 한 번 + 주기마다)
+COMMENT_COUNT_RECONCILE_INTERVAL_SECONDS = float(os.getenv("COMMENT_COUNT_RECONCILE_INTERVAL_SECONDS", "3600"))
+COMMENT_COUNT_RECONCILE_BATCH_SIZE = 1_000
+
+# 이메일/닉네임 사용 가능 여부 확인용 쿠쿠 필터 최소 용량 (사용자 수의 2배 또는 이 값 중 큰 값으로 생성)
+USER_FILTER_MIN_CAPACITY = 1 << 16
+# 다른 워커의 가입/닉네임 변경 확인 주기 (바뀌었으면 필터를 다시 생성, 그 전까지는 "사용 가능"으로 보일 수 있음)
+USER_FILTER_REFRESH_INTERVAL_SECONDS = float(os.getenv("USER_FILTER_REFRESH_INTERVAL_SECONDS", "5"))
+
+# 로깅
+LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
+# 레벨별 기록 비율 (요청이 많을 때 info 비율을 낮춰서 로그 양 조절)
+LOG_SAMPLE_RATES = {
+    "debug": float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.01")),
+    "info": float(os.getenv("LOG_INFO_SAMPLE_RATE", "1.0")),
+    "warning": 1.0,
+    "error": 1.0,
+}
+# 쓰기 대기 큐 크기 (가득 차면 새 기록은 버림)
+LOG_QUEUE_SIZE = 10_000
+# 쓰기 스레드가 쌓인 기록을 쓰는 주기(초)
+LOG_FLUSH_INTERVAL_SECONDS = 0.1
+
+# 요청 프로파일러 (기본 : 사용 안 함)
+# 요청 중 PROFILER_SAMPLE_RATE 비율 또는 PROFILER_HEADER 헤더에 PROFILER_TOKEN 을 보낸 요청만 프로파일링
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+PROFILER_TOKEN = os.getenv("PROFILER_TOKEN", "")
+PROFILER_HEADER = "X-Profile"
+# 스택 샘플링 주기(초)
+PROFILER_INTERVAL_SECONDS = 0.001
+# collapsed-stack 파일 저장 위치
+PROFILER_OUTPUT_DIR = os.getenv("PROFILER_OUTPUT_DIR", "profiles")
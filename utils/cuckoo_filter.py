@@ -0,0 +1,119 @@
+import hashlib
+import random
+from array import array
+
+
+class CuckooFilter:
+    """쿠쿠 필터 - 블룸 필터처럼 "없음"은 확실하고 "있음"은 낮은 확률로 틀릴 수 있는 집합
+
+    키마다 16비트 지문(fingerprint)을 후보 버킷 2개 중 하나에 저장 (버킷당 4칸)
+    두 번째 버킷은 첫 번째 버킷과 지문만으로 계산하므로, 자리를 옮길 때 원래 키가 필요 없음 (partial-key cuckoo hashing)
+    오탐률 ≒ 2 * 버킷 크기 / 2^16 ≒ 0.012%
+
+    블룸 필터와 달리 조회 시 버킷 2개만 확인하고 (같은 오탐률의 블룸 필터는 비트 13개),
+    가득 차면 add 가 False 를 반환하므로 오탐률이 조용히 나빠지기 전에 더 큰 필터로 다시 만들 수 있음
+    삭제는 지원하지 않음 (지운 키는 필터를 다시 만들 때 정리)
+    """
+
+    _BUCKET_SIZE = 4
+    _MAX_KICKS = 500
+
+    def __init__(self, capacity: int):
+        # 적재율 95% 이하를 유지하도록 버킷 수를 2의 거듭제곱으로 설정 (XOR 로 대체 버킷 계산)
+        bucket_count = 1
+        while bucket_count * self._BUCKET_SIZE * 0.95 < capacity:
+            bucket_count <<= 1
+
+        self._mask = bucket_count - 1
+        # 0 은 빈 칸
+        self._slots = array("H", bytes(bucket_count * self._BUCKET_SIZE * 2))
+        self._count = 0
+
+    def _fingerprint_and_index(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        fingerprint = (value >> 48) or 1
+        return fingerprint, value & self._mask
+
+    def _alt_index(self, index: int, fingerprint: int) -> int:
+        return (index ^ (fingerprint * 0x5BD1E995)) & self._mask
+
+    def _bucket_has(self, index: int, fingerprint: int) -> bool:
+        start = index * self._BUCKET_SIZE
+        return fingerprint in self._slots[start:start + self._BUCKET_SIZE]
+
+    def _bucket_insert(self, index: int, fingerprint: int) -> bool:
+        start = index * self._BUCKET_SIZE
+        for slot in range(start, start + self._BUCKET_SIZE):
+            if self._slots[slot] == 0:
+                self._slots[slot] = fingerprint
+                return True
+        return False
+
+    def add(self, key: str) -> bool:
+        """키 추가 (필터가 가득 차서 자리를 못 찾으면 False - 더 큰 필터로 다시 만들어야 함)"""
+        fingerprint, index = self._fingerprint_and_index(key)
+        alt_index = self._alt_index(index, fingerprint)
+
+        if self._bucket_insert(index, fingerprint) or self._bucket_insert(alt_index, fingerprint):
+            self._count += 1
+            return True
+
+        # 두 버킷이 모두 찼으면 기존 지문을 대체 버킷으로 밀어내며 빈 칸을 찾음
+        slots = self._slots
+        index = random.choice((index, alt_index))
+        kicked = []
+        for _ in range(self._MAX_KICKS):
+            slot = index * self._BUCKET_SIZE + random.randrange(self._BUCKET_SIZE)
+            kicked.append(slot)
+            fingerprint, slots[slot] = slots[slot], fingerprint
+            index = self._alt_index(index, fingerprint)
+            if self._bucket_insert(index, fingerprint):
+                self._count += 1
+                return True
+
+        # 실패 시 밀어낸 순서의 반대로 되돌려서 기존 키가 사라지지 않게 함
+        for slot in reversed(kicked):
+            fingerprint, slots[slot] = slots[slot], fingerprint
+        return False
+
+    def __contains__(self, key: str) -> bool:
+        fingerprint, index = self._fingerprint_and_index(key)
+        return self._bucket_has(index, fingerprint) or self._bucket_has(self._alt_index(index, fingerprint), fingerprint)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+if __name__ == "__main__":
+    # 실행 : python -m utils.cuckoo_filter [키 수]
+    # 앱과 같은 크기(키 수의 2배)의 필터로 추가/조회 시간과 오탐률, 가득 찰 때까지의 최대 적재율을 출력
+    import sys
+    import time
+
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    keys = [f"user{number}@example.com" for number in range(key_count)]
+    absent_keys = [f"absent{number}@example.net" for number in range(key_count)]
+    cuckoo = CuckooFilter(key_count * 2)
+
+    started = time.perf_counter()
+    for key in keys:
+        cuckoo.add(key)
+    add_time = (time.perf_counter() - started) / key_count
+
+    started = time.perf_counter()
+    for key in keys:
+        key in cuckoo
+    lookup_time = (time.perf_counter() - started) / key_count
+
+    false_positives = sum(key in cuckoo for key in absent_keys)
+    print(f"키 {key_count:,}개, 슬롯 {len(cuckoo._slots):,}개 (적재율 {key_count / len(cuckoo._slots):.0%})")
+    print(f"add     {add_time * 1e6:6.2f} us")
+    print(f"lookup  {lookup_time * 1e6:6.2f} us")
+    print(f"오탐률  {false_positives / key_count:.1e}")
+
+    full = CuckooFilter(key_count)
+    added = 0
+    while full.add(f"fill{added}"):
+        added += 1
+    print(f"add 가 처음 실패할 때의 적재율 {added / len(full._slots):.1%}")
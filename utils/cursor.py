@@ -0,0 +1,32 @@
+import base64
+from typing import Optional
+
+# 커서 페이지네이션에서 사용하는 불투명(opaque) 커서
+# 마지막으로 읽은 항목의 (createdAt, id)를 base64url 로 인코딩해서 전달
+_SEPARATOR = "|"
+
+
+def encode_cursor(created_at: str, item_id: str) -> str:
+    raw = f"{created_at}{_SEPARATOR}{item_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[tuple[str, int]]:
+    """커서 -> (createdAt, id), 형식이 잘못된 경우 None"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, item_id = raw.split(_SEPARATOR)
+        return created_at, int(item_id)
+    except (ValueError, UnicodeError):
+        return None
+
+
+def split_page(items: list[dict], limit: int, id_field: str) -> tuple[list[dict], Optional[str]]:
+    """limit + 1 개로 조회한 목록 -> (현재 페이지, 다음 페이지 커서)"""
+    if len(items) <= limit or limit == 0:
+        return items[:limit], None
+
+    page = items[:limit]
+    last = page[-1]
+    return page, encode_cursor(last["createdAt"], last[id_field])
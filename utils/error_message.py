@@ -14,6 +14,8 @@ invalid_credentials = "invalid_credentials"
 permission_denied = "permission_denied"
 def permission_denied_to(action: str) -> str:
     return f"permission_denied_to_{action}"
+already_liked = "already_liked"
+not_liked = "not_liked"
 
 # 404
 user_not_found = "user_not_found"
@@ -40,4 +42,7 @@ def invalid_input_format(field_name: str) -> str:
 rate_limit_exceeded = "rate_limit_exceeded"
 
 # 500
-internal_server_error = "internal_server_error"
\ No newline at end of file
+internal_server_error = "internal_server_error"
+
+# 503
+service_unavailable = "service_unavailable"
\ No newline at end of file
@@ -0,0 +1,77 @@
+import json
+from typing import Any
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from starlette.exceptions import HTTPException
+
+# orjson 은 선택 의존성 (없으면 표준 json 으로 직렬화)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트, 한글 등을 \\uXXXX 로 바꾸지 않음)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson 으로 직렬화하는 JSON 응답 (표준 json 보다 빠름)
+
+    content 가 bytes 이면 이미 직렬화된 JSON 으로 보고 그대로 전송 (encoded_response_schema 등)
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
+    """HTTPException 응답도 ORJSONResponse 로 직렬화 (FastAPI 기본 처리기와 같은 형식 {"detail": ...})"""
+    headers = getattr(exc, "headers", None)
+    # 본문이 없어야 하는 상태 코드 (204, 304 등)
+    if exc.status_code < 200 or exc.status_code in (204, 205, 304):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+# 한글 게시글 100개 목록 응답을 만드는 시간 비교 (JSONResponse vs ORJSONResponse)
+# 실행 : python -m utils.json_response
+if __name__ == "__main__":
+    import time
+    from utils.response_schema import response_schema
+
+    posts = [
+        {
+            "postId": str(number),
+            "userId": "7",
+            "title": f"안녕하세요 오늘의 게시글 제목입니다 {number}",
+            "content": "한국어 본문 내용이 길게 들어갑니다. " * 20,
+            "postImageUrl": f"https://example.com/img/{number}.png",
+            "likeCount": number,
+            "commentCount": 3,
+            "viewCount": 100 + number,
+            "createdAt": "2026-01-01T00:00:00.000Z",
+            "updatedAt": "2026-01-01T00:00:00.000Z",
+        }
+        for number in range(100)
+    ]
+    body = response_schema(
+        message="posts_fetched_successfully",
+        data={"posts": posts, "total": 100, "offset": 0, "limit": 100, "nextCursor": None},
+    )
+
+    print(f"orjson {'사용' if orjson is not None else '미설치 (표준 json 으로 대체)'}")
+    for response_class in (JSONResponse, ORJSONResponse):
+        repeat = 2000
+        started = time.perf_counter()
+        for _ in range(repeat):
+            response = response_class(status_code=200, content=body)
+        elapsed = (time.perf_counter() - started) / repeat
+        print(f"{response_class.__name__:<16} {elapsed * 1e6:7.0f} us  ({len(response.body):,} bytes)")
+    assert JSONResponse(content=body).body == ORJSONResponse(content=body).body
+    print("두 응답의 바이트가 같음")
@@ -0,0 +1,108 @@
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, TextIO
+from utils import constants
+
+# 로그 레벨 (숫자가 클수록 중요)
+LEVELS = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "error": 40,
+}
+
+
+class StructuredLogger:
+    """JSON 한 줄 단위 구조화 로거
+
+    log() 는 기록을 큐에 넣기만 하고 바로 반환 (이벤트 루프에서 직렬화/쓰기 없음)
+    별도 쓰기 스레드가 flush_interval_seconds 마다 쌓인 기록을 모아 직렬화 후 한 번에 씀
+    (기록마다 스레드를 깨우지 않으므로 요청 처리 스레드와 GIL 을 주고받는 횟수가 적음)
+    큐가 가득 차면 기다리지 않고 버린 뒤, 버린 건수를 나중에 한 줄로 남김
+    """
+
+    def __init__(
+        self,
+        stream: TextIO = sys.stdout,
+        level: str = constants.LOG_LEVEL,
+        sample_rates: Optional[Dict[str, float]] = None,
+        queue_size: int = constants.LOG_QUEUE_SIZE,
+        flush_interval_seconds: float = constants.LOG_FLUSH_INTERVAL_SECONDS,
+    ):
+        self._stream = stream
+        self._min_level = LEVELS[level]
+        # 레벨별 기록 비율 (1.0 : 전부 기록, 0.1 : 10%만 기록)
+        self._sample_rates = sample_rates if sample_rates is not None else constants.LOG_SAMPLE_RATES
+        # deque 의 append/popleft 는 잠금 없이 스레드 간에 안전하게 사용 가능
+        self._queue: deque = deque()
+        self._queue_size = queue_size
+        self._flush_interval = flush_interval_seconds
+        self._dropped = 0
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._run_writer, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def log(self, level: str, event: str, **fields) -> None:
+        """로그 기록 (레벨/샘플링 조건에 맞지 않으면 무시)"""
+        if LEVELS[level] < self._min_level:
+            return
+
+        sample_rate = self._sample_rates.get(level, 1.0)
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return
+
+        if len(self._queue) >= self._queue_size:
+            # 쓰기가 밀리는 동안 요청 처리를 막지 않도록 버림
+            self._dropped += 1
+            return
+
+        self._queue.append({"ts": time.time(), "level": level, "event": event, **fields})
+
+    def debug(self, event: str, **fields) -> None:
+        self.log("debug", event, **fields)
+
+    def info(self, event: str, **fields) -> None:
+        self.log("info", event, **fields)
+
+    def warning(self, event: str, **fields) -> None:
+        self.log("warning", event, **fields)
+
+    def error(self, event: str, **fields) -> None:
+        self.log("error", event, **fields)
+
+    def _flush(self) -> None:
+        """쌓인 기록을 직렬화해서 한 번에 쓰기"""
+        records = self._queue
+        lines = []
+        while records:
+            lines.append(json.dumps(records.popleft(), ensure_ascii=False, default=str))
+
+        # 버린 건수는 근사값 (요청 처리 스레드와 잠금 없이 주고받음)
+        if self._dropped:
+            dropped, self._dropped = self._dropped, 0
+            lines.append(json.dumps({"ts": time.time(), "level": "warning", "event": "log_dropped", "count": dropped}))
+
+        if lines:
+            try:
+                self._stream.write("\n".join(lines) + "\n")
+                self._stream.flush()
+            except (OSError, ValueError):
+                pass
+
+    def _run_writer(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            self._flush()
+        self._flush()
+
+    def close(self, timeout: float = 1.0) -> None:
+        """남은 기록을 모두 쓰고 쓰기 스레드 종료 (앱 종료 시 실행)"""
+        self._stop.set()
+        self._writer.join(timeout)
+
+
+# 전역 로거 인스턴스
+logger = StructuredLogger()
@@ -0,0 +1,186 @@
+import bisect
+from typing import Dict, List, Sequence, Tuple
+
+# 모든 지표는 이벤트 루프 스레드에서만 갱신하므로 잠금 없이 dict/int 로 처리
+
+
+def route_label(scope: dict) -> str:
+    """지표 레이블용 경로 템플릿 (예: /posts/{post_id})
+
+    실제 경로(/posts/3)를 쓰면 게시글마다 레이블이 생기므로 라우팅 결과의 템플릿을 사용
+    일치하는 라우트가 없는 요청(404)은 하나로 묶음
+    include_router 로 붙인 라우터의 템플릿에는 공통 접두사(/api/v1)가 포함되지 않음
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = "") -> str:
+    labels = [f'{name}="{_escape(str(value))}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """누적 카운터 (증가만 가능)"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        values = self._values
+        values[labelvalues] = values.get(labelvalues, 0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+            for labelvalues, value in self._values.items()
+        ]
+
+
+class Gauge(Counter):
+    """현재 값 (증가/감소/설정 가능)"""
+
+    type_name = "gauge"
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[labelvalues] = value
+
+
+class Histogram:
+    """로그 구간 히스토그램 - 구간 경계가 2배씩 커지므로 구간 수가 적어도 넓은 범위를 일정한 상대 오차로 표현
+
+    관측값마다 bisect 1번 + 정수 증가 1번 (누적 값은 내보낼 때만 계산)
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        start: float = 0.0005,
+        factor: float = 2.0,
+        count: int = 17,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        # 기본값 : 0.5ms, 1ms, 2ms, ... 약 32.8초
+        self.bounds = [start * factor ** i for i in range(count)]
+        # {레이블 값: [구간별 개수..., +Inf 구간 개수, 합계]}
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        buckets = self._values.get(labelvalues)
+        if buckets is None:
+            buckets = self._values[labelvalues] = [0] * (len(self.bounds) + 2)
+        buckets[bisect.bisect_left(self.bounds, value)] += 1
+        buckets[-1] += value
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labelvalues, buckets in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.bounds + [float("inf")], buckets):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(buckets[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 목록 및 텍스트 형식(Prometheus exposition format) 출력"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 지표
+registry = MetricsRegistry()
+
+http_requests_total = registry.register(Counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status"),
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route"),
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+))
+http_requests_in_flight.set(0)
+rate_limit_rejections_total = registry.register(Counter(
+    "rate_limit_rejections_total",
+    "Requests rejected with 429 by the rate limiter, by method and route template",
+    ("method", "route"),
+))
+session_store_sessions = registry.register(Gauge(
+    "session_store_sessions",
+    "Sessions currently held by the session store backend",
+))
+cache_hits_total = registry.register(Counter(
+    "cache_hits_total",
+    "In-process cache lookups served from the cache, by cache name",
+    ("cache",),
+))
+cache_misses_total = registry.register(Counter(
+    "cache_misses_total",
+    "In-process cache lookups that fell through to the database, by cache name",
+    ("cache",),
+))
+cache_evictions_total = registry.register(Counter(
+    "cache_evictions_total",
+    "Entries removed from an in-process cache, by cache name and reason (capacity, expired, stale, invalidated)",
+    ("cache", "reason"),
+))
+cache_entries = registry.register(Gauge(
+    "cache_entries",
+    "Entries currently held by an in-process cache, by cache name",
+    ("cache",),
+))
+comment_count_repairs_total = registry.register(Counter(
+    "comment_count_repairs_total",
+    "Posts whose denormalized comment_count was corrected by the reconciliation job",
+))
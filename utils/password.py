@@ -1,14 +1,192 @@
+import asyncio
+import os
+import time
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from utils.response_schema import response_schema
+from utils import constants
+import utils.error_message
+from utils.profiler import profiled
+
+# argon2 는 선택 의존성 (argon2-cffi 설치 시에만 사용 가능)
+try:
+    import argon2
+except ImportError:
+    argon2 = None
+
+
+class BcryptHasher:
+    """bcrypt 해셔 - rounds 가 1 늘어날 때마다 해싱 시간이 2배"""
+
+    prefix = "$2"
+
+    def __init__(self, rounds: int = constants.PASSWORD_BCRYPT_ROUNDS):
+        self.rounds = rounds
+
+    def __str__(self) -> str:
+        return f"bcrypt(rounds={self.rounds})"
+
+    def hash(self, password: str) -> str:
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        try:
+            return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        except ValueError:
+            # 저장된 해시 형식이 잘못된 경우 (잘린 해시 등) - 비밀번호 불일치와 같이 처리
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # 형식 : $2b$<rounds>$<salt+hash>
+        return int(hashed_password.split("$")[2]) != self.rounds
+
+
+class Argon2Hasher:
+    """argon2id 해셔 - time_cost(반복 횟수), memory_cost(KiB), parallelism(스레드 수)로 비용 조절"""
+
+    prefix = "$argon2"
+
+    def __init__(
+        self,
+        time_cost: int = constants.PASSWORD_ARGON2_TIME_COST,
+        memory_cost: int = constants.PASSWORD_ARGON2_MEMORY_COST,
+        parallelism: int = constants.PASSWORD_ARGON2_PARALLELISM,
+    ):
+        if argon2 is None:
+            raise RuntimeError("argon2 password hashing requires the argon2-cffi package")
+
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+        )
+
+    def __str__(self) -> str:
+        return f"argon2(time_cost={self.time_cost}, memory_cost={self.memory_cost}, parallelism={self.parallelism})"
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        try:
+            return self._hasher.verify(hashed_password, plain_password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            # InvalidHashError : 저장된 해시 형식이 잘못된 경우 (VerificationError 의 하위 클래스가 아님)
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._hasher.check_needs_rehash(hashed_password)
+
+
+# 해셔 등록 목록 {알고리즘 이름: 해셔 클래스}
+PASSWORD_HASHERS = {
+    "bcrypt": BcryptHasher,
+    "argon2": Argon2Hasher,
+}
+
+# 새 비밀번호 해싱에 사용할 해셔 (PASSWORD_HASH_ALGORITHM 설정)
+current_hasher = PASSWORD_HASHERS[constants.PASSWORD_HASH_ALGORITHM]()
+
+# 비밀번호 해싱 전용 스레드 풀
+# bcrypt, argon2 모두 계산 중 GIL 을 놓기 때문에 스레드에서 돌리면 이벤트 루프가 막히지 않음
+_executor = ThreadPoolExecutor(
+    max_workers=constants.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+# 스레드 풀에서 실행 중이거나 기다리는 작업 수 (이벤트 루프 스레드에서만 변경)
+_pending_count = 0
+
+def _find_hasher(hashed_password: str):
+    """저장된 해시 형식으로 해셔 찾기 (설정이 바뀌기 전에 만든 해시도 검증 가능)"""
+    if hashed_password.startswith(current_hasher.prefix):
+        return current_hasher
+    if hashed_password.startswith(Argon2Hasher.prefix):
+        return Argon2Hasher()
+    return BcryptHasher()
 
 def hash_password(password: str) -> str:
     """비밀번호 해싱"""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    return current_hasher.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return bcrypt.checkpw(
-        plain_password.encode('utf-8'),
-        hashed_password.encode('utf-8')
-    )
+    return _find_hasher(hashed_password).verify(plain_password, hashed_password)
+
+def needs_rehash(hashed_password: str) -> bool:
+    """저장된 해시가 현재 설정(알고리즘/비용)과 다른지 확인"""
+    if not hashed_password.startswith(current_hasher.prefix):
+        return True
+    return current_hasher.needs_rehash(hashed_password)
+
+async def _run_in_executor(func, *args):
+    """스레드 풀에서 실행 (대기 작업이 너무 많으면 기다리지 않고 바로 503)"""
+    global _pending_count
+
+    if _pending_count >= constants.PASSWORD_HASH_MAX_PENDING: # 503 - 해싱 작업 대기열 가득 참
+        raise HTTPException(
+            status_code=503,
+            detail=response_schema(
+                message=utils.error_message.service_unavailable,
+                data=None,
+            ),
+            headers={"Retry-After": "1"},
+        )
+
+    loop = asyncio.get_running_loop()
+    future = _executor.submit(func, *args)
+    _pending_count += 1
+    # 기다리던 요청이 취소되어도 이미 시작한 작업은 스레드에서 끝까지 실행되므로, 작업이 실제로 끝났을 때 줄임
+    future.add_done_callback(lambda _: _call_in_loop(loop, _finish_pending))
+    return await asyncio.wrap_future(future, loop=loop)
+
+def _finish_pending() -> None:
+    global _pending_count
+
+    _pending_count -= 1
+
+def _call_in_loop(loop: asyncio.AbstractEventLoop, callback) -> None:
+    # 작업 스레드에서 호출됨 - 대기 작업 수는 이벤트 루프 스레드에서만 변경
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        # 앱 종료로 이벤트 루프가 이미 닫힌 경우
+        pass
+
+@profiled
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (스레드 풀에서 실행)"""
+    return await _run_in_executor(hash_password, password)
+
+@profiled
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (스레드 풀에서 실행)"""
+    return await _run_in_executor(verify_password, plain_password, hashed_password)
+
+
+# 해싱 설정별 처리량 측정 (로그인 처리 용량 산정용)
+# 실행 : python -m utils.password
+if __name__ == "__main__":
+    candidates = [BcryptHasher(rounds) for rounds in (10, 11, 12, 13)]
+    if argon2 is not None:
+        candidates += [
+            Argon2Hasher(time_cost=2, memory_cost=19 * 1024, parallelism=1),
+            Argon2Hasher(time_cost=3, memory_cost=64 * 1024, parallelism=1),
+        ]
+    else:
+        print("argon2-cffi 미설치 - argon2 측정 생략")
+
+    print(f"CPU 코어 수: {os.cpu_count()} (아래 값은 코어 1개 기준)")
+    for hasher in candidates:
+        hashed = hasher.hash("Benchmark1!")
+        count = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < 2:
+            hasher.verify("Benchmark1!", hashed)
+            count += 1
+        elapsed = time.perf_counter() - started
+        print(f"{str(hasher):<60} {count / elapsed:8.1f} hashes/sec/core  ({elapsed / count * 1000:.1f} ms)")
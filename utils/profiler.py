@@ -0,0 +1,236 @@
+import contextvars
+import functools
+import hmac
+import inspect
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Dict, List, Optional
+from utils import constants
+from utils.logger import logger
+
+# 현재 요청의 프로파일 (프로파일링하지 않는 요청은 None)
+_current_profile: contextvars.ContextVar = contextvars.ContextVar("current_profile", default=None)
+# 파일 이름에 쓰지 않는 문자 (요청 ID 는 클라이언트가 보낸 X-Request-ID 일 수 있으므로 "../", "/" 등을 제거)
+_UNSAFE_FILE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+_MAX_FILE_NAME_ID_LENGTH = 64
+
+
+def is_enabled() -> bool:
+    """프로파일러 사용 여부 (샘플링 비율 또는 헤더 토큰이 설정된 경우)"""
+    return constants.PROFILER_SAMPLE_RATE > 0 or bool(constants.PROFILER_TOKEN)
+
+
+def should_profile(header_value: Optional[bytes]) -> bool:
+    """요청을 프로파일링할지 결정 - 헤더에 토큰이 맞게 들어 있거나, 샘플링 비율에 당첨된 경우"""
+    token = constants.PROFILER_TOKEN
+    if token and header_value is not None and hmac.compare_digest(header_value, token.encode("utf-8")):
+        return True
+    return random.random() < constants.PROFILER_SAMPLE_RATE
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class RequestProfile:
+    """요청 1건의 프로파일 - 스택 샘플 + 구간(span)별 시간"""
+
+    def __init__(self, name: str, anchor_frame, request_id: Optional[str]):
+        self.name = name
+        self.request_id = request_id
+        # 이 요청을 처리하는 코루틴의 프레임 (샘플링한 스택에 이 프레임이 있으면 이 요청의 샘플)
+        self.anchor_frame = anchor_frame
+        self.thread_id = threading.get_ident()
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        # {"프레임;프레임;...": 샘플 수}
+        self.samples: Dict[str, int] = {}
+        # {"구간;하위 구간;...": 하위 구간을 뺀 시간(초)}
+        self.span_times: Dict[str, float] = {}
+        # 열려 있는 구간 [경로, 시작 시각, 하위 구간 시간 합계]
+        self._open_spans: List[list] = [[name, self.started, 0.0]]
+
+    def enter(self, name: str) -> None:
+        self._open_spans.append([f"{self._open_spans[-1][0]};{name}", time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        path, started, child_time = self._open_spans.pop()
+        duration = time.perf_counter() - started
+        self._open_spans[-1][2] += duration
+        self.span_times[path] = self.span_times.get(path, 0.0) + duration - child_time
+
+    def finish(self) -> None:
+        # 예외로 닫히지 않은 구간까지 모두 닫음
+        while len(self._open_spans) > 1:
+            self.exit()
+        path, started, child_time = self._open_spans.pop()
+        self.duration = time.perf_counter() - started
+        self.span_times[path] = self.span_times.get(path, 0.0) + self.duration - child_time
+
+    def add_sample(self, frames: list) -> None:
+        """샘플링한 스택(안쪽 -> 바깥쪽 프레임 목록)에서 이 요청의 코루틴 위쪽만 기록"""
+        for depth, frame in enumerate(frames):
+            if frame is self.anchor_frame:
+                stack = ";".join(_frame_name(f) for f in reversed(frames[:depth]))
+                key = f"{self.name};{stack}" if stack else self.name
+                self.samples[key] = self.samples.get(key, 0) + 1
+                return
+
+
+def _file_name_id(request_id: Optional[str]) -> str:
+    """파일 이름에 넣을 요청 ID (허용 문자만 남기고, 남는 것이 없으면 새로 발급)"""
+    safe_id = _UNSAFE_FILE_NAME_CHARS.sub("", request_id or "")[:_MAX_FILE_NAME_ID_LENGTH]
+    return safe_id or uuid.uuid4().hex
+
+
+class _Sampler:
+    """프로파일링 중인 요청이 있을 때만 실행되는 스택 샘플링 스레드
+
+    interval_seconds 마다 요청을 처리하는 스레드(이벤트 루프)의 스택을 읽어서 각 요청에 나눠 기록하고,
+    끝난 요청의 결과를 collapsed-stack 파일로 씀 (파일 쓰기도 이 스레드에서 처리)
+    """
+
+    def __init__(self, interval_seconds: float, output_dir: str):
+        self._interval = interval_seconds
+        self._output_dir = output_dir
+        self._lock = threading.Lock()
+        self._active: List[RequestProfile] = []
+        self._finished: deque = deque()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.append(profile)
+            self._ensure_thread()
+
+    def stop(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.remove(profile)
+            self._finished.append(profile)
+            self._ensure_thread()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                active = list(self._active)
+                if not active and not self._finished:
+                    self._thread = None
+                    return
+
+            if active:
+                current_frames = sys._current_frames()
+                stacks = {}
+                for profile in active:
+                    if profile.thread_id not in stacks:
+                        frames = []
+                        frame = current_frames.get(profile.thread_id)
+                        while frame is not None:
+                            frames.append(frame)
+                            frame = frame.f_back
+                        stacks[profile.thread_id] = frames
+                    profile.add_sample(stacks[profile.thread_id])
+                del current_frames, stacks
+
+            while self._finished:
+                self._write(self._finished.popleft())
+
+            time.sleep(self._interval)
+
+    def _write(self, profile: RequestProfile) -> None:
+        """flamegraph 도구(flamegraph.pl, speedscope 등)에서 읽을 수 있는 collapsed-stack 파일 2개 작성
+
+        - <이름>.folded : 스택 샘플 (값 = 샘플 수)
+        - <이름>.spans.folded : 구간 시간 (값 = 하위 구간을 뺀 시간, 마이크로초)
+        """
+        base_name = f"{int(time.time() * 1000)}-{_file_name_id(profile.request_id)}"
+        base_path = os.path.join(self._output_dir, base_name)
+        try:
+            os.makedirs(self._output_dir, exist_ok=True)
+            with open(base_path + ".folded", "w", encoding="utf-8") as file:
+                file.writelines(f"{stack} {count}\n" for stack, count in profile.samples.items())
+            with open(base_path + ".spans.folded", "w", encoding="utf-8") as file:
+                file.writelines(
+                    f"{path} {round(seconds * 1_000_000)}\n" for path, seconds in profile.span_times.items()
+                )
+        except OSError as error:
+            logger.warning("profile_write_failed", requestId=profile.request_id, error=str(error))
+            return
+
+        logger.info(
+            "profile_captured",
+            requestId=profile.request_id,
+            name=profile.name,
+            durationMs=round(profile.duration * 1000, 3),
+            samples=sum(profile.samples.values()),
+            spans={path: round(seconds * 1000, 3) for path, seconds in profile.span_times.items()},
+            file=base_path + ".folded",
+        )
+
+
+_sampler = _Sampler(constants.PROFILER_INTERVAL_SECONDS, constants.PROFILER_OUTPUT_DIR)
+
+
+def start_profile(name: str, anchor_frame, request_id: Optional[str] = None):
+    """현재 요청의 프로파일링 시작 (반환값은 finish_profile 에 전달)"""
+    profile = RequestProfile(name, anchor_frame, request_id)
+    token = _current_profile.set(profile)
+    _sampler.start(profile)
+    return profile, token
+
+
+def finish_profile(started) -> None:
+    """프로파일링 종료 (결과 파일은 샘플링 스레드에서 작성)"""
+    profile, token = started
+    _current_profile.reset(token)
+    profile.finish()
+    _sampler.stop(profile)
+
+
+def profiled(func):
+    """함수 실행 시간을 현재 요청의 프로파일 구간으로 기록하는 데코레이터
+
+    프로파일링하지 않는 요청에서는 ContextVar 조회 1번만 추가됨
+    """
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profile = _current_profile.get()
+            if profile is None:
+                return await func(*args, **kwargs)
+
+            profile.enter(name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                profile.exit()
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _current_profile.get()
+        if profile is None:
+            return func(*args, **kwargs)
+
+        profile.enter(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.exit()
+
+    return wrapper
@@ -0,0 +1,253 @@
+import asyncio
+import hashlib
+import time
+from typing import Dict, List, NamedTuple, Tuple
+from utils import constants
+from utils.redis_client import RedisConnectionPool, RedisError
+from utils.token_bucket import TokenBucketLimiter
+
+# 여러 키의 현재/이전 윈도우 카운터를 한 번에 증가/조회하는 스크립트 (왕복 1회, 원자적 실행)
+# KEYS : [현재 윈도우 키, 이전 윈도우 키] 쌍의 목록
+# ARGV : [윈도우 TTL, 키별 증가량...]
+# 반환 : [현재 윈도우 값, 이전 윈도우 값] 쌍의 목록
+_SLIDING_WINDOW_SCRIPT = """
+local result = {}
+for i = 1, #KEYS, 2 do
+    local increment = tonumber(ARGV[(i + 1) / 2 + 1])
+    local current = redis.call('INCRBY', KEYS[i], increment)
+    if current == increment then
+        redis.call('EXPIRE', KEYS[i], ARGV[1])
+    end
+    result[#result + 1] = current
+    result[#result + 1] = tonumber(redis.call('GET', KEYS[i + 1]) or '0')
+end
+return result
+"""
+_SLIDING_WINDOW_SCRIPT_SHA = hashlib.sha1(_SLIDING_WINDOW_SCRIPT.encode("utf-8")).hexdigest()
+
+
+class RateLimitResult(NamedTuple):
+    """요청 제한 확인 결과 (응답 헤더 X-RateLimit-*, Retry-After 에 사용)"""
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float      # 제한이 완전히 풀릴 때까지 남은 시간(초)
+    retry_after: float      # 다시 요청할 수 있을 때까지 남은 시간(초)
+
+
+class RateLimiter:
+    """요청 제한기 인터페이스"""
+
+    async def try_acquire(self, key: str) -> RateLimitResult:
+        """요청 1건 허용 여부 확인"""
+        raise NotImplementedError
+
+    async def sync(self) -> None:
+        """로컬에 모아둔 요청 수를 공유 저장소에 반영 (필요 없는 제한기는 아무것도 안 함)"""
+        return None
+
+
+class MemoryRateLimiter(RateLimiter):
+    """프로세스 메모리 기반 요청 제한기 (토큰 버킷)
+
+    윈도우 동안 limit 번씩 채워지고, 한 번에 최대 burst 번까지 연속 요청 가능
+    워커마다 따로 세므로 워커가 N개면 실제 제한은 N배
+    """
+
+    def __init__(self, limit: int, window_seconds: float, burst: int):
+        self._burst = burst
+        self._buckets = TokenBucketLimiter(
+            capacity=burst,
+            refill_per_second=limit / window_seconds,
+            max_keys=constants.REQUESTS_MAX_TRACKED_KEYS,
+        )
+
+    async def try_acquire(self, key: str) -> RateLimitResult:
+        buckets = self._buckets
+        allowed = buckets.try_acquire(key)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self._burst,
+            remaining=buckets.remaining(key),
+            reset_after=buckets.reset_after(key),
+            retry_after=buckets.retry_after(key),
+        )
+
+
+class RedisRateLimiter(RateLimiter):
+    """Redis 프로토콜 기반 요청 제한기 (슬라이딩 윈도우 카운터, 모든 워커/서버가 공유)
+
+    sync_interval_seconds 가 0 이면 요청마다 스크립트를 실행해서 정확하게 제한하고,
+    0 보다 크면 요청 수를 로컬에 모아두었다가 주기적으로 한 번에 반영함 (요청 처리 중 네트워크 왕복 없음)
+    이 경우 동기화 주기 동안 다른 워커에서 들어온 요청만큼 제한을 넘을 수 있음
+    윈도우 카운터 방식이므로 burst 는 따로 적용하지 않음 (윈도우당 limit 번이 곧 최대 연속 요청 수)
+    """
+
+    def __init__(
+        self,
+        pool: RedisConnectionPool,
+        name: str,
+        limit: int,
+        window_seconds: float,
+        sync_interval_seconds: float,
+    ):
+        self._pool = pool
+        self._key_prefix = f"ratelimit:{name}:"
+        self._limit = limit
+        self._window = window_seconds
+        self._sync_interval = sync_interval_seconds
+        # 아직 공유 저장소에 반영하지 않은 요청 수 {key: count}
+        self._pending: Dict[str, int] = {}
+        # 마지막 동기화 결과 {key: (윈도우 번호, 현재 윈도우 값, 이전 윈도우 값)}
+        self._synced: Dict[str, Tuple[int, int, int]] = {}
+
+    def _window_position(self) -> Tuple[int, float]:
+        """(현재 윈도우 번호, 현재 윈도우에서 지난 비율)"""
+        now = time.time()
+        return int(now // self._window), (now % self._window) / self._window
+
+    def _estimate(self, current: int, previous: int, elapsed_ratio: float) -> float:
+        """슬라이딩 윈도우 요청 수 추정 - 이전 윈도우 값은 지난 비율만큼 빼고 더함"""
+        return previous * (1 - elapsed_ratio) + current
+
+    async def _run_script(self, increments: List[Tuple[str, int]], window_index: int) -> List[Tuple[int, int]]:
+        """키별 증가량을 공유 저장소에 반영하고 (현재 윈도우 값, 이전 윈도우 값) 목록 반환"""
+        keys = []
+        for key, _ in increments:
+            keys.append(f"{self._key_prefix}{key}:{window_index}")
+            keys.append(f"{self._key_prefix}{key}:{window_index - 1}")
+        args = [int(self._window * 2)] + [increment for _, increment in increments]
+
+        try:
+            result = await self._pool.execute("EVALSHA", _SLIDING_WINDOW_SCRIPT_SHA, len(keys), *keys, *args)
+        except RedisError as error:
+            # 서버에 스크립트가 아직 없으면 본문과 함께 한 번 실행 (이후에는 EVALSHA 로 처리)
+            if not str(error).startswith("NOSCRIPT"):
+                raise
+            result = await self._pool.execute("EVAL", _SLIDING_WINDOW_SCRIPT, len(keys), *keys, *args)
+
+        return [(result[i], result[i + 1]) for i in range(0, len(result), 2)]
+
+    def _synced_counts(self, key: str, window_index: int) -> Tuple[int, int]:
+        """마지막 동기화 값을 현재 윈도우 기준으로 환산한 (현재 윈도우 값, 이전 윈도우 값)"""
+        synced = self._synced.get(key)
+        if synced is None:
+            return 0, 0
+
+        synced_window, current, previous = synced
+        if synced_window == window_index:
+            return current, previous
+        if synced_window == window_index - 1:
+            return 0, current
+        return 0, 0
+
+    def _result(self, allowed: bool, used: float, elapsed_ratio: float) -> RateLimitResult:
+        # 다음 윈도우가 시작될 때까지 남은 시간
+        reset_after = self._window * (1 - elapsed_ratio)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self._limit,
+            remaining=max(int(self._limit - used), 0),
+            reset_after=reset_after,
+            retry_after=0.0 if allowed else reset_after,
+        )
+
+    async def try_acquire(self, key: str) -> RateLimitResult:
+        window_index, elapsed_ratio = self._window_position()
+
+        # 요청마다 공유 저장소에 바로 반영
+        if self._sync_interval <= 0:
+            [(current, previous)] = await self._run_script([(key, 1)], window_index)
+            self._synced[key] = (window_index, current, previous)
+            used = self._estimate(current, previous, elapsed_ratio)
+            return self._result(used <= self._limit, used, elapsed_ratio)
+
+        # 마지막 동기화 값 + 로컬에 모아둔 요청 수로 판단
+        current, previous = self._synced_counts(key, window_index)
+        pending = self._pending.get(key, 0)
+        used = self._estimate(current + pending, previous, elapsed_ratio)
+        if used >= self._limit:
+            return self._result(False, used, elapsed_ratio)
+
+        self._pending[key] = pending + 1
+        return self._result(True, used + 1, elapsed_ratio)
+
+    async def sync(self) -> None:
+        window_index, _ = self._window_position()
+        pending, self._pending = self._pending, {}
+
+        # 이전 윈도우보다 오래된 동기화 결과는 더 이상 쓰이지 않으므로 삭제
+        self._synced = {
+            key: synced for key, synced in self._synced.items()
+            if synced[0] >= window_index - 1
+        }
+
+        if not pending:
+            return
+
+        increments = list(pending.items())
+        try:
+            counts = await self._run_script(increments, window_index)
+        except (RedisError, ConnectionError, OSError):
+            # 반영 실패 시 다음 동기화 때 다시 시도
+            for key, increment in increments:
+                self._pending[key] = self._pending.get(key, 0) + increment
+            raise
+
+        for (key, _), (current, previous) in zip(increments, counts):
+            self._synced[key] = (window_index, current, previous)
+
+
+# 생성된 제한기 목록 (동기화 백그라운드 작업에서 사용)
+_rate_limiters: List[RateLimiter] = []
+_redis_pool = None
+
+
+def _get_redis_pool() -> RedisConnectionPool:
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = RedisConnectionPool(
+            host=constants.REDIS_HOST,
+            port=constants.REDIS_PORT,
+            db=constants.REDIS_RATE_LIMIT_DB,
+            password=constants.REDIS_PASSWORD,
+            max_connections=constants.REDIS_MAX_CONNECTIONS,
+        )
+    return _redis_pool
+
+
+def create_rate_limiter(name: str, limit: int, window_seconds: float, burst: int) -> RateLimiter:
+    """설정(RATE_LIMIT_BACKEND)에 맞는 요청 제한기 생성"""
+    if constants.RATE_LIMIT_BACKEND == "redis":
+        rate_limiter = RedisRateLimiter(
+            pool=_get_redis_pool(),
+            name=name,
+            limit=limit,
+            window_seconds=window_seconds,
+            sync_interval_seconds=constants.RATE_LIMIT_SYNC_INTERVAL_SECONDS,
+        )
+    else:
+        rate_limiter = MemoryRateLimiter(limit, window_seconds, burst)
+
+    _rate_limiters.append(rate_limiter)
+    return rate_limiter
+
+
+async def run_sync_loop(interval_seconds: float = constants.RATE_LIMIT_SYNC_INTERVAL_SECONDS) -> None:
+    """로컬에 모아둔 요청 수를 주기적으로 공유 저장소에 반영하는 백그라운드 작업 (앱 시작 시 실행)"""
+    if constants.RATE_LIMIT_BACKEND != "redis" or interval_seconds <= 0:
+        return
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for rate_limiter in _rate_limiters:
+            try:
+                await rate_limiter.sync()
+            except (RedisError, ConnectionError, OSError):
+                # 저장소 장애 시에도 요청 처리는 계속 (다음 주기에 다시 반영)
+                pass
+
+
+async def close() -> None:
+    if _redis_pool is not None:
+        await _redis_pool.close()
@@ -0,0 +1,162 @@
+import asyncio
+from typing import Any, Optional, Sequence
+
+
+class RedisError(Exception):
+    """Redis 서버가 보낸 에러 응답"""
+
+
+def _encode_command(args: Sequence[Any]) -> bytes:
+    """명령어 -> RESP 배열 형식의 바이트"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            value = arg
+        elif isinstance(arg, str):
+            value = arg.encode("utf-8")
+        else:
+            value = str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+    return b"".join(parts)
+
+
+class RedisConnection:
+    """Redis 서버와의 연결 1개 (RESP2 프로토콜)"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, db: int = 0, password: Optional[str] = None) -> "RedisConnection":
+        reader, writer = await asyncio.open_connection(host, port)
+        connection = cls(reader, writer)
+
+        if password:
+            await connection.execute("AUTH", password)
+        if db:
+            await connection.execute("SELECT", db)
+
+        return connection
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("redis connection closed")
+
+        prefix, payload = line[:1], line[1:-2]
+
+        if prefix == b"+":     # 단순 문자열
+            return payload.decode("utf-8")
+        if prefix == b"-":     # 에러
+            return RedisError(payload.decode("utf-8"))
+        if prefix == b":":     # 정수
+            return int(payload)
+        if prefix == b"$":     # 벌크 문자열 (-1 이면 None)
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":     # 배열
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+
+        raise ConnectionError(f"unknown redis reply: {line!r}")
+
+    async def execute(self, *args: Any) -> Any:
+        """명령어 1개 실행"""
+        return (await self.pipeline([args]))[0]
+
+    async def pipeline(self, commands: Sequence[Sequence[Any]]) -> list:
+        """여러 명령어를 한 번에 전송하고 응답을 순서대로 받음 (왕복 1회)"""
+        self._writer.write(b"".join(_encode_command(command) for command in commands))
+        await self._writer.drain()
+
+        replies = [await self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class RedisConnectionPool:
+    """Redis 연결 풀 - 요청마다 연결을 새로 맺지 않고 재사용"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        password: Optional[str] = None,
+        max_connections: int = 10,
+    ):
+        self._host = host
+        self._port = port
+        self._db = db
+        self._password = password
+        self._idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _open(self) -> RedisConnection:
+        return await RedisConnection.open(self._host, self._port, self._db, self._password)
+
+    async def _acquire(self) -> tuple[RedisConnection, bool]:
+        """(연결, 풀에서 재사용한 연결인지)"""
+        await self._slots.acquire()
+        try:
+            if not self._idle.empty():
+                return self._idle.get_nowait(), True
+            return await self._open(), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release(self, connection: RedisConnection, broken: bool) -> None:
+        if broken:
+            await connection.close()
+        else:
+            self._idle.put_nowait(connection)
+        self._slots.release()
+
+    async def execute(self, *args: Any) -> Any:
+        """풀에서 연결을 빌려 명령어 1개 실행"""
+        return (await self.pipeline([args]))[0]
+
+    async def pipeline(self, commands: Sequence[Sequence[Any]]) -> list:
+        """풀에서 연결을 빌려 여러 명령어를 파이프라인으로 실행
+
+        재사용한 연결이 끊겨 있으면 (쉬는 동안 서버가 timeout 으로 닫았거나 재시작) 새 연결로 한 번만 다시 시도
+        """
+        connection, reused = await self._acquire()
+        broken = False
+        try:
+            try:
+                return await connection.pipeline(commands)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not reused:
+                    raise
+                await connection.close()
+                connection = await self._open()
+                return await connection.pipeline(commands)
+        except RedisError:
+            raise
+        except BaseException:
+            # 응답을 다 읽지 못한 연결은 재사용하지 않음
+            broken = True
+            raise
+        finally:
+            await self._release(connection, broken)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            await self._idle.get_nowait().close()
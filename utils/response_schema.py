@@ -1,4 +1,6 @@
+import functools
 from typing import Any
+from utils.json_response import dumps
 
 
 # API 응답 시 JSONResponse(성공), HTTPException(실패)에서 공통된 응답 스키마를 정의
@@ -6,4 +8,10 @@ def response_schema(message: str, data: Any = None) -> dict:
     return {
         "message"   : message,
         "data"      : data,
-    }
\ No newline at end of file
+    }
+
+
+# data 가 없는 응답(로그아웃, 삭제 완료 등)은 메시지별로 한 번만 직렬화해서 재사용
+@functools.lru_cache(maxsize=None)
+def encoded_response_schema(message: str) -> bytes:
+    return dumps(response_schema(message=message, data=None))
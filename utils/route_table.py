@@ -0,0 +1,45 @@
+import re
+from typing import Any, Dict, Optional, Tuple
+
+
+def _template_pattern(path: str) -> str:
+    """경로 템플릿 -> 정규식 (예: /api/v1/posts/{post_id} -> /api/v1/posts/[^/]+)"""
+    return "".join(
+        "[^/]+" if part.startswith("{") else re.escape(part)
+        for part in re.split(r"(\{[^/]+\})", path)
+        if part
+    )
+
+
+class RouteTable:
+    """(HTTP 메서드, 경로 템플릿) -> 값 표
+
+    라우팅 전(미들웨어)이나 라우팅 결과와 무관하게 실제 경로로 값을 찾을 때 사용
+    메서드마다 모든 경로 템플릿을 정규식 하나로 합쳐두고, 요청마다 match 1번으로 값을 찾음
+    """
+
+    def __init__(self, table: Dict[Tuple[str, str], Any]):
+        grouped: dict = {}
+        for index, ((method, path), value) in enumerate(table.items()):
+            grouped.setdefault(method, []).append((f"route{index}", _template_pattern(path), value))
+
+        # {HTTP 메서드: (경로 정규식, {그룹 이름: 값})}
+        self._compiled = {
+            method: (
+                re.compile("^(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in entries) + ")$"),
+                {name: value for name, _, value in entries},
+            )
+            for method, entries in grouped.items()
+        }
+
+    def find(self, method: str, path: str, default: Optional[Any] = None) -> Any:
+        """요청 메서드/경로에 맞는 값 (없으면 default)"""
+        compiled = self._compiled.get(method)
+        if compiled is None:
+            return default
+
+        pattern, values = compiled
+        match = pattern.match(path)
+        if match is None:
+            return default
+        return values[match.lastgroup]
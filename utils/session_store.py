@@ -1,61 +1,303 @@
+import asyncio
+import heapq
+import json
 import secrets
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from utils import constants
+from utils.redis_client import RedisConnectionPool
+from utils.session_token import SessionTokenSigner
 
-class SessionStore:
-    """메모리 기반 세션 저장소"""
+
+class _SessionShard:
+    """세션 저장소의 샤드 1개 (세션 + 만료 예정 힙 + 잠금)"""
+
+    __slots__ = ("sessions", "expiry_heap", "lock")
 
     def __init__(self):
-        # 메모리에 세션 저장 {session_id: session_data}
-        self._sessions: Dict[str, dict] = {}
-        self._session_timeout = timedelta(hours=24)
+        # {session_id: session_data}
+        self.sessions: Dict[str, dict] = {}
+        # (만료 예정 시각, session_id) 최소 힙 - 가장 먼저 만료될 세션이 맨 앞
+        self.expiry_heap: List[Tuple[float, str]] = []
+        # 샤드마다 잠금을 따로 두어 서로 다른 샤드의 세션은 동시에 처리 가능 (lock striping)
+        self.lock = threading.Lock()
 
-    def create_session(self, user_id: str, user_data: dict) -> str:
-        """새 세션 생성 및 세션 ID 반환"""
-        session_id = secrets.token_urlsafe(32)
 
-        self._sessions[session_id] = {
-            "user_id": user_id,
-            "user_data": user_data,
-            "created_at": datetime.now(),
-            "last_accessed": datetime.now(),
-        }
+class SessionBackend:
+    """세션 저장소 백엔드 인터페이스"""
 
-        return session_id
+    async def create_session(self, session_id: str, session: dict) -> None:
+        raise NotImplementedError
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    async def delete_session(self, session_id: str) -> bool:
+        raise NotImplementedError
+
+    async def count_sessions(self) -> int:
+        raise NotImplementedError
+
+    async def run_cleanup_loop(self) -> None:
+        """만료 세션 정리 백그라운드 작업 (필요 없는 백엔드는 바로 종료)"""
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class MemorySessionBackend(SessionBackend):
+    """메모리 기반 세션 저장소 (샤딩 + 최소 힙 만료 처리)
+
+    프로세스 안에서만 공유되므로 워커가 1개일 때만 사용
+    """
+
+    def __init__(
+        self,
+        shard_count: int = constants.SESSION_SHARD_COUNT,
+        session_timeout_seconds: float = constants.SESSION_TIMEOUT_SECONDS,
+    ):
+        self._shards = [_SessionShard() for _ in range(shard_count)]
+        self._session_timeout = session_timeout_seconds
+
+    def _get_shard(self, session_id: str) -> _SessionShard:
+        return self._shards[hash(session_id) % len(self._shards)]
+
+    async def create_session(self, session_id: str, session: dict) -> None:
+        now = time.monotonic()
+        # 만료 계산용 시각 (monotonic : 시스템 시간 변경에 영향 받지 않음)
+        session["last_accessed"] = now
 
-    def get_session(self, session_id: str) -> Optional[dict]:
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            shard.sessions[session_id] = session
+            heapq.heappush(shard.expiry_heap, (now + self._session_timeout, session_id))
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
         """세션 ID로 세션 데이터 조회"""
-        session = self._sessions.get(session_id)
+        shard = self._get_shard(session_id)
+        session = shard.sessions.get(session_id)
 
         if not session:
             return None
 
+        now = time.monotonic()
+
         # 세션 만료 확인
-        if datetime.now() - session["last_accessed"] > self._session_timeout:
-            self.delete_session(session_id)
+        if now - session["last_accessed"] > self._session_timeout:
+            await self.delete_session(session_id)
             return None
 
         # 마지막 접근 시간 업데이트
-        session["last_accessed"] = datetime.now()
+        # 힙은 갱신하지 않고, 정리할 때 실제 만료 시각을 다시 확인해서 재등록 (O(1) 갱신)
+        session["last_accessed"] = now
         return session
 
-    def delete_session(self, session_id: str) -> bool:
+    async def delete_session(self, session_id: str) -> bool:
+        """세션 삭제 (힙에 남은 항목은 정리할 때 건너뜀)"""
+        shard = self._get_shard(session_id)
+        with shard.lock:
+            return shard.sessions.pop(session_id, None) is not None
+
+    async def count_sessions(self) -> int:
+        """현재 저장된 세션 수"""
+        return sum(len(shard.sessions) for shard in self._shards)
+
+    def cleanup_expired_sessions(self) -> int:
+        """만료된 세션 정리 후 삭제한 세션 수 반환
+
+        힙의 맨 앞(만료 예정 시각이 지난 항목)만 확인하므로 전체 세션을 순회하지 않음
+        """
+        now = time.monotonic()
+        removed = 0
+
+        for shard in self._shards:
+            with shard.lock:
+                heap = shard.expiry_heap
+                while heap and heap[0][0] <= now:
+                    _, session_id = heapq.heappop(heap)
+                    session = shard.sessions.get(session_id)
+
+                    # 이미 삭제된 세션 (로그아웃 등)
+                    if session is None:
+                        continue
+
+                    # 만료 전에 다시 접근된 세션은 새 만료 예정 시각으로 재등록
+                    expires_at = session["last_accessed"] + self._session_timeout
+                    if expires_at > now:
+                        heapq.heappush(heap, (expires_at, session_id))
+                        continue
+
+                    del shard.sessions[session_id]
+                    removed += 1
+
+        return removed
+
+    async def run_cleanup_loop(
+        self,
+        interval_seconds: float = constants.SESSION_CLEANUP_INTERVAL_SECONDS,
+    ) -> None:
+        """주기적으로 만료 세션을 정리하는 백그라운드 작업 (앱 시작 시 실행)"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.cleanup_expired_sessions()
+
+
+class RedisSessionBackend(SessionBackend):
+    """Redis 프로토콜 기반 세션 저장소
+
+    여러 워커/서버가 같은 세션을 공유할 수 있고, 만료는 Redis 의 TTL 로 처리
+    세션 전용 DB 번호를 사용하므로 DBSIZE 가 곧 세션 수
+    """
+
+    _KEY_PREFIX = "session:"
+
+    def __init__(
+        self,
+        pool: RedisConnectionPool,
+        session_timeout_seconds: float = constants.SESSION_TIMEOUT_SECONDS,
+    ):
+        self._pool = pool
+        self._session_timeout = int(session_timeout_seconds)
+
+    async def create_session(self, session_id: str, session: dict) -> None:
+        await self._pool.execute(
+            "SET", self._KEY_PREFIX + session_id, json.dumps(session), "EX", self._session_timeout
+        )
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        # GET 과 EXPIRE(만료 시간 연장)를 파이프라인으로 묶어서 왕복 1회로 처리
+        key = self._KEY_PREFIX + session_id
+        value, _ = await self._pool.pipeline([
+            ("GET", key),
+            ("EXPIRE", key, self._session_timeout),
+        ])
+
+        if value is None:
+            return None
+        return json.loads(value)
+
+    async def delete_session(self, session_id: str) -> bool:
+        return await self._pool.execute("DEL", self._KEY_PREFIX + session_id) > 0
+
+    async def count_sessions(self) -> int:
+        return await self._pool.execute("DBSIZE")
+
+    async def close(self) -> None:
+        await self._pool.close()
+
+
+class SessionStore:
+    """세션 저장소 (실제 저장은 백엔드에 위임)
+
+    token_signer 가 있으면 세션 ID 대신 서명 토큰을 발급하고, 조회 시 저장소에 접근하지 않음
+    """
+
+    def __init__(self, backend: SessionBackend, token_signer: Optional[SessionTokenSigner] = None):
+        self._backend = backend
+        self._token_signer = token_signer
+
+    async def create_session(self, user_id: str, user_data: dict) -> str:
+        """새 세션 생성 및 세션 ID 반환"""
+        if self._token_signer is not None:
+            return self._token_signer.issue(user_id, user_data)
+
+        session_id = secrets.token_urlsafe(32)
+
+        await self._backend.create_session(session_id, {
+            "user_id": user_id,
+            "user_data": user_data,
+            "created_at": time.time(),
+        })
+
+        return session_id
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        """세션 ID로 세션 데이터 조회"""
+        if self._token_signer is not None:
+            return self._token_signer.verify(session_id)
+        return await self._backend.get_session(session_id)
+
+    async def delete_session(self, session_id: str) -> bool:
         """세션 삭제"""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            return True
-        return False
-
-    def cleanup_expired_sessions(self):
-        """만료된 세션 정리"""
-        now = datetime.now()
-        expired = [
-            sid for sid, session in self._sessions.items()
-            if now - session["last_accessed"] > self._session_timeout
-        ]
+        if self._token_signer is not None:
+            return self._token_signer.revoke(session_id)
+        return await self._backend.delete_session(session_id)
+
+    async def count_sessions(self) -> int:
+        """현재 저장된 세션 수"""
+        return await self._backend.count_sessions()
+
+    async def run_cleanup_loop(self) -> None:
+        """만료 세션 정리 백그라운드 작업 (앱 시작 시 실행)"""
+        await self._backend.run_cleanup_loop()
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+
+def _create_session_backend() -> SessionBackend:
+    """설정(SESSION_BACKEND)에 맞는 세션 백엔드 생성"""
+    if constants.SESSION_BACKEND == "redis":
+        return RedisSessionBackend(RedisConnectionPool(
+            host=constants.REDIS_HOST,
+            port=constants.REDIS_PORT,
+            db=constants.REDIS_SESSION_DB,
+            password=constants.REDIS_PASSWORD,
+            max_connections=constants.REDIS_MAX_CONNECTIONS,
+        ))
+    return MemorySessionBackend()
+
 
-        for sid in expired:
-            del self._sessions[sid]
+def _create_token_signer() -> Optional[SessionTokenSigner]:
+    """설정(SESSION_TOKEN_MODE)이 signed 이면 서명 토큰 발급기 생성"""
+    if constants.SESSION_TOKEN_MODE != "signed":
+        return None
+
+    secret_key = constants.SESSION_SECRET_KEY
+    if secret_key:
+        return SessionTokenSigner(secret_key.encode("utf-8"))
+    return SessionTokenSigner(secrets.token_bytes(32))
 
 # 전역 세션 저장소 인스턴스
-session_store = SessionStore()
+session_store = SessionStore(_create_session_backend(), _create_token_signer())
+
+
+# 메모리 세션 저장소 측정 (세션당 메모리, 정리 작업 시간)
+# 실행 : python -m utils.session_store [세션 수]
+if __name__ == "__main__":
+    import sys
+    import tracemalloc
+
+    session_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    backend = MemorySessionBackend(session_timeout_seconds=3600)
+    store = SessionStore(backend)
+
+    async def create_sessions() -> list:
+        return [
+            await store.create_session(
+                str(number),
+                {"userId": str(number), "email": f"user{number}@example.com", "nickname": f"user{number}"},
+            )
+            for number in range(session_count)
+        ]
+
+    tracemalloc.start()
+    session_ids = asyncio.run(create_sessions())
+    # 세션 ID 문자열은 쿠키 값이므로 저장소에 포함해서 셈 (session_ids 리스트 자체는 뺌)
+    memory = tracemalloc.get_traced_memory()[0] - sys.getsizeof(session_ids)
+    tracemalloc.stop()
+    print(f"세션 {session_count:,}개: 세션당 {memory / session_count:,.0f} bytes (user_data 포함)")
+
+    started = time.perf_counter()
+    removed = backend.cleanup_expired_sessions()
+    print(f"만료된 세션이 없을 때 정리 1회: {(time.perf_counter() - started) * 1000:.2f} ms (삭제 {removed}개)")
+
+    # 모두 만료된 것으로 만든 뒤 정리 (최악의 경우)
+    backend._session_timeout = 0
+    for shard in backend._shards:
+        shard.expiry_heap[:] = [(0.0, session_id) for _, session_id in shard.expiry_heap]
+    started = time.perf_counter()
+    removed = backend.cleanup_expired_sessions()
+    print(f"모든 세션이 만료되었을 때 정리 1회: {(time.perf_counter() - started) * 1000:.0f} ms (삭제 {removed:,}개)")
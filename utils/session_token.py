@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Optional
+from utils import constants
+from utils.bloom_filter import BloomFilter
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class RevocationList:
+    """로그아웃/탈퇴로 폐기된 토큰 목록 (블룸 필터 2개를 번갈아 사용)
+
+    토큰은 만료 시각이 지나면 어차피 거부되므로, 토큰 수명마다 오래된 필터를 버려서 크기를 일정하게 유지
+    프로세스 메모리에만 있으므로 워커가 여러 개면 폐기가 다른 워커에는 반영되지 않음
+    """
+
+    def __init__(self, size_bits: int, hash_count: int, rotate_seconds: float):
+        self._size_bits = size_bits
+        self._hash_count = hash_count
+        self._rotate_seconds = rotate_seconds
+        self._current = BloomFilter(size_bits, hash_count)
+        self._previous = BloomFilter(size_bits, hash_count)
+        self._rotated_at = time.monotonic()
+
+    def _rotate_if_needed(self) -> None:
+        if time.monotonic() - self._rotated_at >= self._rotate_seconds:
+            self._previous = self._current
+            self._current = BloomFilter(self._size_bits, self._hash_count)
+            self._rotated_at = time.monotonic()
+
+    def revoke(self, token_id: str) -> None:
+        self._rotate_if_needed()
+        self._current.add(token_id)
+
+    def is_revoked(self, token_id: str) -> bool:
+        self._rotate_if_needed()
+        return token_id in self._current or token_id in self._previous
+
+
+class SessionTokenSigner:
+    """HMAC 서명 세션 토큰 발급/검증 (저장소 조회 없이 인증)
+
+    토큰 형식 : base64url(payload JSON) + "." + base64url(HMAC-SHA256 서명)
+    """
+
+    def __init__(
+        self,
+        secret_key: bytes,
+        session_timeout_seconds: float = constants.SESSION_TIMEOUT_SECONDS,
+    ):
+        self._secret_key = secret_key
+        self._session_timeout = session_timeout_seconds
+        self._revocations = RevocationList(
+            size_bits=constants.SESSION_REVOCATION_BLOOM_SIZE_BITS,
+            hash_count=constants.SESSION_REVOCATION_BLOOM_HASH_COUNT,
+            rotate_seconds=session_timeout_seconds,
+        )
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret_key, payload, hashlib.sha256).digest()
+
+    def issue(self, user_id: str, user_data: dict) -> str:
+        """토큰 발급 (userId, 닉네임, 만료 시각 포함)"""
+        payload = json.dumps({
+            "s": user_id,                       # 세션 주인 (이메일)
+            "u": user_data["userId"],
+            "e": user_data["email"],
+            "n": user_data["nickname"],
+            "x": int(time.time() + self._session_timeout),
+            "j": secrets.token_urlsafe(8),      # 토큰 ID (폐기 목록 키)
+        }, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+
+    def _decode(self, token: str) -> Optional[dict]:
+        """서명 확인 후 payload 반환, 위조/형식 오류면 None"""
+        try:
+            encoded_payload, encoded_signature = token.split(".")
+            payload = _b64decode(encoded_payload)
+            signature = _b64decode(encoded_signature)
+        except ValueError:
+            return None
+
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+
+        return json.loads(payload)
+
+    def verify(self, token: str) -> Optional[dict]:
+        """토큰 검증 후 세션 데이터 반환 (저장소 세션과 같은 형식)"""
+        claims = self._decode(token)
+
+        if claims is None:
+            return None
+
+        # 만료 확인
+        if claims["x"] < time.time():
+            return None
+
+        # 폐기 확인
+        if self._revocations.is_revoked(claims["j"]):
+            return None
+
+        return {
+            "user_id": claims["s"],
+            "user_data": {
+                "userId": claims["u"],
+                "email": claims["e"],
+                "nickname": claims["n"],
+            },
+        }
+
+    def revoke(self, token: str) -> bool:
+        """토큰 폐기 (로그아웃, 회원 탈퇴)"""
+        claims = self._decode(token)
+
+        if claims is None:
+            return False
+
+        self._revocations.revoke(claims["j"])
+        return True
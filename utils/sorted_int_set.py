@@ -0,0 +1,38 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+
+class SortedIntSet:
+    """정수 집합 - 정렬된 64비트 정수 배열 하나에 저장 (set 보다 원소당 메모리가 훨씬 적음)
+
+    포함 여부 확인은 이분 탐색 O(log n), 추가/삭제는 배열 중간 삽입/삭제 O(n) (memmove)
+    읽기(확인)가 쓰기보다 훨씬 많은 경우에 사용 (예: 게시글별 좋아요를 누른 사용자 ID)
+    """
+
+    def __init__(self, sorted_values: Iterable[int] = ()):
+        # sorted_values 는 중복 없이 오름차순이어야 함 (예: ORDER BY 로 읽은 기본 키)
+        self._values = array("q", sorted_values)
+
+    def __contains__(self, value: int) -> bool:
+        index = bisect_left(self._values, value)
+        return index < len(self._values) and self._values[index] == value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: int) -> bool:
+        """추가 (이미 있으면 False)"""
+        index = bisect_left(self._values, value)
+        if index < len(self._values) and self._values[index] == value:
+            return False
+        self._values.insert(index, value)
+        return True
+
+    def remove(self, value: int) -> bool:
+        """삭제 (없으면 False)"""
+        index = bisect_left(self._values, value)
+        if index < len(self._values) and self._values[index] == value:
+            del self._values[index]
+            return True
+        return False
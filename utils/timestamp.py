@@ -0,0 +1,7 @@
+from datetime import datetime, timezone
+
+
+# API 응답에서 사용하는 시간 형식 (예: 2026-01-01T00:00:00.000Z)
+def now_timestamp() -> str:
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}Z"
@@ -0,0 +1,120 @@
+import time
+from collections import OrderedDict
+
+
+class TokenBucketLimiter:
+    """토큰 버킷 방식 요청 제한기
+
+    키(IP 등)마다 [남은 토큰 수, 마지막 갱신 시각] 두 값만 저장하므로 요청 1건의 비용이 일정함
+    - 토큰은 초당 refill_per_second 개씩 capacity 까지 채워지고, 요청 1건마다 1개 사용
+    - 키는 최근 사용 순서로 유지하고, 오래 쓰지 않은 키(버킷이 다시 가득 찼을 시간)는 삭제
+    - 키 수가 max_keys 를 넘으면 가장 오래 쓰지 않은 키부터 삭제 (LRU)
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int):
+        self._capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._max_keys = max_keys
+        # 버킷이 비어있다가 가득 찰 때까지 걸리는 시간 - 이보다 오래 쓰지 않은 키는 새 키와 같음
+        self._idle_seconds = capacity / refill_per_second
+        # {key: [tokens, updated_at]}
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    def _evict_cold_keys(self, now: float) -> None:
+        """가장 오래된 키부터 확인해서 유휴 키 / 초과 키 삭제 (요청당 최대 몇 개만 확인)"""
+        buckets = self._buckets
+        for _ in range(2):
+            if not buckets:
+                return
+            oldest_key = next(iter(buckets))
+            if len(buckets) > self._max_keys or now - buckets[oldest_key][1] >= self._idle_seconds:
+                del buckets[oldest_key]
+            else:
+                return
+
+    def try_acquire(self, key: str) -> bool:
+        """토큰 1개 사용 시도 (성공 True, 제한 초과 False)"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = [self._capacity, now]
+            self._buckets[key] = bucket
+        else:
+            # 마지막 갱신 이후 지난 시간만큼 토큰 채우기
+            tokens = bucket[0] + (now - bucket[1]) * self._refill_per_second
+            bucket[0] = tokens if tokens < self._capacity else self._capacity
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+
+        self._evict_cold_keys(now)
+
+        if bucket[0] < 1:
+            return False
+
+        bucket[0] -= 1
+        return True
+
+    def remaining(self, key: str) -> int:
+        """지금 바로 사용할 수 있는 토큰 수"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return int(self._capacity)
+        return int(bucket[0])
+
+    def retry_after(self, key: str) -> float:
+        """다음 토큰이 생길 때까지 남은 시간(초)"""
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket[0] >= 1:
+            return 0.0
+        return (1 - bucket[0]) / self._refill_per_second
+
+    def reset_after(self, key: str) -> float:
+        """버킷이 다시 가득 찰 때까지 남은 시간(초)"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return 0.0
+        return (self._capacity - bucket[0]) / self._refill_per_second
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# 토큰 버킷과 예전 방식(키마다 요청 시각 목록을 매번 다시 만드는 방식)의 요청당 시간 비교
+# 실행 : python -m utils.token_bucket
+if __name__ == "__main__":
+    import random
+    from collections import defaultdict
+    from datetime import datetime, timedelta
+
+    REQUEST_COUNT = 300_000
+    LIMIT, WINDOW_SECONDS = 5, 60
+
+    def list_scan_limiter():
+        request_times = defaultdict(list)
+
+        def try_acquire(key: str) -> bool:
+            now = datetime.now()
+            request_times[key] = [
+                request_time for request_time in request_times[key]
+                if now - request_time < timedelta(seconds=WINDOW_SECONDS)
+            ]
+            if len(request_times[key]) >= LIMIT:
+                return False
+            request_times[key].append(now)
+            return True
+
+        return try_acquire
+
+    def per_request_us(try_acquire, keys: list) -> float:
+        started = time.perf_counter()
+        for key in keys:
+            try_acquire(key)
+        return (time.perf_counter() - started) / len(keys) * 1e6
+
+    for key_count in (100, 10_000, 100_000):
+        ips = [f"10.{number >> 16}.{(number >> 8) & 255}.{number & 255}" for number in range(key_count)]
+        keys = [random.choice(ips) for _ in range(REQUEST_COUNT)]
+        bucket_time = per_request_us(TokenBucketLimiter(LIMIT, LIMIT / WINDOW_SECONDS, 100_000).try_acquire, keys)
+        list_scan_time = per_request_us(list_scan_limiter(), keys)
+        print(f"IP {key_count:>7,}개, 요청 {REQUEST_COUNT:,}건: 토큰 버킷 {bucket_time:.2f} us/req, 목록 방식 {list_scan_time:.2f} us/req")
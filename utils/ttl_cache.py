@@ -0,0 +1,89 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+import utils.metrics
+
+
+class TTLCache:
+    """최대 개수(LRU) + 유효 시간(TTL) 제한이 있는 프로세스 내부 캐시
+
+    - 가득 차면 가장 오래 사용하지 않은 항목부터 삭제
+    - 유효 시간이 지난 항목은 조회할 때 삭제 (다른 워커의 변경은 유효 시간이 지나야 반영됨)
+    - 적중/실패/삭제 횟수와 항목 수를 cache_* 지표로 기록 (레이블 : 캐시 이름)
+    이벤트 루프 스레드에서만 사용하므로 잠금 없음
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # {키: (만료 시각, 값)} - 최근에 사용한 항목이 뒤쪽
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, is_current: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """캐시된 값 (없거나 만료되었으면 None)
+
+        is_current : 캐시된 값이 아직 유효한지 확인하는 함수 (False 이면 삭제 후 None, 예: 버전 비교)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            utils.metrics.cache_misses_total.inc(self.name)
+            return None
+
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            utils.metrics.cache_evictions_total.inc(self.name, "expired")
+            utils.metrics.cache_misses_total.inc(self.name)
+            self._update_size()
+            return None
+
+        if is_current is not None and not is_current(entry[1]):
+            del self._entries[key]
+            utils.metrics.cache_evictions_total.inc(self.name, "stale")
+            utils.metrics.cache_misses_total.inc(self.name)
+            self._update_size()
+            return None
+
+        self._entries.move_to_end(key)
+        utils.metrics.cache_hits_total.inc(self.name)
+        return entry[1]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """지표/사용 순서를 바꾸지 않고 값 확인 (없거나 만료되었으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def values(self) -> list:
+        """모든 값 (만료된 항목 포함, 지표/사용 순서 변경 없음)"""
+        return [value for _, value in self._entries.values()]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            utils.metrics.cache_evictions_total.inc(self.name, "capacity")
+        self._update_size()
+
+    def delete(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            utils.metrics.cache_evictions_total.inc(self.name, "invalidated")
+            self._update_size()
+
+    def delete_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """조건에 맞는 항목 모두 삭제 (전체 항목을 훑으므로 쓰기 요청에서만 사용)"""
+        keys = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            utils.metrics.cache_evictions_total.inc(self.name, "invalidated", amount=len(keys))
+            self._update_size()
+
+    def _update_size(self) -> None:
+        utils.metrics.cache_entries.set(len(self._entries), self.name)
@@ -0,0 +1,120 @@
+"""utils/validator 검증 함수 마이크로벤치마크
+
+실행 : python -m utils.validator.benchmark
+검증 함수마다 통과하는 입력 / 실패하는 입력의 호출당 시간(ns)과 초당 호출 수를 출력
+요청 본문은 json.loads + 필드별 검증(예전 방식) 과 validate_request_body(model_validate_json) 의 본문당 시간(us)을 비교
+"""
+import json
+import time
+import timeit
+from utils.cursor import encode_cursor
+from utils.validator import (
+    email_validator, password_validator, nickname_validator, title_validator, content_validator,
+    post_image_url_validator, profile_image_url_validator, user_id_validator, post_id_validator,
+    comment_id_validator, offset_validator, limit_validator, cursor_validator,
+)
+from utils.validator.request_body import SignupRequest, PostRequest
+from utils.validator.request_validator import validate_request_body
+from utils.profiler import profiled
+
+# (이름, 검증 함수, 통과하는 입력, 실패하는 입력)
+CASES = [
+    ("email", email_validator.validate_email, "user.name@example.com", "user.name@example"),
+    ("password", password_validator.validate_password, "Passw0rd!abc", "password1234"),
+    ("nickname", nickname_validator.validate_nickname, "startup", "start up"),
+    ("title", title_validator.validate_title, "게시글 제목입니다", "x" * 30),
+    ("content", content_validator.validate_content, "내용" * 250, ""),
+    ("post_image_url", post_image_url_validator.validate_post_image_url, "https://example.com/a.png", ""),
+    ("profile_image_url", profile_image_url_validator.validate_profile_image_url, "https://example.com/a.png", ""),
+    ("user_id", user_id_validator.validate_user_id, 1, -1),
+    ("post_id", post_id_validator.validate_post_id, 1, -1),
+    ("comment_id", comment_id_validator.validate_comment_id, 1, -1),
+    ("offset", offset_validator.validate_offset, 0, -1),
+    ("limit", limit_validator.validate_limit, 10, -1),
+    ("cursor", cursor_validator.validate_cursor, encode_cursor("2025-01-01T00:00:00", "10"), "not-a-cursor"),
+]
+
+
+@profiled
+def check_field(value, is_valid, required: bool = True) -> None:
+    """예전 필드별 검증(validate_email 등, @profiled 포함)과 같은 순서의 확인 (누락 -> 자료형 -> 형식)"""
+    if value is None:
+        if required:
+            raise ValueError("missing_required_field")
+        return
+    if not isinstance(value, str):
+        raise ValueError("invalid_parameter")
+    if not is_valid(value):
+        raise ValueError("invalid_format")
+
+
+def signup_with_json_loads(raw_body: bytes) -> None:
+    body = json.loads(raw_body)
+    check_field(body.get("email"), email_validator.validate_email)
+    check_field(body.get("password"), password_validator.validate_password)
+    check_field(body.get("nickname"), nickname_validator.validate_nickname)
+    check_field(body.get("profileImageUrl"), profile_image_url_validator.validate_profile_image_url, required=False)
+
+
+def post_with_json_loads(raw_body: bytes) -> None:
+    body = json.loads(raw_body)
+    check_field(body.get("title"), title_validator.validate_title)
+    check_field(body.get("content"), content_validator.validate_content)
+    check_field(body.get("postImageUrl"), post_image_url_validator.validate_post_image_url, required=False)
+
+
+# (이름, 요청 본문, json.loads + 필드별 검증, 모델)
+BODY_CASES = [
+    (
+        "signup body",
+        b'{"email":"user@example.com","password":"Passw0rd!","nickname":"nick",'
+        b'"profileImageUrl":"https://example.com/a.png"}',
+        signup_with_json_loads,
+        SignupRequest,
+    ),
+    (
+        "post body (500자)",
+        b'{"title":"hello world","content":"' + b"x" * 500 + b'","postImageUrl":"https://example.com/a.png"}',
+        post_with_json_loads,
+        PostRequest,
+    ),
+]
+BODY_ITERATIONS = 50_000
+
+
+def best_per_call(func) -> float:
+    """BODY_ITERATIONS 번 호출을 5회 반복한 것 중 가장 빠른 회차의 호출당 시간(초)"""
+    return min(timeit.repeat(func, number=BODY_ITERATIONS, repeat=5)) / BODY_ITERATIONS
+
+
+def measure(func, value, seconds: float = 0.5) -> float:
+    """호출당 시간(초) - seconds 동안 반복 호출한 평균"""
+    count = 0
+    batch = 1000
+    started = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            func(value)
+        count += batch
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return elapsed / count
+
+
+if __name__ == "__main__":
+    print(f"{'validator':<20} {'valid ns':>10} {'valid calls/s':>15} {'invalid ns':>11} {'invalid calls/s':>16}")
+    for name, func, valid, invalid in CASES:
+        assert func(valid) and not func(invalid), name
+        valid_time = measure(func, valid)
+        invalid_time = measure(func, invalid)
+        print(
+            f"{name:<20} {valid_time * 1e9:10.0f} {1 / valid_time:15,.0f} "
+            f"{invalid_time * 1e9:11.0f} {1 / invalid_time:16,.0f}"
+        )
+
+    print()
+    print(f"{'request body':<20} {'json.loads + 필드별 us':>22} {'model_validate_json us':>23}")
+    for name, raw_body, with_json_loads, model in BODY_CASES:
+        json_loads_time = best_per_call(lambda: with_json_loads(raw_body))
+        model_time = best_per_call(lambda: validate_request_body(model, raw_body))
+        print(f"{name:<20} {json_loads_time * 1e6:22.2f} {model_time * 1e6:23.2f}")
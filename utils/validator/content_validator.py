@@ -4,8 +4,8 @@ from utils import constants
 # 게시글 내용 유효성 검사 함수
 def validate_content(content: str) -> bool:
 
-    # 길이 제한 검사 (최소 1자)
-    if len(content) < constants.CONTENT_MIN_LENGTH:
+    # 길이 제한 검사 (최소 1자, 최대 CONTENT_MAX_LENGTH 자)
+    if len(content) < constants.CONTENT_MIN_LENGTH or len(content) > constants.CONTENT_MAX_LENGTH:
         return False
 
     # 모든 검사를 통과하면 유효한 내용
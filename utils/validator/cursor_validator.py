@@ -0,0 +1,17 @@
+from utils import constants
+from utils.cursor import decode_cursor
+
+
+# 커서 유효성 검사 함수
+def validate_cursor(cursor: str) -> bool:
+
+    # 디코딩 가능한 형식인지 검사
+    decoded = decode_cursor(cursor)
+    if decoded is None:
+        return False
+
+    # id 범위 체크 (음수 또는 SQLite 정수 범위 초과)
+    if decoded[1] < 0 or decoded[1] > constants.SQLITE_INTEGER_MAX:
+        return False
+
+    return True
@@ -1,6 +1,9 @@
 import re
 from utils import constants
 
+# 모듈 로드 시 1번만 컴파일
+_EMAIL_REGEX = re.compile(constants.EMAIL_PATTERN)
+
 
 # 이메일 유효성 검사 함수
 def validate_email(email: str) -> bool:
@@ -15,8 +18,8 @@ def validate_email(email: str) -> bool:
         return False
 
     # 이메일 형식 필요
-    if not re.match(constants.EMAIL_PATTERN, email):
+    if not _EMAIL_REGEX.match(email):
         return False
 
     # 모든 검사를 통과하면 유효한 이메일
-    return True
\ No newline at end of file
+    return True
@@ -1,6 +1,13 @@
 import re
 from utils import constants
 
+# PASSWORD_PATTERN 의 문자 클래스(대문자, 소문자, 숫자, 특수문자)별 문자 집합 (모듈 로드 시 1번만 계산)
+# 패턴이 모두 ASCII 문자 클래스이므로 ASCII 범위만 확인
+_PASSWORD_CHAR_CLASSES = tuple(
+    frozenset(chr(code) for code in range(128) if re.fullmatch(pattern, chr(code)))
+    for pattern in constants.PASSWORD_PATTERN
+)
+
 
 # 비밀번호 유효성 검사 함수
 def validate_password(password: str) -> bool:
@@ -8,18 +15,21 @@ def validate_password(password: str) -> bool:
     if password is None:
         return False
 
-    # 기획에는 없지만 공백 없어야
-    if " " in password:
-        return False
-
     # 길이 제한 검사
     if len(password) < constants.PASSWORD_MIN_LENGTH or len(password) > constants.PASSWORD_MAX_LENGTH:
         return False
 
+    # 비밀번호를 1번만 훑어서 문자 집합을 만든 뒤 검사 (패턴마다 re.search 로 다시 훑지 않음)
+    chars = set(password)
+
+    # 기획에는 없지만 공백 없어야
+    if " " in chars:
+        return False
+
     # 대문자, 소문자, 숫자, 특수문자 각각 1개 이상 필요
-    for pattern in constants.PASSWORD_PATTERN:
-        if re.search(pattern, password) is None:
+    for char_class in _PASSWORD_CHAR_CLASSES:
+        if chars.isdisjoint(char_class):
             return False
 
     # 모든 검사를 통과하면 유효한 비밀번호
-    return True
\ No newline at end of file
+    return True
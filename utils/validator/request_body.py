@@ -0,0 +1,77 @@
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, StrictStr
+from pydantic_core import PydanticCustomError
+from utils.validator import email_validator, password_validator, nickname_validator, title_validator, content_validator, post_image_url_validator, profile_image_url_validator
+
+
+def _check_format(field_name: str, is_valid):
+    """형식 검사 (기존 *_validator 함수 재사용) - 실패 시 422 invalid_<field_name>_format 으로 변환됨"""
+    def check(value: str) -> str:
+        if not is_valid(value):
+            raise PydanticCustomError("invalid_format", "invalid {field_name} format", {"field_name": field_name})
+        return value
+    return AfterValidator(check)
+
+
+# 문자열만 허용 (숫자 등을 문자열로 바꾸지 않음 -> 400 invalid_parameter)
+Email = Annotated[StrictStr, _check_format("email", email_validator.validate_email)]
+Password = Annotated[StrictStr, _check_format("password", password_validator.validate_password)]
+Nickname = Annotated[StrictStr, _check_format("nickname", nickname_validator.validate_nickname)]
+ProfileImageUrl = Annotated[StrictStr, _check_format("profile_image_url", profile_image_url_validator.validate_profile_image_url)]
+Title = Annotated[StrictStr, _check_format("title", title_validator.validate_title)]
+Content = Annotated[StrictStr, _check_format("content", content_validator.validate_content)]
+PostImageUrl = Annotated[StrictStr, _check_format("post_image_url", post_image_url_validator.validate_post_image_url)]
+
+
+class RequestBody(BaseModel):
+    """요청 본문 모델 공통 설정 (정의되지 않은 필드는 무시)
+
+    필드는 기존 검증 순서대로 선언 (오류가 여러 개면 첫 번째 필드의 오류로 응답)
+    """
+    model_config = ConfigDict(extra="ignore")
+
+
+# 회원가입
+class SignupRequest(RequestBody):
+    email: Email
+    password: Password
+    nickname: Nickname
+    profileImageUrl: Optional[ProfileImageUrl] = None
+
+
+# 로그인
+class LoginRequest(RequestBody):
+    email: Email
+    password: Password
+
+
+# 비밀번호 수정
+class PasswordRequest(RequestBody):
+    password: Password
+
+
+# 닉네임 수정, 닉네임 중복 확인
+class NicknameRequest(RequestBody):
+    nickname: Nickname
+
+
+# 프로필 이미지 URL 수정
+class ProfileImageUrlRequest(RequestBody):
+    profileImageUrl: Optional[ProfileImageUrl] = None
+
+
+# 이메일 중복 확인
+class EmailRequest(RequestBody):
+    email: Email
+
+
+# 게시글 작성/수정
+class PostRequest(RequestBody):
+    title: Title
+    content: Content
+    postImageUrl: Optional[PostImageUrl] = None
+
+
+# 댓글 작성/수정
+class CommentRequest(RequestBody):
+    content: Content
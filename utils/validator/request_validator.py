@@ -1,38 +1,28 @@
 from fastapi import HTTPException
+from pydantic import ValidationError
+from typing import Optional, Type, TypeVar
 from utils.response_schema import response_schema
 import utils.error_message
-from utils.validator import email_validator, password_validator, nickname_validator, title_validator, content_validator, post_image_url_validator, profile_image_url_validator, user_id_validator, post_id_validator, comment_id_validator, offset_validator, limit_validator
+from utils.validator import user_id_validator, post_id_validator, comment_id_validator, offset_validator, limit_validator, cursor_validator
+from utils.validator.request_body import RequestBody, CommentRequest
+from utils.cursor import decode_cursor
+from utils.profiler import profiled
 
+RequestBodyT = TypeVar("RequestBodyT", bound=RequestBody)
 
-def validate_email(email: str) -> str:
-    if email is None: # 400 - 이메일 누락
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(email, str): # 400 - 이메일 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not email_validator.validate_email(email): # 422 - 이메일 형식 잘못됨
-        raise HTTPException(
-            status_code=422,
-            detail=response_schema(
-                message=utils.error_message.invalid_input_format("email"),
-                data=None,
-            ),
-        )
-    return email
 
-def validate_password(password: str) -> str:
-    if password is None: # 400 - 비밀번호 누락
+@profiled
+def validate_request_body(model: Type[RequestBodyT], raw_body: bytes) -> RequestBodyT:
+    """요청 본문(JSON 바이트)을 파싱과 동시에 검증 (pydantic 모델 1번 통과)
+
+    오류가 여러 개면 모델 필드 순서상 첫 번째 오류로 응답 (기존 필드별 검증과 같은 순서/상태 코드)
+    """
+    try:
+        return model.model_validate_json(raw_body)
+    except ValidationError as exc:
+        error = exc.errors(include_url=False)[0]
+
+    if error["type"] == "missing" or (error["type"] == "string_type" and error["input"] is None): # 400 - 필수 필드 누락
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -40,24 +30,24 @@ def validate_password(password: str) -> str:
                 data=None,
             ),
         )
-    if not isinstance(password, str): # 400 - 비밀번호 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not password_validator.validate_password(password): # 422 - 비밀번호 형식 잘못됨
+    if error["type"] == "invalid_format": # 422 - 필드 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("password"),
+                message=utils.error_message.invalid_input_format(error["ctx"]["field_name"]),
                 data=None,
             ),
         )
-    return password
+    # 400 - 자료형 안맞음 (JSON 문법 오류, 객체가 아닌 본문 포함)
+    raise HTTPException(
+        status_code=400,
+        detail=response_schema(
+            message=utils.error_message.invalid_input("parameter"),
+            data=None,
+        ),
+    )
 
+@profiled
 def validate_user_id(user_id: int) -> int:
     if user_id is None: # 400 - user_id 누락
         raise HTTPException(
@@ -85,35 +75,9 @@ def validate_user_id(user_id: int) -> int:
         )
     return user_id
 
-def validate_nickname(nickname: str) -> str:
-    if nickname is None: # 400 - 닉네임 누락
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(nickname, str): # 400 - 닉네임 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not nickname_validator.validate_nickname(nickname): # 422 - 닉네임 형식 잘못됨
-        raise HTTPException(
-            status_code=422,
-            detail=response_schema(
-                message=utils.error_message.invalid_input_format("nickname"),
-                data=None,
-            ),
-        )
-    return nickname
-
-def validate_profile_image_url(profile_image_url: str) -> str:
-    if profile_image_url is None: # 400 - 프로필 이미지 URL 누락
+@profiled
+def validate_post_id(post_id: int) -> int:
+    if post_id is None: # 400 - post_id 누락
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -121,7 +85,7 @@ def validate_profile_image_url(profile_image_url: str) -> str:
                 data=None,
             ),
         )
-    if not isinstance(profile_image_url, str): # 400 - 프로필 이미지 URL 자료형 안맞음
+    if not isinstance(post_id, int): # 400 - post_id 자료형 안맞음
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -129,18 +93,19 @@ def validate_profile_image_url(profile_image_url: str) -> str:
                 data=None,
             ),
         )
-    if not profile_image_url_validator.validate_profile_image_url(profile_image_url): # 422 - 프로필 이미지 URL 형식 잘못됨
+    if not post_id_validator.validate_post_id(post_id): # 422 - post_id 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("profile_image_url"),
+                message=utils.error_message.invalid_input_format("post_id"),
                 data=None,
             ),
         )
-    return profile_image_url
+    return post_id
 
-def validate_title(title: str) -> str:
-    if title is None: # 400 - 제목 누락
+@profiled
+def validate_comment_id(comment_id: int) -> int:
+    if comment_id is None: # 400 - comment_id 누락
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -148,7 +113,7 @@ def validate_title(title: str) -> str:
                 data=None,
             ),
         )
-    if not isinstance(title, str): # 400 - 제목 자료형 안맞음
+    if not isinstance(comment_id, int): # 400 - comment_id 자료형 안맞음
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -156,26 +121,19 @@ def validate_title(title: str) -> str:
                 data=None,
             ),
         )
-    if not title_validator.validate_title(title): # 422 - 제목 형식 잘못됨 (길이 제한)
+    if not comment_id_validator.validate_comment_id(comment_id): # 422 - comment_id 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("title"),
+                message=utils.error_message.invalid_input_format("comment_id"),
                 data=None,
             ),
         )
-    return title
+    return comment_id
 
-def validate_content(content: str) -> str:
-    if content is None: # 400 - 내용 누락
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(content, str): # 400 - 내용 자료형 안맞음
+@profiled
+def validate_offset(offset: int) -> int:
+    if not isinstance(offset, int): # 400 - offset 자료형 안맞음
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -183,26 +141,19 @@ def validate_content(content: str) -> str:
                 data=None,
             ),
         )
-    if not content_validator.validate_content(content): # 422 - 내용 형식 잘못됨 (길이 제한)
+    if not offset_validator.validate_offset(offset): # 422 - offset 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("content"),
+                message=utils.error_message.invalid_input_format("offset"),
                 data=None,
             ),
         )
-    return content
+    return offset
 
-def validate_post_image_url(post_image_url: str) -> str:
-    if post_image_url is None: # 400 - 이미지 URL 누락
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(post_image_url, str): # 400 - 이미지 URL 자료형 안맞음
+@profiled
+def validate_limit(limit: int) -> int:
+    if not isinstance(limit, int): # 400 - limit 자료형 안맞음
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -210,26 +161,19 @@ def validate_post_image_url(post_image_url: str) -> str:
                 data=None,
             ),
         )
-    if not post_image_url_validator.validate_post_image_url(post_image_url): # 422 - 이미지 URL 형식 잘못됨
+    if not limit_validator.validate_limit(limit): # 422 - limit 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("post_image_url"),
+                message=utils.error_message.invalid_input_format("limit"),
                 data=None,
             ),
         )
-    return post_image_url
+    return limit
 
-def validate_post_id(post_id: int) -> int:
-    if post_id is None: # 400 - post_id 누락
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(post_id, int): # 400 - post_id 자료형 안맞음
+@profiled
+def validate_cursor(cursor: str) -> tuple[str, int]:
+    if not isinstance(cursor, str): # 400 - cursor 자료형 안맞음
         raise HTTPException(
             status_code=400,
             detail=response_schema(
@@ -237,104 +181,65 @@ def validate_post_id(post_id: int) -> int:
                 data=None,
             ),
         )
-    if not post_id_validator.validate_post_id(post_id): # 422 - post_id 형식 잘못됨
+    if not cursor_validator.validate_cursor(cursor): # 422 - cursor 형식 잘못됨
         raise HTTPException(
             status_code=422,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("post_id"),
+                message=utils.error_message.invalid_input_format("cursor"),
                 data=None,
             ),
         )
-    return post_id
+    return decode_cursor(cursor)
 
-def validate_comment_id(comment_id: int) -> int:
-    if comment_id is None: # 400 - comment_id 누락
+@profiled
+def validate_email_not_duplicate(user: Optional[dict]) -> None:
+    if user is not None: # 409 - 이메일 중복
         raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.missing_required_field,
-                data=None,
-            ),
-        )
-    if not isinstance(comment_id, int): # 400 - comment_id 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not comment_id_validator.validate_comment_id(comment_id): # 422 - comment_id 형식 잘못됨
-        raise HTTPException(
-            status_code=422,
+            status_code=409,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("comment_id"),
+                message=utils.error_message.duplicate_email,
                 data=None,
             ),
         )
-    return comment_id
 
-def validate_offset(offset: int) -> int:
-    if not isinstance(offset, int): # 400 - offset 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not offset_validator.validate_offset(offset): # 422 - offset 형식 잘못됨
+@profiled
+def validate_nickname_not_duplicate(user: Optional[dict], current_user_id: Optional[str] = None) -> None:
+    # 본인이 이미 쓰고 있는 닉네임(대소문자만 바꾸는 경우 등)은 중복이 아님
+    if user is not None and user["userId"] != current_user_id: # 409 - 닉네임 중복
         raise HTTPException(
-            status_code=422,
+            status_code=409,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("offset"),
+                message=utils.error_message.duplicate_nickname,
                 data=None,
             ),
         )
-    return offset
 
-def validate_limit(limit: int) -> int:
-    if not isinstance(limit, int): # 400 - limit 자료형 안맞음
-        raise HTTPException(
-            status_code=400,
-            detail=response_schema(
-                message=utils.error_message.invalid_input("parameter"),
-                data=None,
-            ),
-        )
-    if not limit_validator.validate_limit(limit): # 422 - limit 형식 잘못됨
+@profiled
+def check_user_created(user: Optional[dict]) -> dict:
+    # 가입 실패 후 다시 확인했을 때 중복이 보이지 않는 경우 (그 사이 겹친 사용자가 탈퇴/변경)
+    if user is None: # 409 - 이메일/닉네임 중복
         raise HTTPException(
-            status_code=422,
+            status_code=409,
             detail=response_schema(
-                message=utils.error_message.invalid_input_format("limit"),
+                message=utils.error_message.is_already_in_use("email_or_nickname"),
                 data=None,
             ),
         )
-    return limit
+    return user
 
-def validate_email_not_duplicate(email: str, mock_users: dict) -> None:
-    if email in mock_users: # 409 - 이메일 중복
+@profiled
+def check_nickname_updated(updated: bool) -> None:
+    if not updated: # 409 - 닉네임 중복 (중복 확인 이후 다른 요청이 같은 닉네임을 먼저 사용)
         raise HTTPException(
             status_code=409,
             detail=response_schema(
-                message=utils.error_message.duplicate_email,
+                message=utils.error_message.duplicate_nickname,
                 data=None,
             ),
         )
 
-def validate_nickname_not_duplicate(nickname: str, mock_users: dict) -> None:
-    for user in mock_users.values():
-        if user.get("userNickname") == nickname: # 409 - 닉네임 중복
-            raise HTTPException(
-                status_code=409,
-                detail=response_schema(
-                    message=utils.error_message.duplicate_nickname,
-                    data=None,
-                ),
-            )
-
-def check_login_credentials(email: str, password: str, mock_users: dict, verify_password_func) -> dict:
-    user = mock_users.get(email)
+@profiled
+async def check_login_credentials(user: Optional[dict], password: str, verify_password_func) -> dict:
     if not user: # 401 - 사용자 없음
         raise HTTPException(
             status_code=401,
@@ -343,7 +248,7 @@ def check_login_credentials(email: str, password: str, mock_users: dict, verify_
                 data=None,
             ),
         )
-    if not verify_password_func(password, user["password"]): # 401 - 비밀번호 틀림
+    if not await verify_password_func(password, user["password"]): # 401 - 비밀번호 틀림
         raise HTTPException(
             status_code=401,
             detail=response_schema(
@@ -353,6 +258,7 @@ def check_login_credentials(email: str, password: str, mock_users: dict, verify_
         )
     return user
 
+@profiled
 def check_user_permission(user_id: int, current_user: dict) -> None:
     current_user_id = current_user["user_data"]["userId"]
     if str(user_id) != current_user_id: # 403 - 본인이 아님
@@ -364,8 +270,8 @@ def check_user_permission(user_id: int, current_user: dict) -> None:
             ),
         )
 
-def check_user_exists(email: str, mock_users: dict) -> dict:
-    user = mock_users.get(email)
+@profiled
+def check_user_exists(user: Optional[dict]) -> dict:
     if not user: # 404 - 사용자 없음
         raise HTTPException(
             status_code=404,
@@ -376,22 +282,97 @@ def check_user_exists(email: str, mock_users: dict) -> dict:
         )
     return user
 
-def validate_comment_create_request(post_id: int, body: dict) -> tuple[int, str]:
+@profiled
+def validate_comment_create_request(post_id: int, raw_body: bytes) -> tuple[int, str]:
     """댓글 작성 요청 유효성 검증"""
     validated_post_id = validate_post_id(post_id)
-    content = validate_content(body.get("content"))
+    content = validate_request_body(CommentRequest, raw_body).content
     return validated_post_id, content
 
-def validate_comment_list_params(post_id: int, offset: int, limit: int) -> tuple[int, int, int]:
+@profiled
+def validate_comment_list_params(
+    post_id: int, offset: int, limit: int, cursor: Optional[str] = None
+) -> tuple[int, int, int, Optional[tuple[str, int]]]:
     """댓글 목록 조회 파라미터 유효성 검증"""
     validated_post_id = validate_post_id(post_id)
     validated_offset = validate_offset(offset)
     validated_limit = validate_limit(limit)
-    return validated_post_id, validated_offset, validated_limit
+    validated_cursor = validate_cursor(cursor) if cursor is not None else None
+    return validated_post_id, validated_offset, validated_limit, validated_cursor
 
+@profiled
 def validate_comment_modify_params(comment_id: int, post_id: int) -> tuple[int, int]:
     """댓글 수정/삭제 파라미터 유효성 검증"""
     validated_comment_id = validate_comment_id(comment_id)
     validated_post_id = validate_post_id(post_id)
     return validated_comment_id, validated_post_id
 
+@profiled
+def check_post_exists(post: Optional[dict]) -> dict:
+    if not post: # 404 - 게시글 없음
+        raise HTTPException(
+            status_code=404,
+            detail=response_schema(
+                message=utils.error_message.not_found("post"),
+                data=None,
+            ),
+        )
+    return post
+
+@profiled
+def check_post_author(post: dict, current_user: dict, action: str) -> None:
+    current_user_id = current_user["user_data"]["userId"]
+    if post["userId"] != current_user_id: # 403 - 본인이 작성한 게시글이 아님
+        raise HTTPException(
+            status_code=403,
+            detail=response_schema(
+                message=utils.error_message.permission_denied_to(action),
+                data=None,
+            ),
+        )
+
+@profiled
+def check_not_liked(liked: bool) -> None:
+    if liked: # 403 - 이미 좋아요를 누름
+        raise HTTPException(
+            status_code=403,
+            detail=response_schema(
+                message=utils.error_message.already_liked,
+                data=None,
+            ),
+        )
+
+@profiled
+def check_liked(liked: bool) -> None:
+    if not liked: # 403 - 좋아요를 누르지 않음
+        raise HTTPException(
+            status_code=403,
+            detail=response_schema(
+                message=utils.error_message.not_liked,
+                data=None,
+            ),
+        )
+
+@profiled
+def check_comment_exists(comment: Optional[dict], post_id: int) -> dict:
+    if not comment or comment["postId"] != str(post_id): # 404 - 댓글 없음 (다른 게시글의 댓글 포함)
+        raise HTTPException(
+            status_code=404,
+            detail=response_schema(
+                message=utils.error_message.not_found("comment"),
+                data=None,
+            ),
+        )
+    return comment
+
+@profiled
+def check_comment_author(comment: dict, current_user: dict, action: str) -> None:
+    current_user_id = current_user["user_data"]["userId"]
+    if comment["userId"] != current_user_id: # 403 - 본인이 작성한 댓글이 아님
+        raise HTTPException(
+            status_code=403,
+            detail=response_schema(
+                message=utils.error_message.permission_denied_to(action),
+                data=None,
+            ),
+        )